@@ -0,0 +1,137 @@
+import streamlit as st
+import pandas as pd
+import time
+
+from vintervu.db import fetch_metrics, llm_usage_by_day, llm_usage_by_interview
+from vintervu.metrics import recorder, stage_summary
+from vintervu.ui import is_admin
+from vintervu.usage import DAILY_TOKEN_BUDGET, calls
+
+WINDOWS = {"Last hour": 3600, "Last 24 hours": 86400, "Last 7 days": 7 * 86400}
+
+@st.cache_data(ttl=30, show_spinner=False)
+def load_summary(seconds):
+    """Per-stage percentiles over the last ``seconds``, recomputed at most every 30s"""
+    return stage_summary(fetch_metrics(time.time() - seconds))
+
+@st.cache_data(ttl=30, show_spinner=False)
+def load_usage(days):
+    return llm_usage_by_day(days), llm_usage_by_interview(days)
+
+st.title("⏱️ Stage Latency")
+
+if not is_admin():
+    st.error("This page is only available to administrators.")
+    st.stop()
+
+col1, col2 = st.columns([3, 1])
+with col1:
+    window = st.selectbox("Window", list(WINDOWS), index=1)
+with col2:
+    st.write("")
+    if st.button("🔄 Refresh", use_container_width=True):
+        # Include what this server has measured since its last flush
+        try:
+            recorder.flush()
+            calls.flush()
+        except Exception as e:
+            st.warning(f"⚠️ Could not flush metrics: {str(e)}")
+        load_summary.clear()
+        load_usage.clear()
+
+try:
+    summary = load_summary(WINDOWS[window])
+except Exception as e:
+    st.error(f"Error reading metrics: {str(e)}")
+    summary = []
+
+st.caption(f"Timings are flushed from each server every few seconds. "
+           f"This server has {len(recorder.buffer)} unflushed and {recorder.dropped} dropped records.")
+
+if not summary:
+    st.info("No timings recorded in this window yet.")
+else:
+    df = pd.DataFrame(summary)
+    df['failure_rate'] = df['failures'] / df['calls'] * 100
+    st.dataframe(
+        df[['stage', 'calls', 'failure_rate', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms', 'total_s',
+            'mean_in_kb', 'mean_out_kb']],
+        column_config={
+            'stage': "Stage",
+            'calls': "Calls",
+            'failure_rate': st.column_config.NumberColumn("Failed", format="%.1f%%"),
+            'p50_ms': st.column_config.NumberColumn("p50 (ms)", format="%.0f"),
+            'p95_ms': st.column_config.NumberColumn("p95 (ms)", format="%.0f"),
+            'p99_ms': st.column_config.NumberColumn("p99 (ms)", format="%.0f"),
+            'max_ms': st.column_config.NumberColumn("Max (ms)", format="%.0f"),
+            'total_s': st.column_config.NumberColumn("Total (s)", format="%.1f"),
+            'mean_in_kb': st.column_config.NumberColumn("Avg in (KB)", format="%.1f"),
+            'mean_out_kb': st.column_config.NumberColumn("Avg out (KB)", format="%.1f"),
+        },
+        hide_index=True,
+        use_container_width=True,
+    )
+
+    st.subheader("Where the time goes")
+    st.bar_chart(df.set_index('stage')['total_s'], horizontal=True, x_label="Total seconds", y_label="")
+
+st.header("💰 Gemini Usage")
+days = max(1, WINDOWS[window] // 86400)
+try:
+    usage_rows, interview_rows = load_usage(days)
+except Exception as e:
+    st.error(f"Error reading Gemini usage: {str(e)}")
+    usage_rows, interview_rows = [], []
+
+if DAILY_TOKEN_BUDGET:
+    st.caption(f"Daily budget: {DAILY_TOKEN_BUDGET:,} tokens per user. Over it, questions come from the "
+               f"local bank and each answer is evaluated in one request.")
+
+if not usage_rows:
+    st.info(f"No Gemini calls recorded in the last {days} day(s).")
+    st.stop()
+
+usage_df = pd.DataFrame(usage_rows)
+usage_df['tokens'] = usage_df['prompt_tokens'] + usage_df['output_tokens']
+col1, col2, col3 = st.columns(3)
+col1.metric("Calls", f"{usage_df['calls'].sum():,}", f"{usage_df['cached_calls'].sum():,} cached",
+            delta_color="off")
+col2.metric("Tokens", f"{usage_df['tokens'].sum():,}")
+col3.metric("Cost", f"${usage_df['cost_usd'].sum():,.4f}")
+
+st.subheader("Per user")
+per_user = (usage_df.groupby('email')[['calls', 'tokens', 'cost_usd', 'seconds']].sum()
+            .sort_values('cost_usd', ascending=False).reset_index())
+st.dataframe(
+    per_user,
+    column_config={
+        'email': "User",
+        'calls': "Calls",
+        'tokens': st.column_config.NumberColumn("Tokens", format="%d"),
+        'cost_usd': st.column_config.NumberColumn("Cost (USD)", format="$%.4f"),
+        'seconds': st.column_config.NumberColumn("Time (s)", format="%.1f"),
+    },
+    hide_index=True,
+    use_container_width=True,
+)
+
+st.subheader("Per function")
+per_function = usage_df.groupby('function')[['calls', 'prompt_tokens', 'output_tokens', 'cost_usd']].sum()
+st.bar_chart(per_function['cost_usd'], horizontal=True, x_label="Cost (USD)", y_label="")
+
+st.subheader("Most expensive interviews")
+st.dataframe(
+    pd.DataFrame(interview_rows),
+    column_config={
+        'interview_id': "Interview",
+        'email': "User",
+        'started': "Started (UTC)",
+        'calls': "Calls",
+        'prompt_tokens': st.column_config.NumberColumn("Prompt tokens", format="%d"),
+        'output_tokens': st.column_config.NumberColumn("Output tokens", format="%d"),
+        'cost_usd': st.column_config.NumberColumn("Cost (USD)", format="$%.4f"),
+        'seconds': st.column_config.NumberColumn("Time (s)", format="%.1f"),
+    },
+    hide_index=True,
+    use_container_width=True,
+)
@@ -0,0 +1,117 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from vintervu.db import fetch_feedback, history_version
+from vintervu.ui import feedback_report
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def load_dashboard(email, version):
+    """Feedback history, trend figure and history table for one user
+
+    ``version`` is the user's history version, so only a newly saved
+    interview rebuilds them; other reruns of this page are served from cache.
+    """
+    feedback_history = fetch_feedback(email)
+    if not feedback_history:
+        return feedback_history, None, None
+    
+    chart_data = []
+    for i, feedback in enumerate(reversed(feedback_history)):
+        chart_data.append({
+            'Interview': f'Interview {i+1}',
+            'Score': feedback['percentage'],
+            'Date': feedback['timestamp'][:10]
+        })
+    
+    df = pd.DataFrame(chart_data)
+    fig = px.line(df, x='Interview', y='Score', 
+                 title='Technical Interview Performance Trend',
+                 markers=True, line_shape='spline')
+    fig.update_layout(yaxis_range=[0, 100])
+    fig.update_traces(line_color='#667eea', marker_color='#764ba2')
+    
+    summary_data = []
+    for i, feedback in enumerate(feedback_history):
+        summary_data.append({
+            'Interview #': len(feedback_history) - i,
+            'Score': f"{feedback['total_score']}/{feedback['max_score']}",
+            'Percentage': f"{feedback['percentage']:.1f}%",
+            'Questions': feedback['max_score'] // 10,
+            'Date': feedback['timestamp'][:19].replace('T', ' ')
+        })
+    
+    summary_df = pd.DataFrame(summary_data)
+    return feedback_history, fig, summary_df
+
+st.title("📊 Your Interview Dashboard")
+
+email = st.session_state.user_email
+try:
+    feedback_history, fig, summary_df = load_dashboard(email, history_version(email))
+except Exception as e:
+    st.error(f"Error fetching feedback: {str(e)}")
+    feedback_history = []
+
+if feedback_history:
+    latest_feedback = feedback_history[0]
+    avg_score = sum(f['percentage'] for f in feedback_history) / len(feedback_history)
+    total_interviews = len(feedback_history)
+
+    # Summary metrics
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("🎯 Latest Score", f"{latest_feedback['percentage']:.1f}%")
+    with col2:
+        st.metric("📈 Average Score", f"{avg_score:.1f}%")
+    with col3:
+        st.metric("🎤 Total Interviews", total_interviews)
+    with col4:
+        improvement = 0
+        if len(feedback_history) > 1:
+            improvement = latest_feedback['percentage'] - feedback_history[1]['percentage']
+        st.metric("📊 Improvement", f"{improvement:+.1f}%", delta=improvement)
+
+    # Performance chart
+    st.subheader("📈 Performance Over Time")
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Skills analysis from latest interview
+    if 'feedback_data' in latest_feedback and latest_feedback['feedback_data']:
+        feedback_data = latest_feedback['feedback_data']
+        if 'skills' in feedback_data and feedback_data['skills']:
+            st.subheader("🛠️ Skills Analysis from Latest Interview")
+            skills = feedback_data['skills']
+            st.markdown(f"**Evaluated Skills:** {', '.join(skills[:10])}")
+            if len(skills) > 10:
+                st.markdown(f"*... and {len(skills)-10} more skills*")
+
+    # Interview history table
+    st.subheader("📋 Interview History")
+    st.dataframe(summary_df, use_container_width=True)
+
+    # Enhanced detailed feedback section
+    if st.checkbox("📝 Show Comprehensive Feedback Analysis for Latest Interview"):
+        if 'feedback_data' in latest_feedback and latest_feedback['feedback_data']:
+            feedback_data = latest_feedback['feedback_data']
+            feedback_items = feedback_data.get('feedback', [])
+
+            if feedback_items:
+                feedback_report(feedback_items, key="dashboard_report")
+else:
+    st.info("No interview history found. Complete a technical interview to see your dashboard!")
+    st.markdown("""
+    ### 🚀 Get Started with Enhanced Technical Interviews
+    1. Test your voice setup in the **🎤 Voice Test** section
+    2. Upload your resume in the **📄 Resume Upload** section
+    3. Complete a technical interview in the **💬 Interview** section  
+    4. Return here to view your comprehensive performance analytics
+
+    ### ✨ Enhanced Features
+    - 🎤 **Advanced Voice Input**: Enhanced speech recognition with detailed troubleshooting
+    - 🔊 **Question Audio**: Questions are read aloud for natural interview experience
+    - 🧠 **Multi-Dimensional Feedback**: Comprehensive analysis across 7 different aspects
+    - 🛠️ **Skills-Based Questions**: Technical questions tailored to your specific resume
+    - 🚀 **Project Deep-Dive**: Questions about your actual projects and implementations
+    - 📊 **Enhanced Analytics**: Detailed performance insights and improvement tracking
+    """)
@@ -0,0 +1,52 @@
+import streamlit as st
+
+from vintervu.ui import resume_offer
+
+st.markdown("""
+<div class="main-header">
+    <h1>🤖 VIntervu - AI Interview Bot</h1>
+    <p style="font-size: 1.2rem; margin-top: 1rem;">Practice to Perfection, Speak with Direction ✨</p>
+</div>
+""", unsafe_allow_html=True)
+
+resume_offer()
+
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    st.markdown("""
+    <div class="interview-card">
+        <h3>🎯 AI-Powered Questions</h3>
+        <p>Get personalized interview questions based on your resume skills and projects using advanced AI technology.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+with col2:
+    st.markdown("""
+    <div class="interview-card">
+        <h3>🎤 Voice Input & Audio</h3>
+        <p>Answer questions using voice input and listen to questions being read aloud for natural conversation flow.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+with col3:
+    st.markdown("""
+    <div class="interview-card">
+        <h3>📊 Comprehensive Feedback</h3>
+        <p>Receive detailed, multi-dimensional feedback on your technical responses with actionable improvement suggestions.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+st.subheader("🚀 Enhanced Features")
+st.markdown("""
+- 🎤 **Advanced Voice Input**: Enhanced speech recognition with better error handling
+- 🔊 **Text-to-Speech**: Questions are read aloud for natural interview experience
+- 🧠 **Detailed AI Feedback**: Comprehensive feedback across multiple dimensions
+- 🧪 **Voice Testing**: Test your microphone without needing API key
+- 🔧 **Technical Deep-Dive**: Questions tailored to your specific skills and projects
+- 💡 **Smart Follow-ups**: AI generates relevant follow-up questions based on your answers
+- 📈 **Enhanced Analytics**: Detailed performance tracking with technical insights
+""")
+
+if not st.session_state.logged_in:
+    st.info("Please login or signup to access all features!")
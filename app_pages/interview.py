@@ -0,0 +1,219 @@
+import streamlit as st
+import time
+
+from vintervu.interview import ASKING, COMPLETE, EVALUATING, MAX_ANSWER_CHARS, PREPARING
+from vintervu.llm import (
+    generate_technical_questions_enhanced, generate_project_based_questions, generate_dynamic_followup,
+    evaluate_response_enhanced
+)
+from vintervu.ui import (
+    browser_voice_input, feedback_report, flash, get_speech_cache, new_interview, save_feedback, speak_question,
+    start_voice_capture, voice_capture_notice, voice_capture_status
+)
+
+st.title("🎤 AI Technical Interview Session")
+
+interview = st.session_state.interview
+
+# Check if interview is set up
+if not interview.ready:
+    st.warning("⚠️ Please upload your resume first to start the interview.")
+    if st.button("📄 Go to Resume Upload"):
+        st.switch_page("app_pages/resume_upload.py")
+    st.stop()
+
+if not interview.api_key and interview.state != COMPLETE:
+    # Resumed from a checkpoint or by another server; API keys are never stored
+    api_key = st.text_input("🔑 Enter Gemini API Key to continue your interview", type="password",
+                            help="Get your API key from https://makersuite.google.com/app/apikey")
+    if not api_key:
+        st.stop()
+    interview.api_key = api_key
+
+api_key = interview.api_key
+
+def evaluate_answer():
+    """Evaluate the submitted answer and move on to the next question"""
+    question = interview.current_question
+    response = interview.pending_response
+    with st.spinner("🔄 Evaluating your technical response..."):
+        started = time.perf_counter()
+        evaluation = evaluate_response_enhanced(question, response, api_key)
+        # Logged with the answer, for vintervu.replay
+        timings = {'evaluate': time.perf_counter() - started}
+        
+        # Recording of a voice answer and what the recognizer made of it, kept
+        # only if the answer is that transcript and was not edited or retyped
+        voice_audio = st.session_state.pop('voice_response_audio', {})
+        if response != voice_audio.get('transcript', '')[:MAX_ANSWER_CHARS]:
+            voice_audio = {}
+        item = {
+            'question': question,
+            'response': response,
+            'score': evaluation['score'],
+            'technical_strengths': evaluation['technical_strengths'],
+            'communication_quality': evaluation['communication_quality'],
+            'knowledge_gaps': evaluation['knowledge_gaps'],
+            'implementation_insights': evaluation['implementation_insights'],
+            'detailed_suggestions': evaluation['detailed_suggestions'],
+            'industry_relevance': evaluation['industry_relevance'],
+            'next_learning_steps': evaluation['next_learning_steps'],
+            **voice_audio
+        }
+        
+        # Generate follow-up if needed
+        followup = None
+        if interview.wants_followup:
+            started = time.perf_counter()
+            followup = generate_dynamic_followup(response, interview.skills, interview.projects, api_key)
+            timings['followup'] = time.perf_counter() - started
+            get_speech_cache().prefetch([followup])
+        
+        interview.record(item, followup, timings)
+    flash("Response submitted successfully!", "✅")
+    st.rerun()
+
+# Initialize questions if not already done
+if interview.state == PREPARING:
+    with st.spinner("🤖 Preparing personalized technical questions..."):
+        started = time.perf_counter()
+        technical_questions = generate_technical_questions_enhanced(
+            interview.skills, 
+            interview.projects, 
+            interview.branch, 
+            api_key
+        )
+
+        project_questions = generate_project_based_questions(
+            interview.projects, 
+            interview.skills, 
+            api_key
+        )
+
+        all_questions = technical_questions + project_questions
+        interview.start(all_questions, {'questions': time.perf_counter() - started})
+        get_speech_cache().prefetch(all_questions)
+elif interview.state == EVALUATING:
+    # The run evaluating this answer was interrupted by another click; finish it
+    evaluate_answer()
+
+# Progress tracking
+total_questions = interview.total_questions
+st.progress(interview.index / total_questions)
+st.caption(f"Question {interview.index + 1} of {total_questions} (max)")
+
+# Display interview info
+col1, col2, col3 = st.columns(3)
+with col1:
+    st.info(f"🎓 **Branch:** {interview.branch}")
+with col2:
+    st.info(f"🛠️ **Skills:** {len(interview.skills)} identified")
+with col3:
+    st.info(f"🚀 **Projects:** {len(interview.projects)} found")
+
+# Current question display
+if interview.state == ASKING:
+    current_question = interview.current_question
+
+    st.markdown("""
+    <div class="interview-card">
+    <h3>🤖 Interviewer Question:</h3>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown(f"### {current_question}")
+
+    # Text-to-speech for question
+    speak_question(current_question)
+
+    # Response input methods
+    st.markdown("### 💬 Your Response:")
+
+    # Voice input section
+    col1, col2 = st.columns([3, 1])
+
+    capturing = "voice_response_worker" in st.session_state
+    with col2:
+        live_transcript = st.toggle("⚡ Live transcript", value=True, key="voice_streaming",
+                                    help="Transcribe while you speak so your answer is ready as soon as you stop")
+        microphone = st.radio("Microphone", ["This browser", "Server"], key="voice_source", horizontal=True,
+                              help="'This browser' records on your device; 'Server' uses the machine running VIntervu")
+        if microphone == "This browser":
+            browser_voice_input("voice_response", streaming=live_transcript)
+        elif st.button("🎤 Voice Input", help="Click to answer using your microphone", disabled=capturing):
+            capturing = start_voice_capture("voice_response", streaming=live_transcript, keep_audio=True)
+
+    if capturing:
+        voice_capture_status("voice_response")
+    elif voice_capture_notice("voice_response"):
+        st.success(f"✅ Voice captured: *{st.session_state.voice_response[:100]}...*")
+
+    # A finished capture puts its transcript in the answer box. The box is
+    # keyed, so it keeps its own state and only takes text through that key.
+    answer_key = f"response_{interview.index}"
+    if 'voice_response' in st.session_state:
+        st.session_state[answer_key] = st.session_state.pop('voice_response')[:MAX_ANSWER_CHARS]
+    response = st.text_area(
+        "Type your answer or use voice input above:", 
+        height=150, 
+        max_chars=MAX_ANSWER_CHARS,
+        key=answer_key,
+        placeholder="Click 'Voice Input' button above to speak your answer, or type here..."
+    )
+
+    # Action buttons
+    col1, col2, col3 = st.columns([2, 2, 2])
+
+    with col1:
+        if st.button("📝 Submit Response", type="primary"):
+            if response.strip():
+                interview.submit(response)
+                evaluate_answer()
+            else:
+                st.error("Please provide a response before submitting!")
+
+    with col2:
+        if st.button("⏭️ Skip Question"):
+            st.session_state.pop('voice_response_audio', None)
+            interview.skip()
+            flash("Question skipped", "⏭️")
+            st.rerun()
+
+    with col3:
+        if st.button("🏁 End Interview"):
+            if interview.feedback:
+                interview.finish()
+                st.rerun()
+            else:
+                st.error("Please answer at least one question before ending!")
+
+else:
+    # Interview completed
+    st.subheader("🎉 Technical Interview Completed!")
+
+    if interview.feedback:
+        total_score, max_score, percentage = interview.summary()
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("📊 Total Score", f"{total_score}/{max_score}")
+        with col2:
+            st.metric("📈 Percentage", f"{percentage:.1f}%")
+        with col3:
+            st.metric("❓ Questions Answered", len(interview.feedback))
+
+        # Saved once, on the run that first shows the results
+        if not interview.saved:
+            if save_feedback(st.session_state.user_email, total_score, max_score, percentage,
+                             interview.feedback_data()):
+                interview.mark_saved()
+                st.success("🎉 Interview completed! Check your dashboard for detailed feedback.")
+                st.balloons()
+
+        # Show detailed results with enhanced feedback headings
+        st.subheader("📝 Comprehensive Interview Analysis")
+        feedback_report(interview.feedback, key="interview_report")
+
+        if st.button("🏠 Return to Home"):
+            st.session_state.interview = new_interview()
+            st.switch_page("app_pages/home.py")
@@ -0,0 +1,26 @@
+import streamlit as st
+
+from vintervu.db import authenticate_user
+from vintervu.ui import find_unfinished_interview, flash, new_interview, rotate_session
+
+st.title("Login to VIntervu")
+
+with st.form("login_form"):
+    email = st.text_input("📧 Email", placeholder="Enter your email")
+    password = st.text_input("🔒 Password", type="password", placeholder="Enter your password")
+    submit_button = st.form_submit_button("🚀 Login")
+
+    if submit_button:
+        if email and password:
+            if authenticate_user(email, password):
+                st.session_state.logged_in = True
+                st.session_state.user_email = email
+                rotate_session()
+                st.session_state.interview = new_interview()
+                st.session_state.resume_offer = find_unfinished_interview(email)
+                flash("Login successful!", "🎉")
+                st.switch_page("app_pages/home.py")
+            else:
+                st.error("Invalid email or password! ❌")
+        else:
+            st.error("Please fill in all fields! ⚠️")
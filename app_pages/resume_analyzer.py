@@ -0,0 +1,55 @@
+import streamlit as st
+
+from vintervu.analysis import JOB_ROLES, analyze_resume_for_job, analyze_resume_for_all_roles, rank_role_analyses
+from vintervu.ui import extract_resume_text, markdown_table, render_role_analysis
+
+st.title("Resume Analyzer")
+
+api_key = st.text_input("🔑 Enter Gemini API Key", type="password",
+                       help="Get your API key from https://makersuite.google.com/app/apikey")
+
+if api_key:
+    selected_role = st.selectbox("🎯 Select Target Job Role", JOB_ROLES)
+    analyze_all = st.toggle("📋 Analyze against all job roles",
+                            help="Extract skills once and rank every job role in a single pass")
+    uploaded_file = st.file_uploader("📄 Upload Your Resume", type=['pdf', 'docx'])
+
+    if uploaded_file and selected_role:
+        file_key = f"{uploaded_file.name}:{uploaded_file.size}"
+
+        if analyze_all:
+            if st.button("🚀 Analyze Against All Roles"):
+                with st.spinner("Analyzing your resume against all roles..."):
+                    resume_text = extract_resume_text(uploaded_file)
+                    if resume_text:
+                        st.session_state.role_analyses = {
+                            'file_key': file_key,
+                            'results': analyze_resume_for_all_roles(resume_text, api_key)
+                        }
+
+            # Switching roles afterwards is a lookup into the stored results
+            role_analyses = st.session_state.get('role_analyses')
+            if role_analyses and role_analyses['file_key'] == file_key:
+                ranked = rank_role_analyses(role_analyses['results'])
+
+                st.subheader("🏆 Role Match Ranking")
+                st.markdown(markdown_table([
+                    {
+                        'Rank': rank,
+                        'Role': analysis['role'].title(),
+                        'Match Score (%)': analysis['score'],
+                        'Found Skills': len(analysis['found_keywords']),
+                        'Missing Skills': len(analysis['missing_keywords'])
+                    }
+                    for rank, analysis in enumerate(ranked, 1)
+                ]))
+
+                render_role_analysis(role_analyses['results'][selected_role])
+        elif st.button("🚀 Analyze Resume"):
+            with st.spinner("Analyzing your resume..."):
+                resume_text = extract_resume_text(uploaded_file)
+
+                if resume_text:
+                    render_role_analysis(analyze_resume_for_job(resume_text, selected_role, api_key))
+else:
+    st.info("Please enter your Gemini API key to use the Resume Analyzer feature.")
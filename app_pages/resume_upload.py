@@ -0,0 +1,66 @@
+import streamlit as st
+
+from vintervu.analysis import infer_branch
+from vintervu.llm import extract_skills_and_projects_with_gemini
+from vintervu.ui import extract_resume_text
+
+st.title("Upload Your Resume")
+
+api_key = st.text_input("🔑 Enter Gemini API Key", type="password",
+                       help="Get your API key from https://makersuite.google.com/app/apikey")
+
+if api_key:
+    uploaded_file = st.file_uploader("📄 Choose a Resume File", type=['pdf', 'docx'])
+
+    if uploaded_file:
+        if st.button("🚀 Process Resume"):
+            with st.spinner("Processing your resume..."):
+                resume_text = extract_resume_text(uploaded_file)
+
+                if resume_text:
+                    extracted_data = extract_skills_and_projects_with_gemini(resume_text, api_key)
+                    skills = extracted_data['skills']
+                    projects = extracted_data['projects']
+                    domains = extracted_data['domains']
+                    branch = infer_branch(skills)
+
+                    # Store in session state
+                    st.session_state.interview.load_profile(skills, projects, branch, api_key)
+
+                    st.subheader("📊 Extracted Information")
+
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        st.markdown(f"**🛠️ Skills ({len(skills)}):**")
+                        if skills:
+                            for skill in skills[:10]:
+                                st.markdown(f"• {skill}")
+                            if len(skills) > 10:
+                                st.markdown(f"• ... and {len(skills)-10} more")
+                        else:
+                            st.markdown("No skills found")
+
+                    with col2:
+                        st.markdown(f"**🎓 Inferred Branch:** {branch}")
+                        st.markdown(f"**🚀 Projects ({len(projects)}):**")
+                        if projects:
+                            for project in projects[:5]:
+                                if isinstance(project, dict):
+                                    st.markdown(f"• {project.get('title', 'Unknown')}")
+                                    if project.get('technologies'):
+                                        st.markdown(f"  └── Technologies: {', '.join(project['technologies'][:3])}")
+                                else:
+                                    st.markdown(f"• {project}")
+                        else:
+                            st.markdown("No projects found")
+
+                    if domains:
+                        st.markdown(f"**🎯 Domain Expertise:** {', '.join(domains)}")
+
+                    st.success("✅ Resume processed successfully!")
+
+                    # Start Interview Button with proper navigation
+                    if st.button("🎤 Start Technical Interview", type="primary"):
+                        st.switch_page("app_pages/interview.py")
+else:
+    st.info("Please enter your Gemini API key to process your resume.")
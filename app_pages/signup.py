@@ -0,0 +1,27 @@
+import streamlit as st
+
+from vintervu.db import register_user
+
+st.title("Create Your Account")
+
+with st.form("signup_form"):
+    username = st.text_input("👤 Username", placeholder="Enter your username")
+    email = st.text_input("📧 Email", placeholder="Enter your email")
+    password = st.text_input("🔒 Password", type="password", placeholder="Enter your password")
+    confirm_password = st.text_input("🔒 Confirm Password", type="password", placeholder="Confirm your password")
+    submit_button = st.form_submit_button("✨ Create Account")
+
+    if submit_button:
+        if username and email and password and confirm_password:
+            if password == confirm_password:
+                if len(password) >= 6:
+                    if register_user(username, email, password):
+                        st.success("Account created successfully! Please login. 🎉")
+                    else:
+                        st.error("Email already exists! Please use a different email. ❌")
+                else:
+                    st.error("Password must be at least 6 characters long!")
+            else:
+                st.error("Passwords do not match! ❌")
+        else:
+            st.error("Please fill in all fields!")
@@ -0,0 +1,72 @@
+import streamlit as st
+
+from vintervu.ui import (
+    get_calibration_cache, get_recognition_orchestrator, list_microphones, markdown_table, test_microphone,
+    test_voice_input, text_to_speech_js
+)
+
+st.title("🎤 Voice Input Test")
+
+st.markdown("""
+<div class="interview-card">
+    <h3>🧪 Test Your Voice Setup</h3>
+    <p>Test your microphone and speech recognition without needing an API key. This helps ensure everything works before starting your interview.</p>
+</div>
+""", unsafe_allow_html=True)
+
+# Microphone test
+st.subheader("🔧 Microphone Setup")
+col1, col2, col3 = st.columns(3)
+with col1:
+    check_microphones = st.button("📋 Check Available Microphones")
+with col2:
+    if st.button("🔄 Rescan Devices", help="Pick up microphones plugged in since the last scan"):
+        list_microphones.clear()
+        check_microphones = True
+with col3:
+    if st.button("🎚️ Recalibrate Noise Level", help="Measure background noise again on the next recording"):
+        get_calibration_cache().invalidate()
+        st.toast("Background noise will be measured on your next recording")
+
+if check_microphones:
+    test_microphone()
+
+calibration_age = get_calibration_cache().age(None)
+if calibration_age is not None:
+    st.caption(f"🎚️ Noise level calibrated {calibration_age / 60:.0f} min ago; recordings start immediately.")
+
+# Voice input test
+test_voice_input()
+
+orchestrator = get_recognition_orchestrator()
+with st.expander(f"📈 Speech engine stats ({orchestrator.policy.replace('_', ' ')})"):
+    st.markdown(markdown_table(orchestrator.stats()))
+
+# Text-to-speech test
+st.subheader("🔊 Text-to-Speech Test")
+test_text = st.text_area("Enter text to test speech synthesis:", 
+                         value="Hello! This is a test of the text-to-speech functionality. How does this sound?",
+                         height=100)
+
+if st.button("🔊 Test Speech Output"):
+    st.components.v1.html(
+        text_to_speech_js(test_text),
+        height=0,
+    )
+    st.success("🔊 Text is being read aloud...")
+
+# Troubleshooting section
+st.subheader("🛠️ Troubleshooting")
+st.markdown("""
+**If voice input isn't working:**
+- ✅ Check browser microphone permissions
+- ✅ Ensure no other apps are using the microphone
+- ✅ Try refreshing the page
+- ✅ Use Chrome or Firefox for best compatibility
+- ✅ Check your system microphone settings
+
+**If text-to-speech isn't working:**
+- ✅ Ensure browser supports speech synthesis
+- ✅ Check system volume settings
+- ✅ Try a different browser if needed
+""")
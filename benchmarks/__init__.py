@@ -0,0 +1 @@
+"""Benchmarks for VIntervu; run each module with ``python -m benchmarks.<name>``."""
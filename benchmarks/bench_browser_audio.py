@@ -0,0 +1,156 @@
+"""Simulate many candidates answering by voice through the browser recorder at once.
+
+    python -m benchmarks.bench_browser_audio [WAV ...] [--sessions 20] [--speed 1] [--skip 0.2]
+        [--engines google,sphinx] [--no-streaming]
+
+Each simulated browser cuts its answer (one of the given WAV files, or
+synthetic speech if none are given) into ADPCM chunks exactly as the
+component does and uploads them in the same binary format with the same
+seq/ack protocol, skipping a fraction of uploads the way Streamlit coalesces
+component values. Every capture runs through the real BrowserAudioSource
+and VoiceCaptureWorker. Without --engines, recognition is a stub that sleeps
+in proportion to the audio, so the numbers describe the capture pipeline
+rather than a speech service. The reported ratio is PCM bytes per byte
+actually uploaded, resent chunks included.
+"""
+import argparse
+import random
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import speech_recognition as sr
+
+from vintervu import speech
+from vintervu.browser_audio import (
+    SAMPLE_RATE, SAMPLE_WIDTH, BrowserAudioSource, encode_chunk, encode_upload, parse_upload
+)
+from vintervu.recognition import RecognitionOrchestrator
+from vintervu.speech import VoiceCaptureWorker
+from vintervu.stubs import StubOrchestrator
+
+from .synthetic import answer_pcm
+
+
+def load_wav(path: str) -> bytes:
+    """A recorded answer converted to the PCM format the browser uploads"""
+    with sr.AudioFile(path) as source:
+        audio = sr.Recognizer().record(source)
+    return audio.get_raw_data(convert_rate=SAMPLE_RATE, convert_width=SAMPLE_WIDTH)
+
+
+def run_session(number, pcm, orchestrator, chunk_ms, speed, skip, streaming, seed):
+    """One browser: upload ``pcm`` in chunks, then wait for the transcript"""
+    rng = random.Random(seed)
+    chunk_bytes = SAMPLE_RATE * SAMPLE_WIDTH * chunk_ms // 1000
+    chunks = [pcm[i:i + chunk_bytes] for i in range(0, len(pcm), chunk_bytes)]
+
+    source = BrowserAudioSource(f"bench-{number}")
+    worker = VoiceCaptureWorker(orchestrator=orchestrator, streaming=streaming, source=source)
+    worker.start()
+
+    pending = []
+    state = None
+    uploads = skipped = uploaded_bytes = 0
+    for seq, chunk in enumerate(chunks):
+        if speed:
+            time.sleep(chunk_ms / 1000 / speed)
+        data, state = encode_chunk(chunk, state)
+        pending.append({'seq': seq, 'data': data})
+        final = seq == len(chunks) - 1
+        value = encode_upload(source.capture_id, pending, seq if final else None)
+        uploads += 1
+        # Streamlit may skip a value when a newer one follows; the latest always arrives
+        if not final and rng.random() < skip:
+            skipped += 1
+            continue
+        uploaded_bytes += len(value)
+        upload = parse_upload(value)
+        ack = source.receive(upload['chunks'], upload['last_seq'])
+        pending = [chunk for chunk in pending if chunk['seq'] > ack]
+    stopped = time.perf_counter()
+
+    while worker.running:
+        time.sleep(0.01)
+    latency = time.perf_counter() - stopped
+    status, message = worker.poll()
+    return {
+        'status': status,
+        'message': message,
+        'text': worker.text,
+        'audio_s': len(pcm) / (SAMPLE_RATE * SAMPLE_WIDTH),
+        'latency_s': latency,
+        'uploads': uploads,
+        'skipped': skipped,
+        'uploaded_kb': uploaded_bytes / 1024,
+        'ratio': len(pcm) / uploaded_bytes,
+        'lost_chunks': len(pending),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('wavs', nargs='*', help="Recorded answers; synthetic speech when omitted")
+    parser.add_argument('--sessions', type=int, default=20, help="Concurrent candidates")
+    parser.add_argument('--chunk-ms', type=int, default=500)
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help="Upload pacing relative to real time; 0 sends as fast as possible")
+    parser.add_argument('--skip', type=float, default=0.2, help="Fraction of uploads coalesced away")
+    parser.add_argument('--stagger', type=float, default=2.0, help="Spread session starts over this many seconds")
+    parser.add_argument('--engines', default='', help="Real engines, e.g. google,sphinx (default: stub)")
+    parser.add_argument('--no-streaming', action='store_true', help="Transcribe each answer only after it ends")
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    if args.wavs:
+        answers = [load_wav(path) for path in args.wavs]
+    else:
+        answers = [answer_pcm(seed=seed) for seed in range(min(args.sessions, 8))]
+    orchestrator = RecognitionOrchestrator(args.engines.split(',')) if args.engines else StubOrchestrator(0.2, 0.1)
+
+    peak_threads = threading.active_count()
+    done = threading.Event()
+
+    def watch_threads():
+        nonlocal peak_threads
+        while not done.wait(0.05):
+            peak_threads = max(peak_threads, threading.active_count())
+
+    watcher = threading.Thread(target=watch_threads, daemon=True)
+    watcher.start()
+
+    def session(number):
+        rng = random.Random(args.seed + number)
+        time.sleep(rng.uniform(0, args.stagger))
+        return run_session(number, answers[number % len(answers)], orchestrator, args.chunk_ms, args.speed,
+                           args.skip, not args.no_streaming, args.seed + number)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.sessions) as pool:
+        results = list(pool.map(session, range(args.sessions)))
+    wall = time.perf_counter() - start
+    done.set()
+
+    ok = [r for r in results if r['status'] == speech.DONE and r['text']]
+    latencies = sorted(r['latency_s'] for r in results)
+    audio = sum(r['audio_s'] for r in results)
+    print(f"sessions: {len(results)} ({len(ok)} transcribed), {audio:.0f}s of audio in {wall:.1f}s wall, "
+          f"peak threads {peak_threads}")
+    print(f"end of answer -> transcript: p50={statistics.median(latencies):.2f}s "
+          f"p95={latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]:.2f}s max={latencies[-1]:.2f}s")
+    print(f"uploads: {sum(r['uploads'] for r in results)} ({sum(r['skipped'] for r in results)} coalesced), "
+          f"{statistics.mean(r['uploaded_kb'] for r in results):.0f}KB per answer, "
+          f"PCM/upload ratio {statistics.mean(r['ratio'] for r in results):.2f}")
+    for number, result in enumerate(results[:5]):
+        print(f"  session {number}: {result['status']:<12} {result['text'][:70]!r}")
+
+    # Single-phrase captures end at the first pause, leaving the rest unacknowledged by design
+    failed = [r for r in results if (r['lost_chunks'] and not args.no_streaming) or r['status'] != speech.DONE]
+    if failed:
+        raise SystemExit(f"FAIL: {len(failed)} sessions lost audio or did not finish "
+                         f"(first: {failed[0]['status']} {failed[0]['message']})")
+
+
+if __name__ == '__main__':
+    main()
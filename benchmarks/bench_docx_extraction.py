@@ -0,0 +1,64 @@
+"""Compare in-memory DOCX extraction with the old temp-file + docx2txt path.
+
+    python -m benchmarks.bench_docx_extraction [--repeat 20]
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from vintervu.extraction import read_docx_text
+
+from .synthetic import make_docx, resume_paragraphs
+
+SIZES = {'1 page': 15, '5 pages': 120, '30 pages': 900}
+
+
+def legacy_docx_text(file_content: bytes) -> str:
+    """The pre-change implementation: spill to a temp file and call docx2txt"""
+    import docx2txt
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as tmp_file:
+        tmp_file.write(file_content)
+        tmp_file.flush()
+        text = docx2txt.process(tmp_file.name)
+        os.unlink(tmp_file.name)
+    return text
+
+
+def time_call(func, content, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(content)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    try:
+        import docx2txt  # noqa: F401
+        candidates = {'docx2txt (temp file)': legacy_docx_text}
+    except ImportError:
+        print("docx2txt not installed, only timing the in-memory path")
+        candidates = {}
+    candidates['in-memory'] = lambda content: read_docx_text(content, None)
+    candidates['in-memory, budget'] = read_docx_text
+
+    print(f"{'document':<10} {'size':>9}  " + "  ".join(f"{name:>20}" for name in candidates))
+    for label, paragraphs in SIZES.items():
+        content = make_docx(resume_paragraphs(paragraphs), header="jane@example.com | +1 555 0100")
+        if 'docx2txt (temp file)' in candidates:
+            legacy = " ".join(legacy_docx_text(content).split())
+            current = " ".join(read_docx_text(content, None).split())
+            assert legacy == current, f"{label}: text differs from docx2txt"
+        timings = [time_call(func, content, args.repeat) for func in candidates.values()]
+        print(f"{label:<10} {len(content) / 1024:>7.1f}KB  " + "  ".join(f"{ms:>18.2f}ms" for ms in timings))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,251 @@
+"""Drive the whole interview flow headlessly and report latencies as JSON.
+
+    python -m benchmarks.bench_e2e [--runs 3] [--answers 6] [--concurrency 1] [--llm-latency-ms 0] [--output FILE]
+
+Each run of each synthetic resume (PDFs and DOCX files of several sizes)
+goes through the same steps as the app:
+- extract the text in the extraction pool and extract the profile
+- generate the technical and project questions
+- transcribe and evaluate --answers recorded answers, with follow-ups
+- save the interview and load the dashboard data
+
+Gemini is replaced by ``stubs.StubModel`` and the speech engines by
+``stubs.StubOrchestrator``, against a temporary database, so the numbers
+are this app's own work (plus --llm-latency-ms per model call, if given).
+The result is one JSON document, so runs on two commits can be diffed.
+A stage that fails (an answer that is not transcribed, say) stops the run
+with a non-zero exit instead of being timed.
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+
+import speech_recognition as sr
+
+from vintervu import db, llm, metrics
+from vintervu.analysis import infer_branch
+from vintervu.extraction import read_docx_text, read_pdf
+from vintervu.interview import InterviewSession
+from vintervu.report import question_html
+from vintervu.speech import DONE, speech_to_text_enhanced
+from vintervu.stubs import StubOrchestrator, stub_model_factory
+from vintervu.workers import ExtractionPool
+
+from .synthetic import answer_pcm, make_docx, make_pdf, resume_paragraphs, resume_pdf_pages
+
+# (name, kind, pages for PDFs / project paragraphs for DOCX)
+RESUMES = [
+    ('pdf-1p', 'pdf', 1),
+    ('pdf-3p', 'pdf', 3),
+    ('pdf-10p', 'pdf', 10),
+    ('docx-20', 'docx', 20),
+    ('docx-100', 'docx', 100),
+    ('docx-400', 'docx', 400),
+]
+
+STAGES = ['extract', 'profile', 'questions', 'transcribe', 'evaluate', 'save', 'dashboard', 'flow']
+
+
+class StageFailed(Exception):
+    """A stage did not do its job, so its timing would be meaningless"""
+
+
+def make_resume(kind, size, seed=0) -> bytes:
+    if kind == 'pdf':
+        return make_pdf(resume_pdf_pages(size, seed))
+    return make_docx(resume_paragraphs(size, seed))
+
+
+def answer_wav(seed) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(answer_pcm(bursts=4, seed=seed))
+    return buffer.getvalue()
+
+
+class Timings:
+    """Seconds per stage, shared by the flow threads"""
+
+    def __init__(self):
+        self.stages = {stage: [] for stage in STAGES}
+        self.flows = {}
+        self._lock = threading.Lock()
+
+    def add(self, stage, seconds):
+        with self._lock:
+            self.stages[stage].append(seconds)
+
+    def add_flow(self, resume, seconds):
+        with self._lock:
+            self.flows.setdefault(resume, []).append(seconds)
+            self.stages['flow'].append(seconds)
+
+
+def distribution(values) -> dict:
+    values = sorted(values)
+    if not values:
+        return {'count': 0}
+    return {
+        'count': len(values),
+        'mean_ms': round(statistics.mean(values) * 1000, 3),
+        'p50_ms': round(metrics.percentile(values, 0.50) * 1000, 3),
+        'p95_ms': round(metrics.percentile(values, 0.95) * 1000, 3),
+        'p99_ms': round(metrics.percentile(values, 0.99) * 1000, 3),
+        'max_ms': round(values[-1] * 1000, 3),
+    }
+
+
+def run_flow(name, kind, content, email, answers, wavs, pool, orchestrator, timings):
+    """One candidate from resume upload to the dashboard, timing every stage"""
+    def stage(label, func, *args, **kwargs):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        timings.add(label, time.perf_counter() - start)
+        return result
+
+    flow_start = time.perf_counter()
+    if kind == 'pdf':
+        text = stage('extract', pool.run, read_pdf, content).text
+    else:
+        text = stage('extract', pool.run, read_docx_text, content)
+    profile = stage('profile', llm.extract_resume_profile, text, 'stub-key')
+
+    interview = InterviewSession()
+    interview.load_profile(profile['skills'], profile['projects'], infer_branch(profile['skills']), 'stub-key')
+
+    def questions():
+        return (llm.generate_technical_questions_enhanced(interview.skills, interview.projects, interview.branch,
+                                                          interview.api_key)
+                + llm.generate_project_based_questions(interview.projects, interview.skills, interview.api_key))
+
+    interview.start(stage('questions', questions))
+
+    def evaluate(question, response):
+        evaluation = llm.evaluate_response_enhanced(question, response, interview.api_key)
+        item = dict(evaluation, question=question, response=response)
+        followup = None
+        if interview.wants_followup:
+            followup = llm.generate_dynamic_followup(response, interview.skills, interview.projects,
+                                                     interview.api_key)
+        interview.record(item, followup)
+
+    for n in range(answers):
+        if interview.current_question is None:
+            break
+        source = sr.AudioFile(io.BytesIO(wavs[n % len(wavs)]))
+        statuses = []
+        response = stage('transcribe', speech_to_text_enhanced, source=source, orchestrator=orchestrator,
+                         report=lambda status, message: statuses.append((status, message)))
+        if not response or not statuses or statuses[-1][0] != DONE:
+            raise StageFailed(f"{name}: answer {n + 1} was not transcribed: "
+                              f"{statuses[-1][1] if statuses else 'no status reported'}")
+        interview.submit(response)
+        stage('evaluate', evaluate, interview.current_question, interview.pending_response)
+    interview.finish()
+
+    total_score, max_score, percentage = interview.summary()
+    stage('save', db.insert_feedback, email, total_score, max_score, percentage, interview.feedback_data())
+
+    def dashboard():
+        history = db.fetch_feedback(email)
+        return [question_html(item) for item in history[0]['feedback_data']['feedback']]
+
+    stage('dashboard', dashboard)
+    timings.add_flow(name, time.perf_counter() - flow_start)
+    return len(interview.feedback)
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=3, help="Flows per resume")
+    parser.add_argument('--answers', type=int, default=6, help="Answers per interview")
+    parser.add_argument('--concurrency', type=int, default=1, help="Flows running at once")
+    parser.add_argument('--llm-latency-ms', type=float, default=0, help="Simulated network time per model call")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="Write the JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix='vintervu-e2e-')
+    db.DB_PATH = os.path.join(workdir, 'vintervu.db')
+    db.init_database()
+    llm.set_model_factory(stub_model_factory(args.llm_latency_ms / 1000))
+    orchestrator = StubOrchestrator()
+
+    resumes = {name: (kind, make_resume(kind, size, args.seed)) for name, kind, size in RESUMES}
+    wavs = [answer_wav(args.seed + n) for n in range(3)]
+    jobs = [(name, run) for run in range(args.runs) for name in resumes]
+
+    timings = Timings()
+    try:
+        with ExtractionPool(size=min(args.concurrency, os.cpu_count() or 1)) as pool, \
+                ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            # Untimed pass so extraction worker start-up and first imports are not counted
+            for future in [executor.submit(run_flow, name, kind, content, "warmup@bench.local", 1, wavs, pool,
+                                           orchestrator, Timings())
+                           for name, (kind, content) in resumes.items()]:
+                future.result()
+
+            started_at = time.time()
+            start = time.perf_counter()
+            futures = [
+                executor.submit(run_flow, name, resumes[name][0], resumes[name][1], f"{name}-{run % 4}@bench.local",
+                                args.answers, wavs, pool, orchestrator, timings)
+                for name, run in jobs
+            ]
+            answered = sum(future.result() for future in futures)
+            wall = time.perf_counter() - start
+    except StageFailed as e:
+        sys.exit(f"bench_e2e: {e}")
+
+    # The per-call timings the app records anyway, split by Gemini request and DB function
+    metrics.recorder.flush()
+    calls = [{key: round(value, 3) if isinstance(value, float) else value for key, value in row.items()}
+             for row in metrics.stage_summary(db.fetch_metrics(started_at))]
+
+    report = {
+        'benchmark': 'e2e',
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'params': {key: value for key, value in vars(args).items() if key != 'output'},
+        'wall_s': round(wall, 3),
+        'throughput': {
+            'flows_per_s': round(len(jobs) / wall, 3),
+            'answers_per_s': round(answered / wall, 3),
+        },
+        'stages': {stage: distribution(values) for stage, values in timings.stages.items()},
+        'resumes': {name: dict(distribution(timings.flows[name]), bytes=len(resumes[name][1]))
+                    for name in resumes},
+        'calls': calls,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+        print(f"{len(jobs)} flows in {wall:.1f}s, written to {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
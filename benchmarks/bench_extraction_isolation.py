@@ -0,0 +1,165 @@
+"""Throw pathological and fuzzed resumes at the isolated extraction pool.
+
+    python -m benchmarks.bench_extraction_isolation [--fuzz 200] [--timeout 5] [--rss-mb 256]
+
+Every case must come back as text or a clean ExtractionError within roughly
+the timeout, and a valid resume submitted afterwards must still be served
+promptly by the same pool.
+"""
+import argparse
+import io
+import random
+import statistics
+import time
+import zipfile
+import zlib
+
+from vintervu.extraction import read_docx_text, read_pdf
+from vintervu.workers import ExtractionError, ExtractionPool, ExtractionTimeout
+
+from .synthetic import make_docx, make_pdf, resume_paragraphs, resume_pdf_pages, write_pdf
+
+_W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+
+def _docx_with_body(document_xml: str) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as docx:
+        docx.writestr('word/document.xml', document_xml)
+    return buffer.getvalue()
+
+
+def pdf_cyclic_page_tree() -> bytes:
+    """The page tree lists itself as a kid"""
+    return write_pdf([
+        b"<< /Type /Pages /Kids [1 0 R 2 0 R] /Count 2 >>",
+        b"<< /Type /Catalog /Pages 1 0 R >>",
+    ], root=2)
+
+
+def pdf_flate_bomb(operators: int = 3_000_000) -> bytes:
+    """A tiny compressed content stream that inflates to millions of text operators"""
+    stream = zlib.compress(b"BT /F1 10 Tf " + b"(A) Tj " * operators + b"ET", 9)
+    return write_pdf([
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Type /Pages /Kids [4 0 R] /Count 1 >>",
+        b"<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream" % (len(stream), stream),
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 1 0 R >> >> /Contents 3 0 R >>",
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+    ], root=5)
+
+
+def docx_zip_bomb(megabytes: int = 600) -> bytes:
+    """One enormous text run: a few hundred KB on disk, hundreds of MB parsed"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as docx:
+        with docx.open('word/document.xml', 'w', force_zip64=True) as part:
+            part.write(f'<w:document xmlns:w="{_W}"><w:body><w:p><w:r><w:t>'.encode())
+            chunk = b"A" * (1024 * 1024)
+            for _ in range(megabytes):
+                part.write(chunk)
+            part.write(b'</w:t></w:r></w:p></w:body></w:document>')
+    return buffer.getvalue()
+
+
+def docx_billion_laughs() -> bytes:
+    entities = '<!ENTITY lol0 "lol">' + "".join(
+        f'<!ENTITY lol{i} "{f"&lol{i - 1};" * 10}">' for i in range(1, 10))
+    return _docx_with_body(
+        f'<?xml version="1.0"?><!DOCTYPE lolz [{entities}]>'
+        f'<w:document xmlns:w="{_W}"><w:body><w:p><w:r><w:t>&lol9;</w:t></w:r></w:p></w:body></w:document>'
+    )
+
+
+def pathological_cases() -> list:
+    valid_pdf = make_pdf(resume_pdf_pages(3))
+    valid_docx = make_docx(resume_paragraphs(40))
+    rng = random.Random(0)
+    return [
+        ('valid pdf', read_pdf, valid_pdf),
+        ('valid docx', read_docx_text, valid_docx),
+        ('random bytes as pdf', read_pdf, rng.randbytes(64 * 1024)),
+        ('random bytes as docx', read_docx_text, rng.randbytes(64 * 1024)),
+        ('truncated pdf', read_pdf, valid_pdf[:len(valid_pdf) // 2]),
+        ('truncated docx', read_docx_text, valid_docx[:len(valid_docx) // 2]),
+        ('cyclic pdf page tree', read_pdf, pdf_cyclic_page_tree()),
+        ('pdf flate bomb', read_pdf, pdf_flate_bomb()),
+        ('docx zip bomb', read_docx_text, docx_zip_bomb()),
+        ('docx billion laughs', read_docx_text, docx_billion_laughs()),
+    ]
+
+
+def mutate(content: bytes, rng: random.Random) -> bytes:
+    """Flip bytes, cut the file or duplicate a slice of it"""
+    data = bytearray(content)
+    choice = rng.random()
+    if choice < 0.5:
+        for _ in range(rng.randint(1, 64)):
+            data[rng.randrange(len(data))] = rng.randrange(256)
+    elif choice < 0.75:
+        del data[rng.randrange(len(data)):]
+    else:
+        start = rng.randrange(len(data))
+        piece = data[start:start + rng.randint(1, 4096)]
+        data[start:start] = piece * rng.randint(1, 50)
+    return bytes(data)
+
+
+def run_case(pool, func, content):
+    start = time.perf_counter()
+    try:
+        pool.run(func, content)
+        outcome = 'ok'
+    except ExtractionTimeout:
+        outcome = 'timeout'
+    except ExtractionError as e:
+        outcome = 'killed' if 'stopped' in str(e) or 'exited' in str(e) else 'error'
+    return outcome, (time.perf_counter() - start) * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--fuzz', type=int, default=200, help="Number of mutated documents")
+    parser.add_argument('--timeout', type=float, default=5.0)
+    parser.add_argument('--rss-mb', type=int, default=256)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    with ExtractionPool(size=args.workers, timeout=args.timeout, rss_limit_mb=args.rss_mb) as pool:
+        # Pay worker start-up before timing anything
+        run_case(pool, read_pdf, make_pdf(resume_pdf_pages(1)))
+
+        print(f"{'case':<24} {'outcome':<8} {'ms':>9}")
+        for name, func, content in pathological_cases():
+            outcome, ms = run_case(pool, func, content)
+            print(f"{name:<24} {outcome:<8} {ms:>9.1f}")
+
+        rng = random.Random(args.seed)
+        seeds = [(read_pdf, make_pdf(resume_pdf_pages(3))), (read_docx_text, make_docx(resume_paragraphs(40)))]
+        outcomes = {}
+        latencies = []
+        for _ in range(args.fuzz):
+            func, content = rng.choice(seeds)
+            outcome, ms = run_case(pool, func, mutate(content, rng))
+            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+            latencies.append(ms)
+        if latencies:
+            latencies.sort()
+            print(f"\nfuzz: {args.fuzz} documents {outcomes}")
+            print(f"fuzz latency ms: p50={statistics.median(latencies):.1f} "
+                  f"p99={latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]:.1f} "
+                  f"max={latencies[-1]:.1f}")
+
+        outcome, ms = run_case(pool, read_pdf, make_pdf(resume_pdf_pages(3)))
+        print(f"\nvalid pdf after abuse: {outcome} in {ms:.1f}ms")
+        print(f"pool stats: {pool.stats}")
+        bound = args.timeout * 1000 * 1.5
+        worst = max(latencies + [ms]) if latencies else ms
+        if outcome != 'ok' or worst > bound:
+            raise SystemExit(f"FAIL: pool did not stay bounded (worst {worst:.0f}ms > {bound:.0f}ms)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""Compare the old per-section feedback rendering with the lazy report.
+
+    python -m benchmarks.bench_feedback_report [--questions 12] [--reruns 20]
+
+Renders the same synthetic feedback with the seven-markdown-blocks-per-question
+code the interview and dashboard pages used to have, and with
+``ui.feedback_report``, under Streamlit's AppTest. For each, reports how
+many elements and bytes of element payload a rerun sends with every question
+collapsed and with one opened, and the mean script time of a rerun.
+"""
+import argparse
+import random
+import time
+
+from streamlit.testing.v1 import AppTest
+
+from vintervu.report import SECTIONS
+
+from .synthetic import SKILLS
+
+WORDS = "the a service request latency cache index query thread memory design trade-off scale".split()
+
+
+def feedback_items(count: int, seed: int = 0) -> list:
+    """Evaluated answers shaped like the ones the interview page stores"""
+    rng = random.Random(seed)
+
+    def sentences(n):
+        return " ".join(" ".join(rng.choice(WORDS) for _ in range(14)).capitalize() + "." for _ in range(n))
+
+    return [
+        dict({
+            'question': f"How would you use {rng.choice(SKILLS)} to build {rng.choice(WORDS)} <features>?",
+            'response': sentences(6),
+            'score': rng.randint(0, 10),
+        }, **{key: sentences(4) for key, _, _ in SECTIONS})
+        for _ in range(count)
+    ]
+
+
+def legacy_script(items, open_index=None):
+    """The rendering the pages used before: one markdown element per section, inside always-sent expanders"""
+    import streamlit as st
+
+    for i, item in enumerate(items):
+        with st.expander(f"Question {i+1} - Score: {item['score']}/10 ⭐", expanded=i == open_index):
+            st.markdown(f"**❓ Interview Question:** {item['question']}")
+            st.markdown(f"**💬 Your Response:** {item['response']}")
+            st.markdown("---")
+            for key, heading, css_class in [
+                ('technical_strengths', "🎯 Technical Strengths & Accuracy", 'feedback-positive'),
+                ('communication_quality', "🗣️ Communication & Clarity Assessment", 'feedback-positive'),
+                ('knowledge_gaps', "📚 Knowledge Gaps & Missing Elements", 'feedback-improvement'),
+                ('implementation_insights', "⚙️ Implementation & Practical Insights", 'feedback-neutral'),
+                ('detailed_suggestions', "💡 Detailed Improvement Recommendations", 'feedback-improvement'),
+                ('industry_relevance', "🏭 Industry Standards & Relevance", 'feedback-neutral'),
+                ('next_learning_steps', "📈 Next Learning Steps & Action Plan", 'feedback-positive'),
+            ]:
+                st.markdown(f"""
+                <div class="feedback-section {css_class}">
+                <h4>{heading}</h4>
+                <p>{item[key]}</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+
+def report_script(items, open_index=None):
+    import streamlit as st
+
+    from vintervu.ui import feedback_report
+
+    if open_index is not None:
+        st.session_state.setdefault(f"bench_report_{open_index}", True)
+    feedback_report(items, key="bench_report")
+
+
+def payload(at: AppTest):
+    """``(elements, bytes)`` of the element protos the last run produced"""
+    elements = []
+    stack = list(at.main.children.values())
+    while stack:
+        node = stack.pop()
+        if hasattr(node, 'proto') and node.proto is not None:
+            elements.append(node)
+        stack.extend(getattr(node, 'children', {}).values())
+    return len(elements), sum(node.proto.ByteSize() for node in elements)
+
+
+def measure(script, items, open_index, reruns):
+    at = AppTest.from_function(script, args=(items, open_index), default_timeout=60)
+    at.run()
+    if at.exception:
+        raise SystemExit(f"{script.__name__} failed: {at.exception[0].value}")
+    elements, size = payload(at)
+    seconds = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        at.run()
+        seconds.append(time.perf_counter() - start)
+    return elements, size, sum(seconds) / len(seconds)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--questions', type=int, default=12)
+    parser.add_argument('--reruns', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    items = feedback_items(args.questions, args.seed)
+    print(f"{'renderer':<10} {'state':<10} {'elements':>9} {'payload KB':>11} {'rerun ms':>9}")
+    for name, script in [('legacy', legacy_script), ('report', report_script)]:
+        for state, open_index in [('collapsed', None), ('one open', 0)]:
+            elements, size, seconds = measure(script, items, open_index, args.reruns)
+            print(f"{name:<10} {state:<10} {elements:>9} {size / 1024:>11.1f} {seconds * 1000:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
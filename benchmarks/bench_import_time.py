@@ -0,0 +1,121 @@
+"""Measure what each page of the app costs to import on a cold start.
+
+    python -m benchmarks.bench_import_time [--repeat 5] [--max-startup-ms 0]
+
+Runs the entrypoint's module-level imports, alone and together with each
+page script's imports and the lazy imports of the helpers it calls, in fresh
+interpreters under ``python -X importtime`` and
+reports the fastest of --repeat runs plus the heaviest imports. Fails if a page-scoped
+dependency (pandas, plotly.express, PyPDF2, speech_recognition) leaks back
+into the entrypoint's imports, or if --max-startup-ms is given and exceeded.
+Modules that ``import streamlit`` loads by itself (it pulls in part of
+plotly for its chart theme) are not counted as leaks.
+"""
+import argparse
+import ast
+import os
+import re
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(REPO_ROOT, 'vintervu-improved.py')
+PAGES_DIR = os.path.join(REPO_ROOT, 'app_pages')
+
+# Only the pages that need these may import them
+PAGE_SCOPED = ('pandas', 'plotly', 'PyPDF2', 'speech_recognition')
+
+# Imported inside vintervu.ui helpers once a page calls them
+_SPEECH_IMPORTS = [
+    "import vintervu.speech", "import vintervu.recognition", "import vintervu.browser_audio",
+    "import vintervu.components", "import vintervu.audio_archive",
+]
+LAZY_IMPORTS = {
+    'resume_analyzer': ["import PyPDF2"],
+    'resume_upload': ["import PyPDF2"],
+    'voice_test': _SPEECH_IMPORTS,
+    'interview': _SPEECH_IMPORTS,
+}
+
+_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+def app_module_imports(path=APP) -> list:
+    """The import statements a script runs at module level"""
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    return [ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+
+
+def page_imports() -> dict:
+    """``{page: statements}`` a visit to each page script adds to the entrypoint's imports"""
+    pages = {}
+    for name in sorted(os.listdir(PAGES_DIR)):
+        page, ext = os.path.splitext(name)
+        if ext == '.py':
+            pages[page] = app_module_imports(os.path.join(PAGES_DIR, name)) + LAZY_IMPORTS.get(page, [])
+    return pages
+
+
+def import_profile(statements: list) -> dict:
+    """``{module: (self_us, cumulative_us, depth)}`` for ``statements`` run in a fresh interpreter"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', "\n".join(statements)],
+                            cwd=REPO_ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise SystemExit(f"import failed:\n{result.stderr[-2000:]}")
+    modules = {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules[name] = (int(self_us), int(cumulative_us), (len(indent) - 1) // 2)
+    return modules
+
+
+def total_ms(modules: dict) -> float:
+    return sum(cumulative for _, cumulative, depth in modules.values() if depth == 0) / 1000
+
+
+def measure(statements: list, repeat: int):
+    """Total of the fastest of ``repeat`` runs (the least disturbed by other load), with its profile"""
+    fastest = min((import_profile(statements) for _ in range(repeat)), key=total_ms)
+    return total_ms(fastest), fastest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--top', type=int, default=5, help="Heaviest imports to list per scenario")
+    parser.add_argument('--max-startup-ms', type=float, default=0, help="Fail above this startup cost (0: off)")
+    args = parser.parse_args(argv)
+
+    startup = app_module_imports()
+    pages = page_imports()
+    # Warm the OS file cache so the first scenario is not penalised
+    import_profile(startup + [line for lines in pages.values() for line in lines])
+
+    startup_ms, startup_modules = measure(startup, args.repeat)
+    scenarios = [('startup', startup_ms, startup_modules)]
+    for page, lines in pages.items():
+        page_ms, page_modules = measure(startup + lines, args.repeat)
+        scenarios.append((page, page_ms, page_modules))
+
+    print(f"{'scenario':<24} {'ms':>8} {'+ms':>8} {'modules':>8}")
+    for name, ms, modules in scenarios:
+        print(f"{name:<24} {ms:>8.1f} {ms - startup_ms:>8.1f} {len(modules):>8}")
+    for name, _, modules in scenarios:
+        top_level = sorted(((cumulative, module) for module, (_, cumulative, depth) in modules.items()
+                            if depth == 0), reverse=True)[:args.top]
+        print(f"\n{name}: " + ", ".join(f"{module} {cumulative / 1000:.0f}ms" for cumulative, module in top_level))
+
+    streamlit_modules = import_profile(["import streamlit"])
+    leaked = sorted({module for module in startup_modules
+                     if module.split('.')[0] in PAGE_SCOPED and module not in streamlit_modules})
+    if leaked:
+        raise SystemExit(f"FAIL: page-scoped modules imported at startup: {', '.join(leaked[:10])}")
+    if args.max_startup_ms and startup_ms > args.max_startup_ms:
+        raise SystemExit(f"FAIL: startup imports took {startup_ms:.0f}ms (> {args.max_startup_ms:.0f}ms)")
+
+
+if __name__ == '__main__':
+    main()
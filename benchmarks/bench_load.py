@@ -0,0 +1,214 @@
+"""Ramp up simultaneous candidates against one replica's worth of CPU.
+
+    python -m benchmarks.bench_load [--levels 1,2,4,8] [--answers 4] [--cpus 1] [--llm-latency-ms 0]
+
+At each concurrency level, that many simulated candidates start together.
+Each drives the real app through Streamlit's AppTest: log in, upload a
+synthetic resume, process it, answer --answers questions and end the
+interview. Gemini is replaced by ``stubs.StubModel``, and all candidates
+share one temporary database.
+
+AppTest keeps its runtime in process-wide globals, so two sessions cannot
+run in one process at the same time. Each candidate gets its own process
+instead, and all of them are pinned to the same --cpus CPUs. One Streamlit
+server's session threads share a single interpreter lock in the same way.
+Per level, it reports:
+- rerun latency percentiles, overall and per action
+- time spent in SQLite calls, which includes waiting for another session's
+  write lock, and how many of those calls failed
+- Python memory a finished session keeps alive, measured with tracemalloc
+  on an untimed session, and the size of the stored session
+"""
+import argparse
+import gc
+import multiprocessing
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(REPO_ROOT, 'vintervu-improved.py')
+PASSWORD = 'password1'
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+ACTIONS = ['open', 'login', 'upload', 'process', 'questions', 'answer', 'finish']
+
+
+def percentiles(values) -> str:
+    from vintervu.metrics import percentile
+
+    if not values:
+        return "-"
+    values = sorted(values)
+    return (f"p50={statistics.median(values) * 1000:.0f} p95={percentile(values, 0.95) * 1000:.0f} "
+            f"p99={percentile(values, 0.99) * 1000:.0f} max={values[-1] * 1000:.0f}ms")
+
+
+class Candidate:
+    """One simulated browser session going through a whole interview"""
+
+    def __init__(self, email, resume, answers):
+        from streamlit.testing.v1 import AppTest
+
+        self.email = email
+        self.resume = resume
+        self.answers = answers
+        self.timings = []
+        self.at = AppTest.from_file(APP, default_timeout=300)
+
+    def step(self, action, element=None):
+        """One rerun, triggered by ``element`` (already set or clicked) or by a plain run"""
+        start = time.perf_counter()
+        (element or self.at).run()
+        self.timings.append((action, time.perf_counter() - start))
+        if self.at.exception:
+            raise RuntimeError(f"{action}: {self.at.exception[0].value}")
+
+    def button(self, prefix):
+        return next(button for button in self.at.button if button.label.startswith(prefix))
+
+    def run(self):
+        at = self.at
+        self.step('open')
+        at.switch_page('app_pages/login.py')
+        self.step('open')
+        at.text_input[0].input(self.email)
+        at.text_input[1].input(PASSWORD)
+        self.step('login', at.button[0].click())
+        if not at.session_state.logged_in:
+            raise RuntimeError("login failed")
+
+        at.switch_page('app_pages/resume_upload.py')
+        self.step('open')
+        self.step('upload', at.text_input[0].input('stub-key'))
+        self.step('upload', at.file_uploader[0].set_value(("resume.docx", self.resume, DOCX_MIME)))
+        self.step('process', self.button("🚀").click())
+
+        at.switch_page('app_pages/interview.py')
+        self.step('questions')
+        for n in range(self.answers):
+            at.text_area[0].input(f"Answer {n} from {self.email}: I would cache the hot rows and shard by user.")
+            self.step('answer', self.button("📝").click())
+        self.step('finish', self.button("🏁").click())
+        if not at.session_state.interview.saved:
+            raise RuntimeError("interview was not saved")
+
+
+def candidate_process(email, resume, answers, llm_latency, cpus, barrier, results):
+    """Warm up, wait for the others, then run one candidate and report what it measured"""
+    if cpus and hasattr(os, 'sched_setaffinity'):
+        os.sched_setaffinity(0, cpus)
+    result = {'email': email, 'timings': [], 'db_calls': [], 'error': None, 'session_bytes': 0,
+              'stored': 0}
+    try:
+        from vintervu import llm, metrics
+        from vintervu.session_store import open_session_store
+        from vintervu.stubs import stub_model_factory
+
+        llm.set_model_factory(stub_model_factory(llm_latency))
+        # Keep every call in memory for the report; nothing is flushed
+        metrics.recorder = metrics.Recorder(size=1_000_000, interval=86400, sink=lambda rows: None)
+
+        # Imports, page compilation and cached resources, untimed
+        Candidate('warmup-' + email, resume, 1).run()
+        gc.collect()
+        # Python memory a finished session keeps alive, on a second untimed session
+        tracemalloc.start()
+        warmup = Candidate('warmup-' + email, resume, answers)
+        warmup.run()
+        gc.collect()
+        result['session_bytes'] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del warmup
+        metrics.recorder.drain()
+
+        candidate = Candidate(email, resume, answers)
+        barrier.wait()
+        try:
+            candidate.run()
+        finally:
+            result['timings'] = candidate.timings
+            result['db_calls'] = [(row[0], row[2], row[3]) for row in metrics.recorder.drain()
+                                  if row[0].startswith(('db.', 'session.'))]
+        result['stored'] = len(open_session_store().load(candidate.at.query_params.get('sid', '')) or b'')
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+        barrier.abort()
+    results.put(result)
+
+
+def run_level(level, resume, args, cpus):
+    context = multiprocessing.get_context('spawn')
+    barrier = context.Barrier(level)
+    results = context.Queue()
+    processes = [
+        context.Process(target=candidate_process,
+                        args=(f"candidate{n}@load.local", resume, args.answers, args.llm_latency_ms / 1000, cpus,
+                              barrier, results))
+        for n in range(level)
+    ]
+    for process in processes:
+        process.start()
+    candidates = [results.get(timeout=600) for _ in processes]
+    for process in processes:
+        process.join(timeout=10)
+    return candidates
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--levels', default='1,2,4,8', help="Comma-separated numbers of simultaneous candidates")
+    parser.add_argument('--answers', type=int, default=4)
+    parser.add_argument('--cpus', type=int, default=1, help="CPUs the candidates share (0: no pinning)")
+    parser.add_argument('--llm-latency-ms', type=float, default=0, help="Simulated network time per model call")
+    parser.add_argument('--verbose', action='store_true', help="Per-action latencies for every level")
+    args = parser.parse_args(argv)
+    levels = [int(level) for level in args.levels.split(',')]
+
+    # Inherited by the candidate processes, before any of them imports vintervu
+    workdir = tempfile.mkdtemp(prefix='vintervu-load-')
+    os.environ['VINTERVU_DB_PATH'] = os.path.join(workdir, 'vintervu.db')
+    os.environ.pop('VINTERVU_SESSION_STORE', None)
+    os.chdir(workdir)
+
+    from vintervu import db
+    from vintervu.metrics import percentile
+
+    from .synthetic import make_docx, resume_paragraphs
+
+    db.init_database()
+    for n in range(max(levels)):
+        for email in [f"candidate{n}@load.local", f"warmup-candidate{n}@load.local"]:
+            db.register_user(email.split('@')[0], email, PASSWORD)
+    resume = make_docx(resume_paragraphs(30))
+    cpus = None
+    if args.cpus and hasattr(os, 'sched_getaffinity'):
+        cpus = set(sorted(os.sched_getaffinity(0))[:args.cpus])
+
+    print(f"{'users':>5} {'rerun p50':>9} {'p95':>6} {'p99':>6} {'max':>6}  "
+          f"{'db p95':>6} {'db max':>6} {'db fail':>7}  {'KB/session':>10} {'stored KB':>9}  errors")
+    for level in levels:
+        candidates = run_level(level, resume, args, cpus)
+        timings = [timing for candidate in candidates for timing in candidate['timings']]
+        reruns = sorted(seconds for _, seconds in timings) or [0]
+        db_calls = [call for candidate in candidates for call in candidate['db_calls']]
+        db_seconds = sorted(seconds for _, seconds, _ in db_calls) or [0]
+        errors = [candidate['error'] for candidate in candidates if candidate['error']]
+        print(f"{level:>5} {statistics.median(reruns) * 1000:>9.0f} {percentile(reruns, 0.95) * 1000:>6.0f} "
+              f"{percentile(reruns, 0.99) * 1000:>6.0f} {reruns[-1] * 1000:>6.0f}  "
+              f"{percentile(db_seconds, 0.95) * 1000:>6.1f} {db_seconds[-1] * 1000:>6.1f} "
+              f"{sum(1 for _, _, ok in db_calls if not ok):>7}  "
+              f"{statistics.mean(candidate['session_bytes'] for candidate in candidates) / 1024:>10.0f} "
+              f"{statistics.mean(candidate['stored'] for candidate in candidates) / 1024:>9.1f}  {len(errors)}")
+        for error in errors[:3]:
+            print(f"        {error}")
+        if args.verbose:
+            for action in ACTIONS:
+                print(f"        {action:<10} {percentiles([s for a, s in timings if a == action])}")
+    print("(rerun times in ms; db = SQLite and session store calls, including lock waits)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,234 @@
+"""Serve each user's reruns from a different app process in turn.
+
+    python -m benchmarks.bench_session_store [--replicas 3] [--users 4] [--answers 6] [--store URL]
+
+Starts --replicas processes that each run the app under Streamlit's AppTest,
+as separate servers behind a load balancer would. Every simulated user logs
+in on one replica, and each following request (open the interview, submit
+an answer) goes to the next replica round-robin as a brand-new connection
+from the user's browser (its XSRF cookie, re-masked each time, and
+User-Agent) that only carries the ``sid`` query parameter. The run fails
+unless every request continues exactly where the previous one, on another
+process, left off, and unless:
+- the same ``sid`` opened from another browser gets a new, logged-out
+  session, and the owner's session is untouched by it;
+- a session grown past VINTERVU_SESSION_MAX_KB is not stored, and what is
+  stored stays under the limit.
+Gemini is not installed here, so answers are scored by the app's offline
+fallback.
+"""
+import argparse
+import multiprocessing
+import os
+import secrets
+import statistics
+import tempfile
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(REPO_ROOT, 'vintervu-improved.py')
+
+QUESTIONS = [f"Question {n}: how would you design part {n} of the system?" for n in range(1, 13)]
+
+
+def seed_interview(sid, questions=QUESTIONS):
+    """Give a logged-in stored session an interview with questions, as Resume Upload would"""
+    from vintervu.interview import InterviewSession
+    from vintervu.session_store import decode, encode, open_session_store
+
+    store = open_session_store()
+    state = decode(store.load(sid))
+    interview = InterviewSession()
+    interview.load_profile(['Python', 'SQL'], [], 'Computer Science', 'offline-key')
+    interview.start(questions)
+    state['interview'] = interview.to_dict()
+    store.save(sid, encode(state))
+
+
+def stored_session(sid):
+    from vintervu.session_store import open_session_store
+    return open_session_store().load(sid)
+
+
+def new_browser(number):
+    return {'token': secrets.token_bytes(16), 'agent': f"Mozilla/5.0 (bench browser {number})"}
+
+
+def browser_context(browser):
+    """The client context Streamlit reads st.context from, as this browser would send it"""
+    # Streamlit re-masks the same XSRF token every time it writes the cookie
+    mask = secrets.token_bytes(len(browser['token']))
+    masked = bytes(a ^ b for a, b in zip(mask, browser['token']))
+    cookie = f"2|{mask.hex()}|{masked.hex()}|{int(time.time())}"
+    return SimpleNamespace(headers=[('User-Agent', browser['agent'])], cookies={'_streamlit_xsrf': cookie})
+
+
+def handle(request):
+    """One request as a new connection from the request's browser; returns what the replica saw"""
+    from streamlit.runtime import context
+
+    with mock.patch.object(context, '_get_client_context', return_value=browser_context(request['browser'])):
+        return run_request(request)
+
+
+def run_request(request):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP, default_timeout=60)
+    if request['sid']:
+        at.query_params['sid'] = request['sid']
+    at.run()
+    if request['action'] == 'visit':
+        pass
+    elif request['action'] == 'login':
+        at.switch_page('app_pages/login.py').run()
+        at.text_input[0].input(request['email'])
+        at.text_input[1].input('password1')
+        at.button[0].click().run()
+    else:
+        at.switch_page('app_pages/interview.py').run()
+        if at.text_input:
+            # API keys are not stored with the session, so each new connection asks again
+            at.text_input[0].input('offline-key').run()
+        if request['action'] == 'answer':
+            at.text_area[0].input(f"Answer from {request['email']} #{request['step']}")
+            next(button for button in at.button if button.label.startswith("📝")).click().run()
+    interview = at.session_state.interview
+    return {
+        'sid': at.query_params.get('sid'),
+        'logged_in': at.session_state.logged_in,
+        'index': interview.index,
+        'answers': len(interview.feedback),
+        'warnings': [str(w.value) for w in at.warning],
+        'exceptions': [str(e.value) for e in at.exception],
+    }
+
+
+def replica(number, requests, results):
+    os.chdir(tempfile.gettempdir())
+    while True:
+        request = requests.get()
+        if request is None:
+            return
+        start = time.perf_counter()
+        try:
+            result = handle(request)
+        except Exception as e:
+            result = {'exceptions': [f"{type(e).__name__}: {e}"]}
+        result.update(user=request['user'], replica=number, seconds=time.perf_counter() - start)
+        results.put(result)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--replicas', type=int, default=3)
+    parser.add_argument('--users', type=int, default=4)
+    parser.add_argument('--answers', type=int, default=6)
+    parser.add_argument('--store', default='', help="VINTERVU_SESSION_STORE for the replicas (default: SQLite)")
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix='vintervu-sessions-')
+    # Inherited by the replica processes
+    os.environ['VINTERVU_DB_PATH'] = os.path.join(workdir, 'vintervu.db')
+    os.environ['VINTERVU_SESSION_STORE'] = args.store
+    from vintervu import db
+    db.init_database()
+    users = [f"user{n}@example.com" for n in range(args.users)]
+    for email in users:
+        db.register_user(email.split('@')[0], email, 'password1')
+
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    queues = [context.Queue() for _ in range(args.replicas)]
+    processes = [context.Process(target=replica, args=(n, queues[n], results), daemon=True)
+                 for n in range(args.replicas)]
+    for process in processes:
+        process.start()
+
+    from vintervu.session_store import MAX_SESSION_BYTES, decode
+
+    sids = {email: None for email in users}
+    browsers = {email: new_browser(n) for n, email in enumerate(users)}
+    steps = ['login', 'open'] + ['answer'] * args.answers
+    latencies = []
+    failures = []
+    served = [0] * args.replicas
+
+    def serve(batch):
+        """Send each ``(replica, request)`` and return the results by user"""
+        for number, request in batch:
+            queues[number % args.replicas].put(request)
+        collected = {}
+        for _ in batch:
+            result = results.get(timeout=300)
+            served[result['replica']] += 1
+            latencies.append(result['seconds'])
+            collected[result['user']] = result
+        return collected
+
+    def check(result, what, expected):
+        seen = {key: result.get(key) for key in expected}
+        if result['exceptions'] or seen != expected:
+            failures.append(f"{result['user']} {what} on replica {result['replica']}: "
+                            f"expected {expected}, got {seen} {result['exceptions'][:1]}")
+
+    def request(email, action, step, browser=None):
+        return {'user': email, 'email': email, 'sid': sids[email], 'action': action, 'step': step,
+                'browser': browser or browsers[email]}
+
+    try:
+        for step, action in enumerate(steps):
+            # Users make their requests concurrently, each to the replica after the one it used last
+            done = serve([(step + n, request(email, action, step)) for n, email in enumerate(users)])
+            for email, result in done.items():
+                answered = max(0, step - 1) if action == 'answer' else 0
+                check(result, f"step {step} ({action})", {'logged_in': True, 'answers': answered, 'index': answered})
+                sids[email] = result.get('sid')
+                if action == 'login' and sids[email]:
+                    seed_interview(sids[email])
+
+        # Each user's link opened in a stranger's browser, then again by its owner
+        stolen = serve([(n, request(email, 'visit', 'stolen', new_browser(len(users) + n)))
+                        for n, email in enumerate(users)])
+        for email, result in stolen.items():
+            check(result, "sid in another browser", {'logged_in': False, 'answers': 0})
+            if result.get('sid') == sids[email]:
+                failures.append(f"{email}: another browser kept the sid {sids[email]}")
+        owners = serve([(n + 1, request(email, 'open', 'owner')) for n, email in enumerate(users)])
+        for email, result in owners.items():
+            check(result, "owner after another browser",
+                  {'logged_in': True, 'answers': args.answers, 'index': args.answers})
+
+        # Answering a question this long takes the session past the limit
+        email = users[0]
+        padding = MAX_SESSION_BYTES - len(stored_session(sids[email])) - 1024
+        seed_interview(sids[email], [f"{QUESTIONS[0]} {'x' * padding}"] + QUESTIONS[1:])
+        before = stored_session(sids[email])
+        result = serve([(0, request(email, 'answer', 'oversized'))])[email]
+        check(result, "oversized answer", {'logged_in': True, 'answers': 1})
+        after = stored_session(sids[email])
+        if not any('limit' in warning for warning in result['warnings']):
+            failures.append(f"{email}: no warning for a session over {MAX_SESSION_BYTES // 1024}KB")
+        if after != before or decode(after)['interview']['index'] != 0 or len(after) > MAX_SESSION_BYTES:
+            failures.append(f"{email}: a session over {MAX_SESSION_BYTES // 1024}KB was stored")
+    finally:
+        for queue in queues:
+            queue.put(None)
+        for process in processes:
+            process.join(timeout=10)
+
+    latencies.sort()
+    print(f"{len(latencies)} requests from {args.users} users over {args.replicas} replicas "
+          f"(served per replica: {', '.join(map(str, served))})")
+    print(f"request time: p50={statistics.median(latencies) * 1000:.0f}ms "
+          f"p95={latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000:.0f}ms")
+    if failures:
+        raise SystemExit("FAIL:\n  " + "\n  ".join(failures[:10]))
+    print("every request continued the session another replica left; other browsers and oversized "
+          "sessions were refused")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""Synthetic resume documents and answer audio for benchmarks."""
+import io
+import math
+import random
+import struct
+import zipfile
+from xml.sax.saxutils import escape
+
+SKILLS = [
+    'Python', 'Java', 'SQL', 'Docker', 'Kubernetes', 'React', 'TensorFlow', 'AWS', 'Linux',
+    'Pandas', 'Flask', 'Django', 'PostgreSQL', 'Terraform', 'JavaScript', 'C++', 'Git',
+]
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    '</Relationships>'
+)
+_W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+
+def resume_paragraphs(count: int, seed: int = 0) -> list:
+    """Plausible resume lines mentioning a random mix of skills"""
+    rng = random.Random(seed)
+    lines = ["Jane Candidate - Software Engineer", "Skills: " + ", ".join(rng.sample(SKILLS, 8))]
+    for i in range(count):
+        used = ", ".join(rng.sample(SKILLS, 3))
+        lines.append(f"Project {i + 1}: Built a service handling {rng.randint(1, 900)}k requests/day "
+                     f"using {used}; improved latency by {rng.randint(5, 60)}%.")
+    return lines
+
+
+def make_docx(paragraphs: list, header: str = "") -> bytes:
+    """Minimal but valid DOCX containing one run per paragraph"""
+    body = "".join(f'<w:p><w:r><w:t xml:space="preserve">{escape(line)}</w:t></w:r></w:p>'
+                   for line in paragraphs)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as docx:
+        docx.writestr('[Content_Types].xml', _CONTENT_TYPES)
+        docx.writestr('_rels/.rels', _RELS)
+        docx.writestr('word/document.xml',
+                      f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                      f'<w:document xmlns:w="{_W}"><w:body>{body}</w:body></w:document>')
+        if header:
+            docx.writestr('word/header1.xml',
+                          f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                          f'<w:hdr xmlns:w="{_W}"><w:p><w:r><w:t>{escape(header)}</w:t></w:r></w:p></w:hdr>')
+    return buffer.getvalue()
+
+
+def make_pdf(pages: list) -> bytes:
+    """Minimal uncompressed PDF with one Helvetica text block per page"""
+    objects = [b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>", None]
+    pages_id = 2
+    kids = []
+    for page in pages:
+        lines = b"".join(b"(%s) Tj T* " % _pdf_string(line) for line in page)
+        stream = b"BT /F1 10 Tf 12 TL 50 750 Td " + lines + b"ET"
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 792] "
+                       b"/Resources << /Font << /F1 1 0 R >> >> /Contents %d 0 R >>"
+                       % (pages_id, len(objects)))
+        kids.append(len(objects))
+    objects[pages_id - 1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % kid for kid in kids), len(kids))
+    objects.append(b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id)
+    return write_pdf(objects, root=len(objects))
+
+
+def write_pdf(objects: list, root: int) -> bytes:
+    """Serialise numbered PDF objects with a correct xref table"""
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, root, xref)
+    return out
+
+
+def resume_pdf_pages(page_count: int, seed: int = 0, lines_per_page: int = 45) -> list:
+    """Resume lines split into ``page_count`` pages"""
+    lines = resume_paragraphs(page_count * lines_per_page, seed)
+    return [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)][:page_count]
+
+
+def _pdf_string(text: str) -> bytes:
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)').encode('latin-1', 'replace')
+
+
+def answer_pcm(bursts: int = 4, seed: int = 0, rate: int = 16000, lead_in: float = 2.5) -> bytes:
+    """16-bit mono PCM shaped like a spoken answer: quiet room, then voiced bursts separated by pauses"""
+    rng = random.Random(seed)
+    samples = []
+
+    def noise(seconds, level=60):
+        samples.extend(int(rng.gauss(0, level)) for _ in range(int(seconds * rate)))
+
+    noise(lead_in)
+    for _ in range(bursts):
+        pitch = rng.uniform(110, 220)
+        for i in range(int(rng.uniform(1.0, 3.0) * rate)):
+            # A few harmonics with a slow syllable-like envelope
+            t = i / rate
+            envelope = 0.6 + 0.4 * math.sin(2 * math.pi * 4 * t)
+            value = sum(math.sin(2 * math.pi * pitch * k * t) / k for k in (1, 2, 3))
+            samples.append(int(5000 * envelope * value + rng.gauss(0, 60)))
+        noise(rng.uniform(0.9, 1.5))
+    noise(1.0)
+    clipped = (max(-32768, min(32767, value)) for value in samples)
+    return struct.pack(f'<{len(samples)}h', *clipped)
+
@@ -0,0 +1,10 @@
+import pytest
+
+from vintervu import db
+
+
+@pytest.fixture(scope='session', autouse=True)
+def scratch_database(tmp_path_factory):
+    """Timed calls are flushed to the database, also at exit; keep them out of the working directory"""
+    db.DB_PATH = str(tmp_path_factory.mktemp('db') / 'vintervu.db')
+    db.init_database()
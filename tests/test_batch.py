@@ -0,0 +1,71 @@
+"""``python -m vintervu.batch`` on synthetic resumes, with the stub model."""
+import json
+import threading
+
+import pytest
+
+from benchmarks.synthetic import make_docx, resume_paragraphs
+from vintervu import batch, llm
+from vintervu.stubs import stub_model_factory
+
+
+@pytest.fixture
+def resumes(tmp_path):
+    llm.set_model_factory(stub_model_factory())
+    directory = tmp_path / 'resumes'
+    directory.mkdir()
+    for n in range(6):
+        (directory / f'resume-{n}.docx').write_bytes(make_docx(resume_paragraphs(5, seed=n)))
+    yield directory
+    llm.set_model_factory(None)
+
+
+def rows(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_restart_overwrites_the_output(resumes, tmp_path):
+    output = tmp_path / 'results.jsonl'
+    args = [str(resumes), '--output', str(output), '--api-key', 'stub-key', '--workers', '1']
+    assert batch.main(args) == 0
+    assert batch.main(args) == 0
+    assert len(rows(output)) == 6
+
+    assert batch.main(args + ['--restart']) == 0
+    assert sorted(row['file'] for row in rows(output)) == batch.find_resumes(str(resumes))
+
+
+def test_restart_writes_the_csv_header_again(resumes, tmp_path):
+    output = tmp_path / 'results.csv'
+    args = [str(resumes), '--output', str(output), '--api-key', 'stub-key', '--workers', '1', '--restart']
+    assert batch.main(args) == 0
+    assert batch.main(args) == 0
+    lines = output.read_text().splitlines()
+    assert lines[0].startswith('file,status') and len(lines) == 7
+
+
+class FailingWriter:
+    def __init__(self):
+        self.written = []
+
+    def write(self, row):
+        if len(self.written) % 2:
+            raise OSError("disk full")
+        self.written.append(row)
+
+    def close(self):
+        pass
+
+
+def test_a_row_that_cannot_be_written_counts_as_failed(resumes):
+    paths = batch.find_resumes(str(resumes))
+    writer = FailingWriter()
+    # More resumes than the queue holds, so a dead LLM worker would block extraction for good
+    results = []
+    runner = threading.Thread(target=lambda: results.extend(
+        batch.run_batch(paths, 'stub-key', writer, workers=1, llm_concurrency=1)), daemon=True)
+    runner.start()
+    runner.join(timeout=30)
+    assert not runner.is_alive()
+    assert len(results) == len(paths)
+    assert sum(t['status'] == 'ok' for t in results) == len(writer.written) == 1
@@ -0,0 +1,126 @@
+"""Browser uploads: chunk and upload format, seq/ack, duplicates and the final chunk."""
+import json
+import math
+import os
+import shutil
+import struct
+import subprocess
+
+import pytest
+
+from vintervu import speech
+from vintervu.browser_audio import (
+    SAMPLE_RATE, BrowserAudioSource, decode_chunk, encode_chunk, encode_upload, parse_upload
+)
+from vintervu.stubs import StubOrchestrator
+
+ADPCM_JS = os.path.join(os.path.dirname(__file__), '..', 'vintervu', 'components', 'browser_recorder', 'adpcm.js')
+
+
+def tone(seconds, amplitude=8000):
+    count = int(SAMPLE_RATE * seconds)
+    return struct.pack(f'<{count}h', *(int(amplitude * math.sin(i / 5) * math.sin(i / 900)) for i in range(count)))
+
+
+def encode_chunks(pcm, chunk_seconds=0.5):
+    size = int(SAMPLE_RATE * chunk_seconds) * 2
+    chunks, state = [], None
+    for seq, start in enumerate(range(0, len(pcm), size)):
+        data, state = encode_chunk(pcm[start:start + size], state)
+        chunks.append({'seq': seq, 'data': data})
+    return chunks
+
+
+def test_chunks_are_a_quarter_of_the_pcm_and_decode_close_to_it():
+    pcm = tone(2)
+    chunks = encode_chunks(pcm)
+    assert len(pcm) / sum(len(chunk['data']) for chunk in chunks) > 3.9
+    decoded = b"".join(decode_chunk(chunk['data']) for chunk in chunks)
+    assert len(decoded) == len(pcm)
+    original = struct.unpack(f'<{len(pcm) // 2}h', pcm)
+    error = sum((a - b) ** 2 for a, b in zip(original, struct.unpack(f'<{len(decoded) // 2}h', decoded)))
+    assert 10 * math.log10(sum(a * a for a in original) / error) > 20
+
+
+def test_malformed_chunks_are_rejected():
+    with pytest.raises(ValueError):
+        decode_chunk(b"\x00")
+    with pytest.raises(ValueError):
+        decode_chunk(b"\x00\x00\xff" + b"\x00" * 10)
+    with pytest.raises(ValueError):
+        decode_chunk(b"\x00\x00\x00" + b"\x00" * 100, max_bytes=100)
+
+
+def test_upload_round_trip():
+    chunks = encode_chunks(tone(1.2))
+    upload = parse_upload(encode_upload('abc', chunks, 2))
+    assert upload == {'capture': 'abc', 'chunks': chunks, 'last_seq': 2}
+    assert parse_upload(encode_upload('abc', chunks[:1]))['last_seq'] is None
+    with pytest.raises(ValueError):
+        parse_upload(encode_upload('abc', chunks)[:-1])
+    with pytest.raises(ValueError):
+        parse_upload(b"\x09abc")
+
+
+def test_chunks_are_taken_in_order_once():
+    pcm = tone(2.5)
+    chunks = encode_chunks(pcm)
+    source = BrowserAudioSource('c1')
+    assert source.receive(chunks[:2]) == 1
+    # A resend of acknowledged chunks only adds the new one
+    assert source.receive(chunks[:3]) == 2
+    # A gap stops there until the missing chunk is resent
+    assert source.receive(chunks[4:5]) == 2
+    assert source.receive([chunks[4], chunks[3]]) == 4
+    assert source.received_bytes == len(pcm)
+    assert not source.closed
+    assert source.read(len(pcm) // 2) == b"".join(decode_chunk(chunk['data']) for chunk in chunks)
+
+
+def test_final_chunk_closes_the_stream():
+    chunks = encode_chunks(tone(1.5))
+    source = BrowserAudioSource('c2')
+    # The last seq is known before every chunk is in
+    source.receive(chunks[:1], last_seq=2)
+    assert not source.closed
+    source.receive(chunks, last_seq=2)
+    assert source.closed
+    source.read(SAMPLE_RATE * 2)
+    assert source.read(1024) == b""
+
+
+def test_capture_limit_closes_the_stream():
+    source = BrowserAudioSource('c3', max_bytes=SAMPLE_RATE * 2)
+    with pytest.raises(ValueError):
+        source.receive(encode_chunks(tone(1.5)))
+    assert source.closed
+
+
+def test_uploaded_answer_is_transcribed():
+    source = BrowserAudioSource('c4')
+    source.receive(encode_chunks(bytes(SAMPLE_RATE) + tone(1.5) + bytes(SAMPLE_RATE * 2)), last_seq=6)
+    calibration = speech.CalibrationCache()
+    calibration.store(None, 300)
+    statuses = []
+    text = speech.speech_to_text_enhanced(report=lambda status, message: statuses.append(status),
+                                          calibration=calibration, orchestrator=StubOrchestrator(), source=source)
+    assert text and statuses[-1] == speech.DONE
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason="needs node to run the component's encoder")
+def test_browser_encoder_matches_the_server():
+    samples = list(struct.unpack(f'<{SAMPLE_RATE // 2}h', tone(0.5, 20000)))
+    halves = [samples[:3001], samples[3001:]]
+    script = (f"const {{adpcmEncode}} = require({json.dumps(os.path.abspath(ADPCM_JS))});"
+              "const halves = JSON.parse(require('fs').readFileSync(0, 'utf8'));"
+              "let state = [0, 0];"
+              "console.log(JSON.stringify(halves.map((half) => {"
+              "  const chunk = adpcmEncode(Int16Array.from(half), state); state = chunk.state;"
+              "  return Buffer.from(chunk.bytes).toString('hex'); })));")
+    result = subprocess.run(['node', '-e', script], input=json.dumps(halves), capture_output=True, text=True,
+                            check=True)
+    expected, state = [], None
+    for half in halves:
+        data, state = encode_chunk(struct.pack(f'<{len(half)}h', *half), state)
+        expected.append(data.hex())
+    assert json.loads(result.stdout) == expected
@@ -0,0 +1,89 @@
+"""Capture from recorded sources through ``speech_to_text_enhanced``, with the stub recognizer."""
+import math
+import struct
+import threading
+import time
+import wave
+
+import speech_recognition as sr
+
+from vintervu import speech
+from vintervu.stubs import StubOrchestrator
+
+RATE = 16000
+
+
+def pcm(seconds, amplitude=0):
+    return b"".join(struct.pack('<h', int(amplitude * math.sin(i / 5))) for i in range(int(RATE * seconds)))
+
+
+def write_wav(path, *parts):
+    with wave.open(str(path), 'wb') as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(RATE)
+        out.writeframes(b"".join(parts))
+    return str(path)
+
+
+def capture(source, stop_event=None):
+    calibration = speech.CalibrationCache()
+    calibration.store(None, 300)
+    statuses, recorded = [], []
+    text = speech.speech_to_text_enhanced(stop_event, lambda status, message: statuses.append(status), calibration,
+                                          orchestrator=StubOrchestrator(), source=source, on_audio=recorded.append)
+    seconds = len(recorded[0].frame_data) / (RATE * 2) if recorded else 0
+    return text, statuses[-1], seconds
+
+
+class SilentMicrophone(sr.AudioSource):
+    """Silence delivered in real time, like a microphone nobody speaks into"""
+    SAMPLE_RATE = RATE
+    SAMPLE_WIDTH = 2
+    CHUNK = 1024
+
+    def __init__(self):
+        self.stream = self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def read(self, size):
+        time.sleep(size / RATE)
+        return bytes(size * 2)
+
+
+def test_audio_file(tmp_path):
+    path = write_wav(tmp_path / 'answer.wav', pcm(0.5), pcm(1.5, 8000), pcm(1))
+    started = time.monotonic()
+    text, status, seconds = capture(sr.AudioFile(path))
+    assert text and status == speech.DONE
+    assert seconds >= 1.5
+    assert time.monotonic() - started < 5
+
+
+def test_click_before_speech(tmp_path):
+    path = write_wav(tmp_path / 'click.wav', pcm(0.1, 8000), pcm(0.5), pcm(1.5, 8000), pcm(1))
+    text, status, seconds = capture(sr.AudioFile(path))
+    assert text and status == speech.DONE
+    assert seconds >= 1.5
+
+
+def test_no_speech_times_out_in_audio_time(tmp_path):
+    path = write_wav(tmp_path / 'silence.wav', pcm(speech.LISTEN_TIMEOUT + 2))
+    started = time.monotonic()
+    text, status, _ = capture(sr.AudioFile(path))
+    assert text == "" and status == speech.FAILED
+    assert time.monotonic() - started < 5
+
+
+def test_stop_before_speech():
+    stop_event = threading.Event()
+    threading.Timer(0.3, stop_event.set).start()
+    started = time.monotonic()
+    text, status, _ = capture(SilentMicrophone(), stop_event)
+    assert text == "" and status == speech.STOPPED
+    assert time.monotonic() - started < 1
@@ -0,0 +1,54 @@
+"""Per-user daily token spending, against the test database."""
+import threading
+
+from vintervu import db, usage
+
+
+def spend(email, tokens):
+    usage.set_context(email, 'interview-1')
+    usage.record('evaluate', 'stub', tokens, 0, 0.1)
+
+
+def test_unwritten_calls_count_without_a_write(monkeypatch):
+    writes = []
+    monkeypatch.setattr(usage.calls, 'sink', writes.append)
+    spend('unwritten@test.local', 120)
+    spend('someone-else@test.local', 999)
+    assert usage.spent_today('unwritten@test.local') == 120
+    assert writes == []
+
+
+def test_flushed_calls_are_not_counted_twice(monkeypatch):
+    spend('flushed@test.local', 100)
+    usage.calls.flush()
+    spend('flushed@test.local', 20)
+    assert usage.spent_today('flushed@test.local') == 120
+
+    # Read again after a flush, and once while one is being written
+    monkeypatch.setattr(usage, 'BUDGET_REFRESH_SECONDS', 0)
+    usage.calls.flush()
+    assert usage.spent_today('flushed@test.local') == 120
+
+    writing, done = threading.Event(), threading.Event()
+
+    def slow_write(rows):
+        writing.set()
+        done.wait(5)
+        db.insert_llm_usage(rows)
+
+    monkeypatch.setattr(usage.calls, 'sink', slow_write)
+    spend('flushed@test.local', 3)
+    flush = threading.Thread(target=usage.calls.flush)
+    flush.start()
+    writing.wait(5)
+    assert usage.spent_today('flushed@test.local') == 123
+    done.set()
+    flush.join()
+    assert usage.spent_today('flushed@test.local') == 123
+
+
+def test_calls_between_reads_are_counted_locally():
+    assert usage.spent_today('local@test.local') == 0
+    spend('local@test.local', 40)
+    spend('local@test.local', 2)
+    assert usage.spent_today('local@test.local') == 42
@@ -0,0 +1 @@
+"""Shared, UI-independent building blocks for the VIntervu Streamlit app."""
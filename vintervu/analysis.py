@@ -0,0 +1,110 @@
+"""Role matching and branch inference for analysed resumes."""
+from .llm import extract_skills_and_projects_with_gemini
+
+
+def infer_branch(skills):
+    skill_set = set([skill.lower() for skill in skills])
+    
+    if any(skill in skill_set for skill in ['python', 'java', 'c++', 'javascript', 'sql', 'machine learning', 'aws', 'react', 'nodejs']):
+        return 'Computer Science'
+    elif any(skill in skill_set for skill in ['matlab', 'vlsi', 'analog circuits', 'digital logic', 'embedded']):
+        return 'Electronics'
+    elif any(skill in skill_set for skill in ['plc', 'scada', 'power systems', 'control systems']):
+        return 'Electrical'
+    elif any(skill in skill_set for skill in ['autocad', 'staad', 'concrete', 'structural']):
+        return 'Civil'
+    elif any(skill in skill_set for skill in ['thermodynamics', 'fluid mechanics', 'mechanical design']):
+        return 'Mechanical'
+    else:
+        return 'General Engineering'
+
+
+ROLE_SKILLS = {
+    'data scientist': ['python', 'machine learning', 'data analysis', 'pandas', 'numpy', 'tensorflow', 'statistics'],
+    'machine learning engineer': ['python', 'machine learning', 'tensorflow', 'scikit-learn', 'deep learning', 'pytorch'],
+    'ai engineer': ['python', 'neural networks', 'nlp', 'computer vision', 'tensorflow', 'keras', 'pytorch'],
+    'web developer': ['html', 'css', 'javascript', 'react', 'nodejs', 'express', 'mongodb'],
+    'frontend developer': ['html', 'css', 'javascript', 'react', 'redux', 'tailwind'],
+    'backend developer': ['python', 'flask', 'django', 'rest api', 'postgresql', 'mysql'],
+    'full stack developer': ['html', 'css', 'javascript', 'nodejs', 'react', 'mongodb', 'express', 'flask'],
+    'software engineer': ['data structures', 'algorithms', 'oop', 'python', 'java', 'c++'],
+    'data analyst': ['excel', 'sql', 'power bi', 'tableau', 'python', 'pandas'],
+    'devops engineer': ['linux', 'docker', 'kubernetes', 'jenkins', 'aws', 'terraform', 'ci/cd'],
+    'cloud engineer': ['aws', 'azure', 'gcp', 'devops', 'linux', 'cloudformation'],
+    'mobile app developer': ['flutter', 'react native', 'android', 'ios', 'dart', 'kotlin', 'swift'],
+}
+
+SKILL_SUGGESTIONS = {
+    'python': 'Enhance Python by building small projects or solving problems on LeetCode.',
+    'machine learning': 'Take an ML course on Coursera or Udemy and build projects.',
+    'tensorflow': 'Practice TensorFlow by building a neural network model.',
+    'docker': 'Learn Docker by containerizing a sample application.',
+    'aws': 'Start with AWS Free Tier and deploy a basic application.',
+    'html': 'Build a simple portfolio website to showcase your HTML/CSS skills.',
+    'javascript': 'Make interactive web pages with JS, like a calculator or to-do list.',
+    'react': 'Build a React-based UI project like a blog or resume site.',
+    'sql': 'Practice SQL queries using online playgrounds like Mode Analytics or W3Schools.',
+}
+
+JOB_ROLES = [
+    "data scientist", "machine learning engineer", "ai engineer", "web developer",
+    "frontend developer", "backend developer", "full stack developer", "software engineer",
+    "data analyst", "devops engineer", "cloud engineer", "mobile app developer",
+    "android developer", "ios developer", "ui ux designer", "qa engineer",
+    "security analyst", "network engineer", "blockchain developer", "game developer",
+    "database administrator"
+]
+
+
+def score_resume_for_role(resume_skills, job_role):
+    """Score already-extracted (lowercased) resume skills against one job role"""
+    resume_skills = set(resume_skills)
+    required_skills = ROLE_SKILLS.get(job_role.lower(), [])
+    
+    found_skills = [skill for skill in required_skills if skill in resume_skills]
+    missing_skills = [skill for skill in required_skills if skill not in resume_skills]
+    
+    score = (len(found_skills) / len(required_skills)) * 100 if required_skills else 0
+    
+    suggestions = [
+        SKILL_SUGGESTIONS.get(skill, f"Consider learning {skill} to improve your profile.")
+        for skill in missing_skills[:5]
+    ]
+    
+    return {
+        'role': job_role,
+        'score': round(score, 2),
+        'found_keywords': found_skills,
+        'missing_keywords': missing_skills,
+        'suggestions': suggestions
+    }
+
+
+def analyze_resume_for_job(resume_text, job_role, api_key):
+    extracted_data = extract_skills_and_projects_with_gemini(resume_text, api_key)
+    resume_skills = [skill.lower() for skill in extracted_data['skills']]
+    return score_resume_for_role(resume_skills, job_role)
+
+
+def analyze_resume_for_all_roles(resume_text, api_key, job_roles=JOB_ROLES):
+    """Extract skills once and score the resume against every job role"""
+    extracted_data = extract_skills_and_projects_with_gemini(resume_text, api_key)
+    return score_resume_profile(extracted_data, job_roles)['roles']
+
+
+def rank_role_analyses(analyses):
+    """Order per-role analyses by match score, then by number of skills found"""
+    return sorted(
+        analyses.values(),
+        key=lambda analysis: (analysis['score'], len(analysis['found_keywords'])),
+        reverse=True
+    )
+
+
+def score_resume_profile(profile: dict, job_roles=JOB_ROLES) -> dict:
+    """Branch and per-role scores for an already-extracted resume profile"""
+    resume_skills = {skill.lower() for skill in profile['skills']}
+    return {
+        'branch': infer_branch(profile['skills']),
+        'roles': {role: score_resume_for_role(resume_skills, role) for role in job_roles}
+    }
@@ -0,0 +1,79 @@
+"""Content-addressed, FLAC-compressed storage for answer audio.
+
+Every captured answer is kept so it can be re-transcribed later with a
+better engine. Files are named by the SHA-256 of their PCM samples (plus
+sample rate and width), so the same recording is only stored once and a
+reference can be checked against the file it points to. FLAC is lossless:
+loading a reference gives back exactly the samples that were recognised.
+"""
+import hashlib
+import os
+import re
+import tempfile
+
+import speech_recognition as sr
+
+DEFAULT_ROOT = os.environ.get('VINTERVU_AUDIO_DIR', 'audio_archive')
+
+_REF = re.compile(r'^[0-9a-f]{64}$')
+
+
+def audio_ref(audio: sr.AudioData) -> str:
+    """Content hash identifying ``audio``"""
+    digest = hashlib.sha256(f"{audio.sample_rate}:{audio.sample_width}:".encode())
+    digest.update(audio.frame_data)
+    return digest.hexdigest()
+
+
+class AudioArchive:
+    """FLAC files under ``root``, fanned out by the first two hex digits of their reference"""
+
+    def __init__(self, root=DEFAULT_ROOT):
+        self.root = root
+
+    def path(self, ref: str) -> str:
+        if not _REF.match(ref or ''):
+            raise ValueError(f"Invalid audio reference: {ref!r}")
+        return os.path.join(self.root, ref[:2], f"{ref}.flac")
+
+    def __contains__(self, ref):
+        try:
+            return os.path.exists(self.path(ref))
+        except ValueError:
+            return False
+
+    def store(self, audio: sr.AudioData) -> str:
+        """Archive ``audio`` unless it is already there and return its reference"""
+        ref = audio_ref(audio)
+        path = self.path(ref)
+        if os.path.exists(path):
+            return ref
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write beside the target and rename, so readers never see half a file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(audio.get_flac_data())
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return ref
+
+    def load(self, ref: str) -> sr.AudioData:
+        with sr.AudioFile(self.path(ref)) as source:
+            return sr.Recognizer().record(source)
+
+    def refs(self):
+        """Every reference in the archive"""
+        if not os.path.isdir(self.root):
+            return
+        for prefix in sorted(os.listdir(self.root)):
+            directory = os.path.join(self.root, prefix)
+            if not os.path.isdir(directory):
+                continue
+            for name in sorted(os.listdir(directory)):
+                ref, ext = os.path.splitext(name)
+                if ext == '.flac' and _REF.match(ref):
+                    yield ref
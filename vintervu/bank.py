@@ -0,0 +1,86 @@
+"""Local stand-ins for the Gemini prompts that do not need a model.
+
+Used by ``llm`` once a user is over their daily token budget: skills are
+found by keyword, and questions and follow-ups are filled in from templates
+around the candidate's skills, projects and branch topics. Choices are
+seeded from the inputs, so the same profile gets the same questions.
+"""
+import random
+import re
+
+# Display names; matched case-insensitively as whole words
+SKILLS = [
+    'Python', 'Java', 'C++', 'C#', 'JavaScript', 'TypeScript', 'Go', 'Rust', 'Kotlin', 'Swift', 'Dart', 'SQL',
+    'HTML', 'CSS', 'React', 'Node.js', 'Express', 'Django', 'Flask', 'FastAPI', 'Spring', 'Flutter',
+    'Docker', 'Kubernetes', 'AWS', 'Azure', 'GCP', 'Linux', 'Git', 'Jenkins', 'Terraform',
+    'TensorFlow', 'PyTorch', 'Keras', 'scikit-learn', 'Pandas', 'NumPy', 'Machine Learning', 'Deep Learning',
+    'NLP', 'Computer Vision', 'PostgreSQL', 'MySQL', 'MongoDB', 'Redis', 'Tableau', 'Power BI', 'Excel',
+    'MATLAB', 'VLSI', 'Embedded Systems', 'PLC', 'SCADA', 'AutoCAD', 'STAAD', 'SolidWorks',
+]
+
+_SKILL_PATTERNS = [(skill, re.compile(r'(?<![\w+#.])' + re.escape(skill) + r'(?![\w+#])', re.IGNORECASE))
+                   for skill in SKILLS]
+
+SKILL_QUESTIONS = [
+    "Walk me through a feature you built with {skill}. What would change if it had to handle ten times the load?",
+    "What is a common pitfall when using {skill} in production, and how have you avoided it?",
+    "How do you test and debug code that depends on {skill}?",
+    "Which part of {skill} do you understand least well, and how would you close that gap?",
+]
+
+TOPIC_QUESTIONS = [
+    "Explain a core idea from {topic} and where it mattered in something you built.",
+    "Describe a problem you solved using {topic}. What alternatives did you consider?",
+]
+
+PROJECT_QUESTIONS = [
+    "In {project}, what was the hardest technical decision, and what trade-offs did it involve?",
+    "If you rebuilt {project} today, what would you do differently and why?",
+    "How did you check that {project} worked correctly, and what broke first?",
+]
+
+FOLLOWUPS = [
+    "What edge cases would break the approach you just described, and how would you handle them?",
+    "How would you measure whether that approach is fast enough, and what would you do if it were not?",
+    "What would you change in that design if it had to run on ten machines instead of one?",
+]
+
+
+def _rng(*parts):
+    return random.Random("\0".join(str(part) for part in parts))
+
+
+def _title(project):
+    return project.get('title', 'your project') if isinstance(project, dict) else str(project)
+
+
+def keyword_profile(text: str) -> dict:
+    """Skills named in the resume text, in the shape of ``llm.extract_resume_profile``"""
+    return {
+        'skills': [skill for skill, pattern in _SKILL_PATTERNS if pattern.search(text)],
+        'projects': [],
+        'domains': []
+    }
+
+
+def technical_questions(skills, branch, topics, asked_questions=(), count=5) -> list:
+    """Questions about the candidate's skills plus one or two on ``topics`` of their branch"""
+    rng = _rng(branch, *skills)
+    questions = [template.format(skill=skill)
+                 for skill, template in zip(rng.sample(skills[:10], min(len(skills), 10, count - 2)),
+                                            rng.sample(SKILL_QUESTIONS, len(SKILL_QUESTIONS)) * 3)]
+    for topic in rng.sample(topics, min(len(topics), count - len(questions))):
+        questions.append(rng.choice(TOPIC_QUESTIONS).format(topic=topic))
+    return [question for question in questions if question not in asked_questions][:count]
+
+
+def project_questions(projects, asked_questions=(), count=3) -> list:
+    rng = _rng(*(_title(project) for project in projects))
+    questions = [template.format(project=_title(project))
+                 for project, template in zip(projects[:count], rng.sample(PROJECT_QUESTIONS, len(PROJECT_QUESTIONS)))]
+    questions = [question for question in questions if question not in asked_questions]
+    return questions or ["Tell me about the biggest challenge in your recent project."]
+
+
+def followup(response: str) -> str:
+    return _rng(response).choice(FOLLOWUPS)
@@ -0,0 +1,275 @@
+"""Headless batch resume analysis.
+
+Usage:
+    python -m vintervu.batch RESUME_DIR --output results.jsonl [--api-key KEY]
+
+Text extraction runs in isolated worker processes (with a per-file timeout
+and memory cap), Gemini skill extraction runs on a bounded pool of threads,
+and every finished resume is appended to the output file (``.jsonl`` or
+``.csv``) as soon as it is ready. Re-running the same
+command skips files that already have a successful row in the output;
+``--restart`` overwrites the output instead.
+"""
+import argparse
+import csv
+import json
+import os
+import queue
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .analysis import JOB_ROLES, rank_role_analyses, score_resume_profile
+from .extraction import FILE_TYPES, RESUME_CHAR_BUDGET, read_resume_file
+from .llm import extract_resume_profile
+from .workers import DEFAULT_TIMEOUT, ExtractionError, ExtractionPool
+
+_DONE = object()
+
+
+def find_resumes(directory: str, recursive: bool = False) -> list:
+    """Sorted PDF/DOCX paths under ``directory``"""
+    paths = []
+    for root, dirs, files in os.walk(directory):
+        for name in files:
+            if os.path.splitext(name)[1].lower() in FILE_TYPES:
+                paths.append(os.path.join(root, name))
+        if not recursive:
+            break
+    return sorted(paths)
+
+
+def load_completed(output_path: str) -> set:
+    """Files that already have a successful row in an earlier run's output"""
+    if not os.path.exists(output_path):
+        return set()
+
+    completed = set()
+    with open(output_path, newline='', encoding='utf-8') as f:
+        if output_path.endswith('.csv'):
+            rows = csv.DictReader(f)
+        else:
+            rows = []
+            for line in f:
+                try:
+                    rows.append(json.loads(line))
+                except ValueError:
+                    # Partial last line from an interrupted run
+                    continue
+        for row in rows:
+            if row.get('status') == 'ok':
+                completed.add(row['file'])
+    return completed
+
+
+class JsonlWriter:
+    def __init__(self, path, append=True):
+        self.file = open(path, 'a' if append else 'w', encoding='utf-8')
+
+    def write(self, row):
+        self.file.write(json.dumps(row) + '\n')
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class CsvWriter:
+    def __init__(self, path, job_roles, append=True):
+        self.fields = [
+            'file', 'status', 'error', 'branch', 'skills', 'best_role', 'best_score',
+            'extract_s', 'queued_s', 'llm_s', 'total_s'
+        ] + [f'score:{role}' for role in job_roles]
+        write_header = not append or not os.path.exists(path) or os.path.getsize(path) == 0
+        self.file = open(path, 'a' if append else 'w', newline='', encoding='utf-8')
+        self.writer = csv.DictWriter(self.file, fieldnames=self.fields, extrasaction='ignore')
+        if write_header:
+            self.writer.writeheader()
+
+    def write(self, row):
+        flat = dict(row)
+        flat['skills'] = '; '.join(row.get('skills', []))
+        for role, analysis in row.get('roles', {}).items():
+            flat[f'score:{role}'] = analysis['score']
+        self.writer.writerow(flat)
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def _extract(pool, path, char_budget):
+    """Read one resume in the extraction pool, never raising"""
+    start = time.perf_counter()
+    try:
+        text, error = pool.run(read_resume_file, path, char_budget), ''
+        if not text.strip():
+            error = 'no text could be extracted'
+    except ExtractionError as e:
+        text, error = '', f'extraction failed: {e}'
+    return path, text, error, time.perf_counter() - start
+
+
+def _analyze(path, text, api_key, job_roles):
+    profile = extract_resume_profile(text, api_key)
+    scored = score_resume_profile(profile, job_roles)
+    ranked = rank_role_analyses(scored['roles'])
+    return {
+        'file': path,
+        'status': 'ok',
+        'error': '',
+        'branch': scored['branch'],
+        'skills': profile['skills'],
+        'projects': profile['projects'],
+        'domains': profile['domains'],
+        'best_role': ranked[0]['role'] if ranked else '',
+        'best_score': ranked[0]['score'] if ranked else 0,
+        'roles': scored['roles'],
+    }
+
+
+def run_batch(paths, api_key, writer, job_roles=JOB_ROLES, workers=None, llm_concurrency=4,
+              progress=None, char_budget=RESUME_CHAR_BUDGET, extract_timeout=DEFAULT_TIMEOUT):
+    """Extract, analyse and write every path; returns the per-file timing rows"""
+    # Bounded so extraction cannot run arbitrarily far ahead of the LLM stage
+    llm_queue = queue.Queue(maxsize=llm_concurrency * 2)
+    timings = []
+    write_lock = threading.Lock()
+
+    def timing(row):
+        return {key: row[key] for key in ('file', 'status', 'extract_s', 'queued_s', 'llm_s', 'total_s')}
+
+    def finish(row):
+        """Write and report one row, never raising: one that cannot be is counted as failed"""
+        try:
+            with write_lock:
+                writer.write(row)
+                if progress:
+                    progress(len(timings) + 1, len(paths), row)
+                timings.append(timing(row))
+        except Exception as e:
+            # An LLM worker that died here would leave extraction blocked on the full queue
+            with write_lock:
+                timings.append(dict(timing(row), status='error'))
+            print(f"{row['file']}: could not record the result: {e}", file=sys.stderr)
+
+    def llm_worker():
+        while True:
+            item = llm_queue.get()
+            if item is _DONE:
+                return
+            path, text, extract_s, queued_at = item
+            started = time.perf_counter()
+            try:
+                row = _analyze(path, text, api_key, job_roles)
+            except Exception as e:
+                row = {'file': path, 'status': 'error', 'error': f'analysis failed: {e}'}
+            llm_s = time.perf_counter() - started
+            row.update(
+                extract_s=round(extract_s, 3),
+                queued_s=round(started - queued_at, 3),
+                llm_s=round(llm_s, 3),
+                total_s=round(extract_s + (started - queued_at) + llm_s, 3)
+            )
+            finish(row)
+
+    threads = [threading.Thread(target=llm_worker, daemon=True) for _ in range(llm_concurrency)]
+    for thread in threads:
+        thread.start()
+
+    workers = workers or os.cpu_count() or 1
+    pool = ExtractionPool(size=workers, timeout=extract_timeout)
+    # One thread per worker process just waits on that process' result
+    with pool, ThreadPoolExecutor(max_workers=workers) as waiters:
+        futures = [waiters.submit(_extract, pool, path, char_budget) for path in paths]
+        for future in as_completed(futures):
+            path, text, error, extract_s = future.result()
+            if error:
+                finish({
+                    'file': path, 'status': 'error', 'error': error,
+                    'extract_s': round(extract_s, 3), 'queued_s': 0.0, 'llm_s': 0.0,
+                    'total_s': round(extract_s, 3)
+                })
+            else:
+                llm_queue.put((path, text, extract_s, time.perf_counter()))
+
+    for _ in threads:
+        llm_queue.put(_DONE)
+    for thread in threads:
+        thread.join()
+    return timings
+
+
+def print_timing_report(timings, wall_s, out=sys.stderr, slowest=10):
+    """Stage percentiles plus the slowest files"""
+    print(f"\nProcessed {len(timings)} files in {wall_s:.1f}s "
+          f"({sum(t['status'] == 'ok' for t in timings)} ok, "
+          f"{sum(t['status'] != 'ok' for t in timings)} failed)", file=out)
+    if not timings:
+        return
+
+    for stage in ('extract_s', 'queued_s', 'llm_s', 'total_s'):
+        values = sorted(t[stage] for t in timings)
+        p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+        print(f"  {stage:<10} mean={statistics.mean(values):.3f}s "
+              f"p50={statistics.median(values):.3f}s p95={p95:.3f}s max={values[-1]:.3f}s", file=out)
+
+    print(f"\nSlowest {min(slowest, len(timings))} files:", file=out)
+    for t in sorted(timings, key=lambda t: t['total_s'], reverse=True)[:slowest]:
+        print(f"  {t['total_s']:>8.3f}s  extract={t['extract_s']:.3f}s llm={t['llm_s']:.3f}s  {t['file']}", file=out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m vintervu.batch', description="Batch resume analysis")
+    parser.add_argument('directory', help="Directory containing PDF/DOCX resumes")
+    parser.add_argument('-o', '--output', default='resume_analysis.jsonl',
+                        help="Results file; .csv writes CSV, anything else JSON Lines")
+    parser.add_argument('--api-key', default=os.environ.get('GEMINI_API_KEY', ''),
+                        help="Gemini API key (defaults to $GEMINI_API_KEY)")
+    parser.add_argument('--role', action='append', dest='roles', choices=JOB_ROLES,
+                        help="Only score these job roles (repeatable); defaults to all roles")
+    parser.add_argument('--recursive', action='store_true', help="Also scan subdirectories")
+    parser.add_argument('--workers', type=int, default=None, help="Extraction processes (default: CPU count)")
+    parser.add_argument('--extract-timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help="Give up on a file whose text extraction takes longer than this many seconds")
+    parser.add_argument('--llm-concurrency', type=int, default=4, help="Concurrent Gemini requests")
+    parser.add_argument('--char-budget', type=int, default=RESUME_CHAR_BUDGET,
+                        help="Stop reading a resume after this many characters")
+    parser.add_argument('--restart', action='store_true', help="Ignore results from earlier runs")
+    args = parser.parse_args(argv)
+
+    if not args.api_key:
+        parser.error("a Gemini API key is required (--api-key or $GEMINI_API_KEY)")
+
+    paths = find_resumes(args.directory, args.recursive)
+    completed = set() if args.restart else load_completed(args.output)
+    pending = [path for path in paths if path not in completed]
+    print(f"Found {len(paths)} resumes, {len(completed & set(paths))} already done, "
+          f"{len(pending)} to process", file=sys.stderr)
+
+    job_roles = args.roles or JOB_ROLES
+    # --restart starts the output over, so the rerun rows are not appended to the old ones
+    if args.output.endswith('.csv'):
+        writer = CsvWriter(args.output, job_roles, append=not args.restart)
+    else:
+        writer = JsonlWriter(args.output, append=not args.restart)
+
+    def progress(done, total, row):
+        status = row['status'] if row['status'] == 'ok' else f"error: {row['error']}"
+        print(f"[{done}/{total}] {row['file']} extract={row['extract_s']:.2f}s "
+              f"llm={row['llm_s']:.2f}s total={row['total_s']:.2f}s {status}", file=sys.stderr)
+
+    start = time.perf_counter()
+    try:
+        timings = run_batch(pending, args.api_key, writer, job_roles, args.workers,
+                            args.llm_concurrency, progress, args.char_budget, args.extract_timeout)
+    finally:
+        writer.close()
+    print_timing_report(timings, time.perf_counter() - start)
+    return 0 if all(t['status'] == 'ok' for t in timings) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
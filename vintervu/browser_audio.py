@@ -0,0 +1,171 @@
+"""Audio recorded in the candidate's browser, fed into the speech pipeline.
+
+``sr.Microphone`` records from the server's own audio device, which every
+session would have to share. The browser recorder component instead uploads
+16 kHz mono audio in numbered chunks; ``BrowserAudioSource`` reassembles
+them in order and exposes them as an ``sr.AudioSource`` so the normal
+listen/chunk/recognize code runs unchanged, one source per capture.
+
+Chunks are IMA ADPCM, 4 bits a sample, so they are a quarter the size of the
+PCM they carry. ``audioop``, which SpeechRecognition needs anyway, decodes
+them. Each chunk starts with the encoder state, so it decodes on its own.
+An upload is one binary component value:
+
+    u8 capture id length, capture id (ASCII), i32 last seq (-1 until the answer ends)
+    per chunk: u32 seq, u32 length, then i16 predictor, u8 step index and the ADPCM bytes
+
+Each upload carries every chunk the browser has not seen acknowledged yet,
+so an upload that Streamlit coalesces or drops is simply covered by the next.
+"""
+import audioop
+import struct
+import threading
+import time
+
+import speech_recognition as sr
+
+SAMPLE_RATE = 16000
+SAMPLE_WIDTH = 2
+
+# A capture that stops receiving audio for this long is treated as finished
+STALL_TIMEOUT = 10
+# Decoded bytes accepted per chunk and per capture (60s of audio)
+MAX_CHUNK_BYTES = SAMPLE_RATE * SAMPLE_WIDTH * 5
+MAX_CAPTURE_BYTES = SAMPLE_RATE * SAMPLE_WIDTH * 60
+
+_STATE = struct.Struct('<hB')
+_LAST_SEQ = struct.Struct('<i')
+_CHUNK = struct.Struct('<II')
+
+
+def encode_chunk(pcm: bytes, state=None):
+    """What the browser component sends for ``pcm``, and the encoder state the next chunk starts from"""
+    predictor, index = state or (0, 0)
+    adpcm, state = audioop.lin2adpcm(pcm, SAMPLE_WIDTH, (predictor, index))
+    return _STATE.pack(predictor, index) + adpcm, state
+
+
+def decode_chunk(data: bytes, max_bytes: int = MAX_CHUNK_BYTES) -> bytes:
+    """PCM from one uploaded chunk; raises ValueError for malformed or oversized data"""
+    if len(data) < _STATE.size:
+        raise ValueError("malformed audio chunk: too short")
+    if (len(data) - _STATE.size) * 2 * SAMPLE_WIDTH > max_bytes:
+        raise ValueError(f"audio chunk is larger than {max_bytes} bytes")
+    try:
+        pcm, _ = audioop.adpcm2lin(data[_STATE.size:], SAMPLE_WIDTH, _STATE.unpack_from(data))
+    except audioop.error as e:
+        raise ValueError(f"malformed audio chunk: {e}") from e
+    return pcm
+
+
+def encode_upload(capture, chunks, last_seq=None) -> bytes:
+    """The component value for ``[{'seq', 'data'}, ...]``, laid out as the browser sends it"""
+    capture = capture.encode('ascii')
+    parts = [bytes([len(capture)]), capture, _LAST_SEQ.pack(-1 if last_seq is None else last_seq)]
+    for chunk in chunks:
+        parts += [_CHUNK.pack(chunk['seq'], len(chunk['data'])), chunk['data']]
+    return b"".join(parts)
+
+
+def parse_upload(data: bytes) -> dict:
+    """``{'capture', 'chunks': [{'seq', 'data'}], 'last_seq'}`` from one upload; raises ValueError if malformed"""
+    try:
+        offset = 1 + data[0]
+        capture = data[1:offset].decode('ascii')
+        (last_seq,) = _LAST_SEQ.unpack_from(data, offset)
+        offset += _LAST_SEQ.size
+        chunks = []
+        while offset < len(data):
+            seq, length = _CHUNK.unpack_from(data, offset)
+            offset += _CHUNK.size
+            if offset + length > len(data):
+                raise ValueError(f"chunk {seq} is cut short")
+            chunks.append({'seq': seq, 'data': bytes(data[offset:offset + length])})
+            offset += length
+    except (IndexError, UnicodeDecodeError, struct.error) as e:
+        raise ValueError(f"malformed audio upload: {e}") from e
+    return {'capture': capture, 'chunks': chunks, 'last_seq': None if last_seq < 0 else last_seq}
+
+
+class BrowserAudioSource(sr.AudioSource):
+    """An ``sr.AudioSource`` backed by chunks uploaded from one browser capture
+
+    The Streamlit thread calls ``receive`` with each upload; the capture
+    thread reads through ``stream.read`` and blocks until enough audio has
+    arrived. The stream ends once the browser's last chunk is in, when
+    ``close`` is called, or after ``stall_timeout`` seconds without audio.
+    """
+    SAMPLE_RATE = SAMPLE_RATE
+    SAMPLE_WIDTH = SAMPLE_WIDTH
+    CHUNK = 1024
+
+    def __init__(self, capture_id, stall_timeout=STALL_TIMEOUT, max_bytes=MAX_CAPTURE_BYTES):
+        self.capture_id = capture_id
+        self.stall_timeout = stall_timeout
+        self.max_bytes = max_bytes
+        self.stream = self
+        self.ack = -1
+        self.uploaded_bytes = 0
+        self.received_bytes = 0
+        self.closed = False
+        self._buffer = bytearray()
+        self._cond = threading.Condition()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def receive(self, chunks, last_seq=None):
+        """Append ``[{'seq', 'data'}, ...]`` in sequence order and return the new ack
+
+        Chunks at or below the ack are duplicates and skipped; a gap stops
+        the upload there, since the browser resends everything unacknowledged.
+        """
+        for chunk in sorted(chunks, key=lambda chunk: chunk['seq']):
+            seq = chunk['seq']
+            if seq <= self.ack:
+                continue
+            if seq != self.ack + 1 or self.closed:
+                break
+            pcm = decode_chunk(chunk['data'])
+            with self._cond:
+                if self.received_bytes + len(pcm) > self.max_bytes:
+                    self.closed = True
+                    self._cond.notify_all()
+                    raise ValueError("voice answer is longer than the upload limit")
+                self._buffer += pcm
+                self.uploaded_bytes += _CHUNK.size + len(chunk['data'])
+                self.received_bytes += len(pcm)
+                self.ack = seq
+                self._cond.notify_all()
+        if last_seq is not None and self.ack >= last_seq:
+            self.close()
+        return self.ack
+
+    def read(self, size):
+        """``size`` frames, waiting for the browser to send them; fewer at the end of the stream"""
+        wanted = size * self.SAMPLE_WIDTH
+        deadline = time.monotonic() + self.stall_timeout
+        with self._cond:
+            while len(self._buffer) < wanted and not self.closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    # The tab was closed or lost its connection
+                    self.closed = True
+                    break
+                self._cond.wait(remaining)
+            data = bytes(self._buffer[:wanted])
+            del self._buffer[:wanted]
+            return data
+
+    def close(self):
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+    @property
+    def compression_ratio(self):
+        """Decoded PCM bytes per uploaded byte of the chunks that arrived, framing included"""
+        return self.received_bytes / self.uploaded_bytes if self.uploaded_bytes else None
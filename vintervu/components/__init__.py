@@ -0,0 +1,23 @@
+"""Custom Streamlit components, shipped as static HTML without a frontend build."""
+import os
+
+import streamlit.components.v1 as components
+
+from ..browser_audio import SAMPLE_RATE
+from ..speech import AMBIENT_NOISE_SECONDS
+
+_browser_recorder = components.declare_component(
+    'browser_recorder', path=os.path.join(os.path.dirname(__file__), 'browser_recorder')
+)
+
+
+def browser_recorder(key, ack=None, active=False, disabled=False, chunk_ms=500):
+    """Record from the candidate's own microphone, uploading IMA ADPCM chunks
+
+    Returns the latest upload as bytes (``browser_audio.parse_upload`` reads
+    it), or None. ``ack`` (``{'capture', 'seq'}``) tells the browser which
+    chunks arrived; ``active=False`` for the acknowledged capture stops its
+    recording.
+    """
+    return _browser_recorder(key=key, ack=ack, active=active, disabled=disabled, chunk_ms=chunk_ms,
+                             sample_rate=SAMPLE_RATE, calibration_seconds=AMBIENT_NOISE_SECONDS, default=None)
@@ -0,0 +1,43 @@
+// IMA ADPCM, byte for byte what Python's audioop.lin2adpcm produces, so the server decodes it with adpcm2lin
+const ADPCM_INDEX = [-1, -1, -1, -1, 2, 4, 6, 8, -1, -1, -1, -1, 2, 4, 6, 8];
+const ADPCM_STEP = [
+  7, 8, 9, 10, 11, 12, 13, 14, 16, 17, 19, 21, 23, 25, 28, 31, 34, 37, 41, 45, 50, 55, 60, 66, 73, 80, 88, 97,
+  107, 118, 130, 143, 157, 173, 190, 209, 230, 253, 279, 307, 337, 371, 408, 449, 494, 544, 598, 658, 724, 796,
+  876, 963, 1060, 1166, 1282, 1411, 1552, 1707, 1878, 2066, 2272, 2499, 2749, 3024, 3327, 3660, 4026, 4428, 4871,
+  5358, 5894, 6484, 7132, 7845, 8630, 9493, 10442, 11487, 12635, 13899, 15289, 16818, 18500, 20350, 22385, 24623,
+  27086, 29794, 32767,
+];
+
+// One chunk of 16-bit samples: the state it starts from (i16 predictor, u8 step index), then two samples a byte.
+// Returns the chunk and the state the next one starts from.
+function adpcmEncode(int16, state) {
+  let [predictor, index] = state;
+  const bytes = new Uint8Array(3 + (int16.length >> 1));
+  new DataView(bytes.buffer).setInt16(0, predictor, true);
+  bytes[2] = index;
+  let step = ADPCM_STEP[index];
+  let out = 3;
+  let high = 0;
+  for (let i = 0; i < int16.length; i++) {
+    let diff = int16[i] - predictor;
+    const sign = diff < 0 ? 8 : 0;
+    if (sign) diff = -diff;
+    let delta = 0;
+    let change = step >> 3;
+    if (diff >= step) { delta = 4; diff -= step; change += step; }
+    step >>= 1;
+    if (diff >= step) { delta |= 2; diff -= step; change += step; }
+    step >>= 1;
+    if (diff >= step) { delta |= 1; change += step; }
+    predictor = Math.max(-32768, Math.min(32767, sign ? predictor - change : predictor + change));
+    delta |= sign;
+    index = Math.max(0, Math.min(88, index + ADPCM_INDEX[delta]));
+    step = ADPCM_STEP[index];
+    // Like audioop, the first sample of a pair goes in the high nibble and an odd last one is dropped
+    if (i % 2 === 0) high = delta << 4;
+    else bytes[out++] = high | delta;
+  }
+  return {bytes: bytes, state: [predictor, index]};
+}
+
+if (typeof module !== "undefined") module.exports = {adpcmEncode};
@@ -0,0 +1,40 @@
+// Runs on the audio rendering thread: averages the input down to the upload rate as 16-bit PCM
+// and posts it to the page in batches, plus whatever is left whenever the page asks for it.
+class RecorderProcessor extends AudioWorkletProcessor {
+  constructor(options) {
+    super();
+    this.ratio = sampleRate / options.processorOptions.sampleRate;
+    this.position = 0;
+    this.sum = 0;
+    this.count = 0;
+    this.batch = new Int16Array(2048);
+    this.length = 0;
+    this.port.onmessage = () => this.post(true);
+  }
+
+  post(flushed) {
+    this.port.postMessage({samples: this.batch.slice(0, this.length), flushed: flushed});
+    this.length = 0;
+  }
+
+  process(inputs) {
+    const input = inputs[0][0];
+    if (!input) return true;
+    for (let i = 0; i < input.length; i++) {
+      this.sum += input[i];
+      this.count++;
+      this.position += 1;
+      if (this.position >= this.ratio) {
+        this.position -= this.ratio;
+        const value = Math.max(-1, Math.min(1, this.sum / this.count));
+        this.batch[this.length++] = value < 0 ? value * 0x8000 : value * 0x7fff;
+        this.sum = 0;
+        this.count = 0;
+        if (this.length === this.batch.length) this.post(false);
+      }
+    }
+    return true;
+  }
+}
+
+registerProcessor("recorder", RecorderProcessor);
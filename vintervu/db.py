@@ -0,0 +1,373 @@
+"""SQLite storage for user accounts and saved interview feedback."""
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+from .metrics import timed
+
+DB_PATH = os.environ.get('VINTERVU_DB_PATH', 'vintervu.db')
+METRICS_RETENTION_DAYS = int(os.environ.get('VINTERVU_METRICS_RETENTION_DAYS', 7))
+
+# Per-stage timings flushed from metrics.recorder; also created on first flush,
+# so tools that never call init_database (the batch CLI) can record them too
+METRICS_TABLE = """
+    CREATE TABLE IF NOT EXISTS metrics (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        stage TEXT NOT NULL,
+        started_at REAL NOT NULL,
+        seconds REAL NOT NULL,
+        ok INTEGER NOT NULL,
+        bytes_in INTEGER NOT NULL,
+        bytes_out INTEGER NOT NULL
+    )
+"""
+METRICS_INDEX = "CREATE INDEX IF NOT EXISTS idx_metrics_started_at ON metrics (started_at)"
+
+# One row per Gemini call, and running totals per user, UTC day and function
+# that the daily budgets are checked against; created on first use as well
+LLM_USAGE_TABLES = [
+    """
+    CREATE TABLE IF NOT EXISTS llm_usage (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        email TEXT NOT NULL,
+        interview_id TEXT NOT NULL,
+        function TEXT NOT NULL,
+        model TEXT NOT NULL,
+        prompt_tokens INTEGER NOT NULL,
+        output_tokens INTEGER NOT NULL,
+        cost_usd REAL NOT NULL,
+        seconds REAL NOT NULL,
+        ok INTEGER NOT NULL,
+        cached INTEGER NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_llm_usage_interview ON llm_usage (interview_id)",
+    """
+    CREATE TABLE IF NOT EXISTS llm_usage_daily (
+        email TEXT NOT NULL,
+        day TEXT NOT NULL,
+        function TEXT NOT NULL,
+        calls INTEGER NOT NULL,
+        cached_calls INTEGER NOT NULL,
+        prompt_tokens INTEGER NOT NULL,
+        output_tokens INTEGER NOT NULL,
+        cost_usd REAL NOT NULL,
+        seconds REAL NOT NULL,
+        PRIMARY KEY (email, day, function)
+    )
+    """,
+]
+
+
+@timed('db.init_database')
+def init_database():
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT NOT NULL,
+            email TEXT UNIQUE NOT NULL,
+            password_hash TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS feedback (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            email TEXT,
+            total_score INTEGER NOT NULL,
+            max_score INTEGER NOT NULL,
+            percentage REAL NOT NULL,
+            feedback_data TEXT,
+            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    # Append-only log of interview progress, so an interview survives a lost session
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS interview_checkpoints (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            email TEXT NOT NULL,
+            interview_id TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            data TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_checkpoints_email ON interview_checkpoints (email, id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_checkpoints_interview ON interview_checkpoints (interview_id, id)")
+    # Bumped with every saved interview; caches of a user's history are keyed on it
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS history_versions (
+            email TEXT PRIMARY KEY,
+            version INTEGER NOT NULL
+        )
+    """)
+    cursor.execute(METRICS_TABLE)
+    cursor.execute(METRICS_INDEX)
+    for statement in LLM_USAGE_TABLES:
+        cursor.execute(statement)
+    conn.commit()
+    conn.close()
+
+
+def hash_password(password: str) -> str:
+    return hashlib.sha256(password.encode()).hexdigest()
+
+
+def verify_password(password: str, hashed: str) -> bool:
+    return hash_password(password) == hashed
+
+
+@timed('db.register_user')
+def register_user(username: str, email: str, password: str) -> bool:
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        cursor = conn.cursor()
+        cursor.execute(
+            "INSERT INTO users (username, email, password_hash) VALUES (?, ?, ?)",
+            (username, email, hash_password(password))
+        )
+        conn.commit()
+        conn.close()
+        return True
+    except sqlite3.IntegrityError:
+        return False
+
+
+@timed('db.authenticate_user')
+def authenticate_user(email: str, password: str) -> bool:
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    cursor.execute("SELECT password_hash FROM users WHERE email = ?", (email,))
+    result = cursor.fetchone()
+    conn.close()
+    if result and verify_password(password, result[0]):
+        return True
+    return False
+
+
+@timed('db.insert_feedback')
+def insert_feedback(email: str, total_score: int, max_score: int, percentage: float, feedback_data: dict):
+    """Store one finished interview; raises sqlite3.Error"""
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        conn.execute(
+            "INSERT INTO feedback (email, total_score, max_score, percentage, feedback_data) VALUES (?, ?, ?, ?, ?)",
+            (email, total_score, max_score, percentage, json.dumps(feedback_data))
+        )
+        conn.execute(
+            "INSERT INTO history_versions (email, version) VALUES (?, 1) "
+            "ON CONFLICT(email) DO UPDATE SET version = version + 1",
+            (email,)
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+@timed('db.history_version')
+def history_version(email: str) -> int:
+    """Changes whenever an interview is saved for ``email``; 0 before the first"""
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        row = conn.execute("SELECT version FROM history_versions WHERE email = ?", (email,)).fetchone()
+    finally:
+        conn.close()
+    return row[0] if row else 0
+
+
+@timed('db.fetch_feedback')
+def fetch_feedback(email: str) -> list:
+    """Every interview saved for ``email``, newest first; raises sqlite3.Error"""
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        results = conn.execute(
+            "SELECT total_score, max_score, percentage, feedback_data, timestamp FROM feedback WHERE email = ? ORDER BY timestamp DESC",
+            (email,)
+        ).fetchall()
+    finally:
+        conn.close()
+
+    feedback_list = []
+    for result in results:
+        feedback_list.append({
+            'total_score': result[0],
+            'max_score': result[1],
+            'percentage': result[2],
+            'feedback_data': json.loads(result[3]) if result[3] else {},
+            'timestamp': result[4]
+        })
+    return feedback_list
+
+
+@timed('db.append_checkpoint')
+def append_checkpoint(email: str, interview_id: str, kind: str, data: dict):
+    """Append one interview event; rows already written are never updated"""
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        conn.execute(
+            "INSERT INTO interview_checkpoints (email, interview_id, kind, data) VALUES (?, ?, ?, ?)",
+            (email, interview_id, kind, json.dumps(data, separators=(',', ':')))
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+@timed('db.latest_checkpoints')
+def latest_checkpoints(email: str):
+    """``(interview_id, [(kind, data), ...])`` for the user's most recent interview, or None"""
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        row = conn.execute(
+            "SELECT interview_id FROM interview_checkpoints WHERE email = ? ORDER BY id DESC LIMIT 1", (email,)
+        ).fetchone()
+        if row is None:
+            return None
+        rows = conn.execute(
+            "SELECT kind, data FROM interview_checkpoints WHERE email = ? AND interview_id = ? ORDER BY id",
+            (email, row[0])
+        ).fetchall()
+    finally:
+        conn.close()
+    return row[0], [(kind, json.loads(data)) for kind, data in rows]
+
+
+@timed('db.interview_events')
+def interview_events(interview_id: str):
+    """``(email, [(kind, data), ...])`` for one interview, oldest event first, or None"""
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        rows = conn.execute(
+            "SELECT email, kind, data FROM interview_checkpoints WHERE interview_id = ? ORDER BY id", (interview_id,)
+        ).fetchall()
+    finally:
+        conn.close()
+    if not rows:
+        return None
+    return rows[0][0], [(kind, json.loads(data)) for _, kind, data in rows]
+
+
+@timed('db.recent_interviews')
+def recent_interviews(limit: int = 20, email: str = None) -> list:
+    """``(interview_id, email, events, started, last_event)`` for the latest interviews, newest first"""
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        return conn.execute(
+            "SELECT interview_id, email, COUNT(*), MIN(created_at), MAX(created_at) FROM interview_checkpoints "
+            "WHERE ? IS NULL OR email = ? GROUP BY interview_id, email ORDER BY MAX(id) DESC LIMIT ?",
+            (email, email, limit)
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+def insert_metrics(rows):
+    """Store ``(stage, started_at, seconds, ok, bytes_in, bytes_out)`` records and drop expired ones"""
+    conn = sqlite3.connect(DB_PATH, timeout=10)
+    try:
+        conn.execute(METRICS_TABLE)
+        conn.execute(METRICS_INDEX)
+        conn.executemany(
+            "INSERT INTO metrics (stage, started_at, seconds, ok, bytes_in, bytes_out) VALUES (?, ?, ?, ?, ?, ?)",
+            rows
+        )
+        conn.execute("DELETE FROM metrics WHERE started_at < ?", (time.time() - METRICS_RETENTION_DAYS * 86400,))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def fetch_metrics(since: float) -> list:
+    """``(stage, seconds, ok, bytes_in, bytes_out)`` for every call started after ``since``"""
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        return conn.execute(
+            "SELECT stage, seconds, ok, bytes_in, bytes_out FROM metrics WHERE started_at >= ?", (since,)
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+@timed('db.insert_llm_usage')
+def insert_llm_usage(rows):
+    """Store calls buffered by ``usage.record`` and add them to each user's daily totals; raises sqlite3.Error"""
+    conn = sqlite3.connect(DB_PATH, timeout=10)
+    try:
+        # Once per flush rather than per call, for tools that never call init_database
+        for statement in LLM_USAGE_TABLES:
+            conn.execute(statement)
+        conn.executemany(
+            "INSERT INTO llm_usage (email, interview_id, function, model, prompt_tokens, output_tokens, cost_usd, "
+            "seconds, ok, cached, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows
+        )
+        conn.executemany(
+            "INSERT INTO llm_usage_daily (email, day, function, calls, cached_calls, prompt_tokens, output_tokens, "
+            "cost_usd, seconds) VALUES (?, date(?), ?, 1, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(email, day, function) DO UPDATE SET calls = calls + 1, "
+            "cached_calls = cached_calls + excluded.cached_calls, "
+            "prompt_tokens = prompt_tokens + excluded.prompt_tokens, "
+            "output_tokens = output_tokens + excluded.output_tokens, "
+            "cost_usd = cost_usd + excluded.cost_usd, seconds = seconds + excluded.seconds",
+            [(email, created_at, function, int(cached), prompt_tokens, output_tokens, cost_usd, seconds)
+             for email, _, function, _, prompt_tokens, output_tokens, cost_usd, seconds, _, cached, created_at in rows]
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+@timed('db.tokens_used_today')
+def tokens_used_today(email: str) -> int:
+    """Prompt and output tokens spent by ``email`` since midnight UTC"""
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        row = conn.execute(
+            "SELECT SUM(prompt_tokens + output_tokens) FROM llm_usage_daily WHERE email = ? AND day = date('now')",
+            (email,)
+        ).fetchone()
+    except sqlite3.OperationalError:
+        # Nothing recorded yet, so the table may not exist
+        return 0
+    finally:
+        conn.close()
+    return row[0] or 0
+
+
+@timed('db.llm_usage_by_day')
+def llm_usage_by_day(days: int) -> list:
+    """Daily totals per user and function for the last ``days`` days, as dicts, newest first"""
+    conn = sqlite3.connect(DB_PATH)
+    conn.row_factory = sqlite3.Row
+    try:
+        rows = conn.execute(
+            "SELECT * FROM llm_usage_daily WHERE day > date('now', ?) ORDER BY day DESC, cost_usd DESC",
+            (f"-{days} days",)
+        ).fetchall()
+    finally:
+        conn.close()
+    return [dict(row) for row in rows]
+
+
+@timed('db.llm_usage_by_interview')
+def llm_usage_by_interview(days: int, limit: int = 20) -> list:
+    """The ``limit`` most expensive interviews of the last ``days`` days, with their call and token totals"""
+    conn = sqlite3.connect(DB_PATH)
+    conn.row_factory = sqlite3.Row
+    try:
+        rows = conn.execute(
+            "SELECT interview_id, email, MIN(created_at) AS started, COUNT(*) AS calls, "
+            "SUM(prompt_tokens) AS prompt_tokens, SUM(output_tokens) AS output_tokens, "
+            "SUM(cost_usd) AS cost_usd, SUM(seconds) AS seconds FROM llm_usage "
+            "WHERE interview_id != '' AND created_at > datetime('now', ?) "
+            "GROUP BY interview_id, email ORDER BY cost_usd DESC, calls DESC LIMIT ?",
+            (f"-{days} days", limit)
+        ).fetchall()
+    finally:
+        conn.close()
+    return [dict(row) for row in rows]
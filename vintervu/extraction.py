@@ -0,0 +1,151 @@
+"""Resume text extraction for PDF and DOCX files."""
+import io
+import os
+import re
+import time
+import zipfile
+from typing import TYPE_CHECKING, Iterator, NamedTuple, Optional
+from xml.etree import ElementTree
+
+if TYPE_CHECKING:
+    import PyPDF2
+
+PDF_MIME = "application/pdf"
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+FILE_TYPES = {
+    '.pdf': PDF_MIME,
+    '.docx': DOCX_MIME,
+}
+
+DOCX_BODY = 'word/document.xml'
+DOCX_HEADER = re.compile(r'word/header[0-9]*\.xml$')
+DOCX_FOOTER = re.compile(r'word/footer[0-9]*\.xml$')
+
+_WORD_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+WORD_TEXT = _WORD_NS + 't'
+WORD_TAB = _WORD_NS + 'tab'
+WORD_BREAK = _WORD_NS + 'br'
+WORD_CARRIAGE_RETURN = _WORD_NS + 'cr'
+WORD_PARAGRAPH = _WORD_NS + 'p'
+
+# Only the start of a resume is sent to Gemini, so parsing stops once this many
+# characters have been collected. Override with VINTERVU_RESUME_CHAR_BUDGET.
+RESUME_CHAR_BUDGET = int(os.environ.get('VINTERVU_RESUME_CHAR_BUDGET', 4000))
+
+
+class PdfExtraction(NamedTuple):
+    text: str
+    pages_read: int
+    page_count: int
+    seconds: float
+    truncated: bool
+
+
+def iter_pdf_page_texts(pdf_reader: 'PyPDF2.PdfReader') -> Iterator[str]:
+    """Yield page texts one at a time so callers can stop early"""
+    for page in pdf_reader.pages:
+        yield page.extract_text() or ""
+
+
+def read_pdf(file_content: bytes, char_budget: Optional[int] = RESUME_CHAR_BUDGET) -> PdfExtraction:
+    """Parse pages until ``char_budget`` characters are collected (None reads everything)"""
+    # Imported here so pages that never read a PDF do not pay for PyPDF2
+    import PyPDF2
+
+    start = time.perf_counter()
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
+    page_count = len(pdf_reader.pages)
+
+    parts = []
+    collected = 0
+    pages_read = 0
+    for page_text in iter_pdf_page_texts(pdf_reader):
+        pages_read += 1
+        parts.append(page_text)
+        collected += len(page_text) + 1
+        if char_budget is not None and collected >= char_budget:
+            break
+
+    text = "\n".join(parts)
+    truncated = char_budget is not None and len(text) > char_budget
+    if truncated:
+        text = text[:char_budget]
+    return PdfExtraction(text, pages_read, page_count, time.perf_counter() - start,
+                         truncated or pages_read < page_count)
+
+
+def read_pdf_text(file_content: bytes, char_budget: Optional[int] = RESUME_CHAR_BUDGET) -> str:
+    """Return the text of a PDF, raising on unreadable files"""
+    return read_pdf(file_content, char_budget).text
+
+
+def read_docx_text(file_content: bytes, char_budget: Optional[int] = RESUME_CHAR_BUDGET) -> str:
+    """Return the text of a DOCX straight from memory, raising on unreadable files
+
+    Headers, body and footers are read in that order (as docx2txt does) and
+    parsing stops once ``char_budget`` characters have been collected.
+    """
+    parts = []
+    collected = 0
+    with zipfile.ZipFile(io.BytesIO(file_content)) as docx:
+        names = docx.namelist()
+        if DOCX_BODY not in names:
+            raise ValueError(f"{DOCX_BODY} not found, is this a Word document?")
+        members = (
+            sorted(name for name in names if DOCX_HEADER.match(name))
+            + [DOCX_BODY]
+            + sorted(name for name in names if DOCX_FOOTER.match(name))
+        )
+        for name in members:
+            with docx.open(name) as xml_stream:
+                for chunk in _iter_wordml_text(xml_stream):
+                    parts.append(chunk)
+                    collected += len(chunk)
+                    if char_budget is not None and collected >= char_budget:
+                        return "".join(parts).strip()[:char_budget]
+    return "".join(parts).strip()
+
+
+def _iter_wordml_text(xml_stream) -> Iterator[str]:
+    """Stream text runs, tabs and breaks out of a WordprocessingML part
+
+    Each element is cleared and detached from its parent at its end tag, so
+    only the elements still open are in memory, however long the part is.
+    """
+    open_elements = []
+    for event, elem in ElementTree.iterparse(xml_stream, events=('start', 'end')):
+        if event == 'start':
+            open_elements.append(elem)
+            if elem.tag == WORD_TAB:
+                yield "\t"
+            elif elem.tag in (WORD_BREAK, WORD_CARRIAGE_RETURN):
+                yield "\n"
+            continue
+        open_elements.pop()
+        if elem.tag == WORD_TEXT:
+            if elem.text:
+                yield elem.text
+        elif elem.tag == WORD_PARAGRAPH:
+            yield "\n\n"
+        elem.clear()
+        if open_elements:
+            # Earlier siblings were detached at their own end tags, so this is the only child
+            open_elements[-1].remove(elem)
+
+
+def read_resume_text(file_type: str, file_content: bytes,
+                     char_budget: Optional[int] = RESUME_CHAR_BUDGET) -> str:
+    """Dispatch on MIME type; raises ValueError for unsupported formats"""
+    if file_type == PDF_MIME:
+        return read_pdf_text(file_content, char_budget)
+    elif file_type == DOCX_MIME:
+        return read_docx_text(file_content, char_budget)
+    raise ValueError(f"Unsupported file format: {file_type}")
+
+
+def read_resume_file(path: str, char_budget: Optional[int] = RESUME_CHAR_BUDGET) -> str:
+    """Read a resume from disk, picking the parser from the file extension"""
+    file_type = FILE_TYPES.get(os.path.splitext(path)[1].lower(), '')
+    with open(path, 'rb') as f:
+        return read_resume_text(file_type, f.read(), char_budget)
@@ -0,0 +1,245 @@
+"""State of one candidate's interview, kept in Streamlit session state.
+
+``InterviewSession`` replaces the loose ``interview_state`` dict. An interview
+moves through four states, only via the transition methods below:
+
+    PREPARING  -- start() -->  ASKING  -- submit() -->  EVALUATING
+                                 ^                          |
+                                 +------- record() ---------+
+    ASKING / EVALUATING  -- skip() / record() / finish() -->  COMPLETE
+
+Scores are read from the stored feedback instead of being kept twice, and
+the number of questions and the length of answers are capped, so a session
+stays small no matter how long the candidate keeps going.
+
+Every transition (questions generated, an answer submitted, its evaluation
+and follow-up returned, a skip, the end of the interview) is passed to
+``journal`` as one small event, which the app appends to the database.
+Each event carries its wall-clock time ``t`` and, when the caller timed the
+model calls behind it, their durations in ``ms``. An answer's text is only
+stored in its ``submit`` event. ``InterviewSession.restore`` replays those
+events through the same transitions to rebuild the interview, and
+``vintervu.replay`` re-drives them against the stub model offline.
+"""
+import time
+import uuid
+
+PREPARING = 'preparing'
+ASKING = 'asking'
+EVALUATING = 'evaluating'
+COMPLETE = 'complete'
+
+MAX_QUESTIONS = 12
+MAX_ANSWER_CHARS = 5000
+
+# Checkpoint event kinds
+START = 'start'
+SUBMIT = 'submit'
+ANSWER = 'answer'
+SKIP = 'skip'
+FINISH = 'finish'
+SAVED = 'saved'
+DISCARDED = 'discarded'
+
+
+# Attributes to_dict leaves out of the session store
+_NOT_STORED = ('journal', 'api_key')
+
+
+class InvalidTransition(Exception):
+    pass
+
+
+def unfinished(events) -> bool:
+    """The interview these events describe was neither saved nor discarded"""
+    return bool(events) and events[-1][0] not in (SAVED, DISCARDED)
+
+
+class InterviewSession:
+    """One interview: the candidate's profile, the questions and the evaluated answers"""
+
+    __slots__ = ('skills', 'projects', 'branch', 'api_key', 'questions', 'index', 'feedback', 'state',
+                 'pending_response', 'saved', 'interview_id', 'journal')
+
+    def __init__(self, journal=None):
+        """``journal(interview_id, kind, data)`` is called with each checkpoint event"""
+        self.journal = journal
+        self.skills = []
+        self.projects = []
+        self.branch = ''
+        self.api_key = ''
+        self._reset()
+
+    def _reset(self):
+        self.interview_id = uuid.uuid4().hex
+        self.questions = []
+        self.index = 0
+        self.feedback = []
+        self.state = PREPARING
+        self.pending_response = None
+        self.saved = False
+
+    @classmethod
+    def restore(cls, interview_id, events, journal=None):
+        """Rebuild an interview from its checkpoint events; the API key is never stored, so it is left empty"""
+        session = cls()
+        for kind, data in events:
+            session.apply(kind, data)
+        session.interview_id = interview_id
+        session.journal = journal
+        return session
+
+    def apply(self, kind, data):
+        """Redo one checkpoint event through the transition that logged it; unknown kinds are ignored"""
+        if kind == START:
+            self.load_profile(data['skills'], data['projects'], data['branch'], '')
+            self.start(data['questions'])
+        elif kind == SUBMIT:
+            self.submit(data['response'])
+        elif kind == ANSWER:
+            item = data['item']
+            if 'response' in item:
+                # Logged before answers had their own submit event
+                self.submit(item['response'])
+            else:
+                item = dict(item, response=self.pending_response)
+            self.record(item, data.get('followup'))
+        elif kind == SKIP:
+            self.skip()
+        elif kind == FINISH:
+            self.finish()
+        elif kind == SAVED:
+            self.saved = True
+
+    def to_dict(self):
+        """Plain data for the session store; the journal is attached again on load
+
+        The API key is left out like in the checkpoints, so a session picked up
+        by another server asks for it again.
+        """
+        return {name: getattr(self, name) for name in self.__slots__ if name not in _NOT_STORED}
+
+    @classmethod
+    def from_dict(cls, data, journal=None):
+        session = cls(journal)
+        for name in cls.__slots__:
+            if name in data and name not in _NOT_STORED:
+                setattr(session, name, data[name])
+        return session
+
+    def _log(self, kind, timings=None, **data):
+        """Journal one event; ``timings`` are seconds per model call, logged as ``ms``"""
+        if self.journal is None:
+            return
+        data['t'] = round(time.time(), 3)
+        if timings:
+            data['ms'] = {name: round(seconds * 1000, 1) for name, seconds in timings.items()}
+        self.journal(self.interview_id, kind, data)
+
+    def _expect(self, *states):
+        if self.state not in states:
+            raise InvalidTransition(f"Interview is {self.state}, expected {' or '.join(states)}")
+
+    @property
+    def ready(self):
+        """A resume has been processed, so questions can be generated"""
+        return bool(self.skills)
+
+    @property
+    def current_question(self):
+        return self.questions[self.index] if self.index < len(self.questions) else None
+
+    @property
+    def scores(self):
+        return [item['score'] for item in self.feedback]
+
+    @property
+    def total_questions(self):
+        """Questions the progress bar counts towards, follow-ups included"""
+        return min(len(self.questions) + 3, MAX_QUESTIONS)
+
+    @property
+    def wants_followup(self):
+        """The current question is the last one prepared and there is room for another"""
+        return len(self.questions) <= self.index + 1 < MAX_QUESTIONS
+
+    def summary(self):
+        """``(total_score, max_score, percentage)`` over the answered questions"""
+        total_score = sum(self.scores)
+        max_score = len(self.feedback) * 10
+        percentage = (total_score / max_score) * 100 if max_score > 0 else 0
+        return total_score, max_score, percentage
+
+    def feedback_data(self):
+        """What is saved with the interview"""
+        return {
+            'feedback': self.feedback,
+            'skills': self.skills,
+            'projects': self.projects,
+            'branch': self.branch
+        }
+
+    def load_profile(self, skills, projects, branch, api_key):
+        """A newly processed resume; any interview in progress starts over"""
+        self.skills = skills
+        self.projects = projects
+        self.branch = branch
+        self.api_key = api_key
+        self._reset()
+
+    def start(self, questions, timings=None):
+        """PREPARING -> ASKING with the generated questions"""
+        self._expect(PREPARING)
+        self.questions = list(questions)[:MAX_QUESTIONS]
+        self._log(START, timings, skills=self.skills, projects=self.projects, branch=self.branch,
+                  questions=self.questions)
+        self._advance()
+
+    def submit(self, response):
+        """ASKING -> EVALUATING; the answer waits in ``pending_response`` until it is recorded"""
+        self._expect(ASKING)
+        self.pending_response = response[:MAX_ANSWER_CHARS]
+        self.state = EVALUATING
+        self._log(SUBMIT, index=self.index, response=self.pending_response)
+
+    def record(self, item, followup=None, timings=None):
+        """EVALUATING -> ASKING (or COMPLETE after the last question) with the evaluated answer"""
+        self._expect(EVALUATING)
+        self.feedback.append(item)
+        if followup and len(self.questions) < MAX_QUESTIONS:
+            self.questions.append(followup)
+        else:
+            followup = None
+        self._log(ANSWER, timings, index=self.index,
+                  item={key: value for key, value in item.items() if key != 'response'}, followup=followup)
+        self.index += 1
+        self._advance()
+
+    def skip(self):
+        self._expect(ASKING, EVALUATING)
+        self._log(SKIP, index=self.index)
+        self.index += 1
+        self._advance()
+
+    def finish(self):
+        """End early; at least one answer must have been evaluated"""
+        self._expect(ASKING, EVALUATING)
+        if not self.feedback:
+            raise InvalidTransition("No answers to evaluate yet")
+        self._log(FINISH)
+        self.state = COMPLETE
+        self.pending_response = None
+
+    def mark_saved(self):
+        """The finished interview is in the feedback history; nothing is left to resume"""
+        self._expect(COMPLETE)
+        self.saved = True
+        self._log(SAVED)
+
+    def discard(self):
+        """Give up an unfinished interview so it is no longer offered for resumption"""
+        self._log(DISCARDED)
+
+    def _advance(self):
+        self.pending_response = None
+        self.state = ASKING if self.index < len(self.questions) else COMPLETE
@@ -0,0 +1,382 @@
+"""Gemini helpers shared by the Streamlit app and the batch tools.
+
+Every helper gets its model from ``_model_factory(api_key)``. It builds a
+Gemini model unless ``set_model_factory`` (or ``VINTERVU_LLM=stub``) swaps
+in another object with a ``generate_content(prompt)`` method, such as
+``stubs.StubModel`` for benchmarks and load tests.
+
+Calls go through ``_generate``, which records their tokens and cost in
+``usage``. Once the current user is over the daily token budget, helpers
+with a local fallback in ``bank`` use it instead of the model.
+"""
+import json
+import os
+import time
+
+import streamlit as st
+
+from . import bank, usage
+from .extraction import RESUME_CHAR_BUDGET
+from .metrics import timer
+
+MODEL_NAME = 'gemini-1.5-flash'
+
+
+def gemini_model(api_key):
+    import google.generativeai as genai
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(MODEL_NAME)
+
+
+if os.environ.get('VINTERVU_LLM') == 'stub':
+    from .stubs import StubModel as _model_factory
+else:
+    _model_factory = gemini_model
+
+
+def set_model_factory(factory):
+    """Build models with ``factory(api_key)`` from now on; None goes back to Gemini"""
+    global _model_factory
+    _model_factory = factory or gemini_model
+
+
+class BudgetExceeded(Exception):
+    """The current user is over today's token budget and the call is not essential"""
+
+
+def _model_name(model):
+    return getattr(model, 'model_name', MODEL_NAME).removeprefix('models/')
+
+
+def _generate(model, prompt, stage, essential=False):
+    """Text of ``model.generate_content(prompt)``, timed as ``stage`` and accounted in ``usage``
+
+    Over budget, a prompt already answered is served from ``usage.responses``;
+    anything else raises ``BudgetExceeded`` unless ``essential``.
+    """
+    name = _model_name(model)
+    if usage.over_budget():
+        text = usage.responses.get(name, prompt)
+        if text is not None:
+            usage.record(stage, name, 0, 0, 0.0, cached=True)
+            return text
+        if not essential:
+            raise BudgetExceeded(stage)
+    start = time.perf_counter()
+    try:
+        with timer(stage, len(prompt)) as measurement:
+            response = model.generate_content(prompt)
+            text = response.text
+            measurement.bytes_out = len(text)
+    except Exception:
+        # Failed calls are counted but not charged to the budget
+        usage.record(stage, name, 0, 0, time.perf_counter() - start, ok=False)
+        raise
+    usage.record(stage, name, *usage.token_counts(response, prompt, text), time.perf_counter() - start)
+    usage.responses.put(name, prompt, text)
+    return text
+
+
+def extract_resume_profile(text: str, api_key: str) -> dict:
+    """Ask Gemini for skills, projects and domains; raises on API or parse errors"""
+    model = _model_factory(api_key)
+    
+    prompt = f"""
+Analyze this resume text and extract:
+1. Technical skills (programming languages, frameworks, tools, technologies, software)
+2. Project titles and their key technologies used
+3. Domain expertise areas
+
+Respond in JSON format:
+{{
+    "skills": ["Skill1", "Skill2", "Skill3", ...],
+    "projects": [
+        {{"title": "Project Name", "technologies": ["Tech1", "Tech2"]}},
+        ...
+    ],
+    "domains": ["Domain1", "Domain2", ...]
+}}
+
+Resume Text:
+{text[:RESUME_CHAR_BUDGET]}
+    """
+    
+    response_text = _generate(model, prompt, 'gemini.extract_profile').strip()
+    json_start = response_text.find('{')
+    json_end = response_text.rfind('}') + 1
+    json_string = response_text[json_start:json_end]
+    result = json.loads(json_string)
+    
+    return {
+        'skills': result.get('skills', []),
+        'projects': result.get('projects', []),
+        'domains': result.get('domains', [])
+    }
+
+
+def extract_skills_and_projects_with_gemini(text: str, api_key: str) -> dict:
+    try:
+        return extract_resume_profile(text, api_key)
+    except BudgetExceeded:
+        return bank.keyword_profile(text)
+    except Exception as e:
+        st.error(f"Error extracting information with Gemini: {str(e)}")
+        return {'skills': [], 'projects': [], 'domains': []}
+
+
+def generate_technical_questions_enhanced(skills, projects, branch, api_key, asked_questions=[]):
+    """Generate enhanced technical questions based on specific skills and projects"""
+    try:
+        model = _model_factory(api_key)
+        
+        skill_list = ', '.join(skills[:10]) if skills else 'basic programming concepts'
+        project_info = ""
+        if projects:
+            for project in projects[:3]:
+                if isinstance(project, dict):
+                    project_info += f"Project: {project.get('title', 'Unknown')} using {', '.join(project.get('technologies', []))}\n"
+                else:
+                    project_info += f"Project: {project}\n"
+        
+        core_topics = get_core_topics(branch)
+        
+        prompt = f"""
+Generate 7 TECHNICAL interview questions for a {branch} candidate based on:
+
+CANDIDATE'S SKILLS: {skill_list}
+PROJECTS: 
+{project_info}
+CORE {branch.upper()} TOPICS: {', '.join(core_topics)}
+
+REQUIREMENTS:
+1. Focus 70% on candidate's actual skills and project technologies
+2. Include 30% core {branch} fundamentals
+3. Ask about specific implementations, not just definitions
+4. Include scenario-based questions
+5. Each question should be practical and implementation-focused
+6. Avoid these already asked topics: {', '.join(asked_questions) if asked_questions else 'none'}
+
+Format: Return only the questions, one per line, numbered 1-7.
+Make questions specific to the skills mentioned above.
+        """
+        
+        response = _generate(model, prompt, 'gemini.technical_questions')
+        questions = []
+        for line in response.split('\n'):
+            line = line.strip()
+            if line and (line[0].isdigit() or line.startswith('-')):
+                # Remove numbering
+                question = line.split('.', 1)[-1].strip() if '.' in line else line.strip('- ')
+                questions.append(question)
+        
+        # Filter out similar questions
+        def similarity(a, b):
+            a_words = set(a.lower().split())
+            b_words = set(b.lower().split())
+            common = a_words.intersection(b_words)
+            return len(common) / max(len(a_words), len(b_words), 1)
+        
+        filtered_questions = []
+        for q in questions:
+            if not any(similarity(q, aq) > 0.6 for aq in asked_questions):
+                filtered_questions.append(q)
+        
+        return filtered_questions[:5]
+        
+    except BudgetExceeded:
+        return bank.technical_questions(skills, branch, get_core_topics(branch), asked_questions)
+    except Exception as e:
+        st.error(f"Error generating technical questions: {str(e)}")
+        return [
+            "Explain the architecture of your most complex project.",
+            "How would you optimize the performance of your application?",
+            "Describe a challenging bug you encountered and how you solved it."
+        ]
+
+
+def generate_project_based_questions(projects, skills, api_key, asked_questions=[]):
+    """Generate questions specifically about candidate's projects"""
+    try:
+        model = _model_factory(api_key)
+        
+        project_details = ""
+        for project in projects[:3]:
+            if isinstance(project, dict):
+                project_details += f"- {project.get('title', 'Project')}: {', '.join(project.get('technologies', []))}\n"
+            else:
+                project_details += f"- {project}\n"
+        
+        prompt = f"""
+Based on these projects and skills, generate 3 specific project-based interview questions:
+
+PROJECTS:
+{project_details}
+
+SKILLS: {', '.join(skills[:8])}
+
+Generate questions that ask about:
+1. Technical challenges in these specific projects
+2. Implementation decisions and trade-offs
+3. How they used specific technologies mentioned
+
+Questions should be specific to these projects, not generic.
+Return only the questions, one per line.
+        """
+        
+        response = _generate(model, prompt, 'gemini.project_questions')
+        questions = [line.strip() for line in response.split('\n') if line.strip()]
+        return questions[:3]
+        
+    except BudgetExceeded:
+        return bank.project_questions(projects, asked_questions)
+    except Exception as e:
+        st.error(f"Error generating project questions: {str(e)}")
+        return ["Tell me about the biggest challenge in your recent project."]
+
+
+def generate_dynamic_followup(response, skills, projects, api_key):
+    """Generate follow-up questions based on the candidate's response"""
+    try:
+        model = _model_factory(api_key)
+        
+        prompt = f"""
+Based on this candidate response: "{response}"
+And their skills: {', '.join(skills[:5])}
+Generate ONE specific follow-up question that digs deeper into their technical knowledge.
+
+The follow-up should:
+1. Be more specific than the original answer
+2. Test deeper technical understanding
+3. Ask about implementation details or edge cases
+4. Be directly related to their mentioned skills
+
+Return only the question, nothing else.
+        """
+        
+        followup = _generate(model, prompt, 'gemini.followup')
+        return followup.strip()
+        
+    except BudgetExceeded:
+        return bank.followup(response)
+    except Exception as e:
+        st.error(f"Error generating follow-up: {str(e)}")
+        return "Can you elaborate on the technical implementation details?"
+
+
+def get_core_topics(branch):
+    core_map = {
+        'Computer Science': ['Data Structures', 'Algorithms', 'Operating Systems', 'DBMS', 'Computer Networks', 'OOP', 'System Design'],
+        'Electronics': ['Analog Circuits', 'Digital Logic', 'Microprocessors', 'Embedded Systems', 'VLSI', 'Signal Processing'],
+        'Electrical': ['Circuits', 'Control Systems', 'Signal Processing', 'Power Systems', 'Electromagnetics', 'Power Electronics'],
+        'Mechanical': ['Thermodynamics', 'Fluid Mechanics', 'Heat Transfer', 'Strength of Materials', 'Machine Design', 'Manufacturing'],
+        'Civil': ['Structural Analysis', 'Concrete Technology', 'Geotechnical Engineering', 'Transportation Engineering', 'Environmental Engineering'],
+    }
+    return core_map.get(branch, ['Engineering Fundamentals'])
+
+
+SCORE_FIELD = """
+    "score": "Integer from 0-10: technical accuracy (40%), depth (30%), clarity and structure (20%), practical insight (10%)","""
+
+
+def evaluate_response_enhanced(question, response, api_key):
+    """Enhanced evaluation with detailed feedback"""
+    try:
+        model = _model_factory(api_key)
+        # Over budget, the score is asked for in the feedback request instead of on its own
+        combined = usage.over_budget()
+        score = 5
+        
+        # Score evaluation
+        score_prompt = f"""
+Evaluate this technical interview response:
+Question: "{question}"
+Answer: "{response}"
+
+Score from 0-10 considering:
+- Technical accuracy (40%)
+- Depth of explanation (30%)
+- Clarity and structure (20%)
+- Practical insight (10%)
+
+Return only the numeric score (0-10).
+        """
+        
+        if not combined:
+            score_text = _generate(model, score_prompt, 'gemini.score').strip()
+            score = int(score_text) if score_text.isdigit() and 0 <= int(score_text) <= 10 else 5
+        
+        # Enhanced detailed feedback
+        feedback_prompt = f"""
+Analyze this technical interview response in detail:
+Question: "{question}"
+Answer: "{response}"
+
+Provide comprehensive feedback in the following format as JSON:
+{{{SCORE_FIELD if combined else ''}
+    "technical_strengths": "Detailed analysis of what was technically correct and well-explained (3-4 sentences)",
+    "communication_quality": "Assessment of clarity, structure, and communication skills shown (2-3 sentences)",
+    "knowledge_gaps": "Specific areas where knowledge could be improved or was missing (3-4 sentences)",
+    "implementation_insights": "Comments on practical understanding and real-world application (2-3 sentences)",
+    "detailed_suggestions": "Specific, actionable recommendations for improvement (4-5 sentences)",
+    "industry_relevance": "How well the answer reflects industry standards and best practices (2-3 sentences)",
+    "next_learning_steps": "Concrete next steps for skill development (3-4 specific recommendations)"
+}}
+
+Make each section detailed and specific to this particular response.
+        """
+        
+        feedback_text = _generate(model, feedback_prompt, 'gemini.evaluate' if combined else 'gemini.feedback',
+                                  essential=True)
+        
+        try:
+            json_start = feedback_text.find('{')
+            json_end = feedback_text.rfind('}') + 1
+            if json_start >= 0 and json_end > json_start:
+                json_string = feedback_text[json_start:json_end]
+                feedback_data = json.loads(json_string)
+                if combined and str(feedback_data.get('score', '')).isdigit():
+                    score = min(int(feedback_data['score']), 10)
+            else:
+                feedback_data = {
+                    "technical_strengths": "You demonstrated a solid understanding of the basic concepts and showed good problem-solving approach. Your answer covered the key technical points adequately.",
+                    "communication_quality": "Your explanation was clear and well-structured. You communicated your ideas in a logical sequence.",
+                    "knowledge_gaps": "There are opportunities to dive deeper into the technical implementation details. Consider exploring edge cases and potential challenges that might arise in real-world scenarios.",
+                    "implementation_insights": "Your answer shows practical awareness, but could benefit from more specific examples of how this would work in production environments.",
+                    "detailed_suggestions": "To strengthen your answer, consider including specific examples, discussing performance implications, mentioning relevant tools or frameworks, and addressing potential scalability concerns. Practice explaining complex concepts with concrete scenarios.",
+                    "industry_relevance": "Your response aligns with current industry practices. Consider staying updated with the latest trends and best practices in this area.",
+                    "next_learning_steps": "1. Practice implementing similar solutions in code, 2. Study real-world case studies, 3. Explore advanced features and optimization techniques"
+                }
+        except:
+            feedback_data = {
+                "technical_strengths": "You demonstrated a solid understanding of the basic concepts and showed good problem-solving approach. Your answer covered the key technical points adequately and reflected good foundational knowledge.",
+                "communication_quality": "Your explanation was clear and well-structured. You communicated your ideas in a logical sequence that was easy to follow.",
+                "knowledge_gaps": "There are opportunities to dive deeper into the technical implementation details. Consider exploring edge cases, error handling scenarios, and potential challenges that might arise in real-world applications.",
+                "implementation_insights": "Your answer shows practical awareness, but could benefit from more specific examples of how this would work in production environments with real constraints and requirements.",
+                "detailed_suggestions": "To strengthen your answer, consider including specific code examples, discussing performance implications and optimization strategies, mentioning relevant tools or frameworks, and addressing potential scalability concerns. Practice explaining complex concepts with concrete scenarios and real-world applications.",
+                "industry_relevance": "Your response aligns with current industry practices and shows good awareness of standard approaches. Consider staying updated with the latest trends and best practices.",
+                "next_learning_steps": "1. Practice implementing similar solutions hands-on with code, 2. Study real-world case studies and architecture examples, 3. Explore advanced features and optimization techniques in this domain"
+            }
+        
+        return {
+            'score': score,
+            'technical_strengths': feedback_data.get('technical_strengths', 'Good technical foundation shown'),
+            'communication_quality': feedback_data.get('communication_quality', 'Clear communication style'),
+            'knowledge_gaps': feedback_data.get('knowledge_gaps', 'Some areas for technical depth improvement'),
+            'implementation_insights': feedback_data.get('implementation_insights', 'Shows practical understanding'),
+            'detailed_suggestions': feedback_data.get('detailed_suggestions', 'Continue practicing and studying'),
+            'industry_relevance': feedback_data.get('industry_relevance', 'Aligned with industry standards'),
+            'next_learning_steps': feedback_data.get('next_learning_steps', 'Keep learning and practicing')
+        }
+        
+    except Exception as e:
+        st.error(f"Error evaluating response: {str(e)}")
+        return {
+            'score': 5,
+            'technical_strengths': 'Unable to evaluate technical accuracy due to system error. Your response shows effort and engagement with the question.',
+            'communication_quality': 'Communication style appears clear and structured based on visible content.',
+            'knowledge_gaps': 'System unable to assess specific knowledge gaps. Consider reviewing fundamental concepts and implementation details.',
+            'implementation_insights': 'Consider focusing on practical applications and real-world implementation scenarios.',
+            'detailed_suggestions': 'Due to evaluation system error, recommend reviewing the question topic thoroughly, practicing with code examples, and studying best practices in this area.',
+            'industry_relevance': 'Stay updated with current industry standards and practices in this technical area.',
+            'next_learning_steps': '1. Review core concepts, 2. Practice hands-on implementation, 3. Study industry case studies'
+        }
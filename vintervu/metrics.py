@@ -0,0 +1,188 @@
+"""Per-stage timings of the slow paths: Gemini, SQLite, resume extraction and speech.
+
+``timed`` wraps a function (and ``timer`` a block) so that every call records
+its wall time, whether it succeeded and the size of what went in and came
+out. Records go to a fixed-size in-memory ring buffer, so measuring costs no
+I/O on the request path; a background thread flushes the buffer to the
+``metrics`` table every FLUSH_SECONDS, and the admin page reads percentiles
+per stage from there. If flushing falls behind, the oldest records are
+dropped and counted in ``recorder.dropped``.
+"""
+import atexit
+import contextlib
+import functools
+import os
+import threading
+import time
+from collections import deque
+
+RING_SIZE = int(os.environ.get('VINTERVU_METRICS_RING_SIZE', 10000))
+FLUSH_SECONDS = float(os.environ.get('VINTERVU_METRICS_FLUSH_SECONDS', 10))
+
+
+def payload_size(value) -> int:
+    """Rough size of call arguments or results: characters of text and bytes of binary data, through lists and dicts"""
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(payload_size(key) + payload_size(item) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(payload_size(item) for item in value)
+    return 0
+
+
+def _write(rows):
+    # db.py times its own functions with this module, so it is imported late
+    from .db import insert_metrics
+    insert_metrics(rows)
+
+
+class Recorder:
+    """Ring buffer of ``(stage, started_at, seconds, ok, bytes_in, bytes_out)`` records
+
+    ``usage`` buffers its own rows in another instance through ``append``.
+    """
+
+    def __init__(self, size=RING_SIZE, interval=FLUSH_SECONDS, sink=_write, name='metrics-flush'):
+        self.buffer = deque(maxlen=size)
+        self.interval = interval
+        self.sink = sink
+        self.name = name
+        self.dropped = 0
+        # Finished flushes, and the batches ``sink`` is writing right now
+        self.flushes = 0
+        self._writing = []
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def record(self, stage, seconds, ok, bytes_in=0, bytes_out=0):
+        self.append((stage, time.time() - seconds, seconds, ok, bytes_in, bytes_out))
+
+    def append(self, row):
+        """Buffer any row ``sink`` accepts; the oldest is dropped once the buffer is full"""
+        with self._lock:
+            if len(self.buffer) == self.buffer.maxlen:
+                self.dropped += 1
+            self.buffer.append(row)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def drain(self) -> list:
+        with self._lock:
+            rows = list(self.buffer)
+            self.buffer.clear()
+        return rows
+
+    def unwritten(self):
+        """``(rows, flushes)``: the rows not yet written, buffered or mid-flush, and how many flushes have finished"""
+        with self._lock:
+            return list(self.buffer) + [row for rows in self._writing for row in rows], self.flushes
+
+    def flush(self) -> int:
+        """Write the buffered records out now and return how many there were"""
+        with self._lock:
+            rows = list(self.buffer)
+            self.buffer.clear()
+            if not rows:
+                return 0
+            self._writing.append(rows)
+        try:
+            self.sink(rows)
+        except Exception:
+            with self._lock:
+                self.dropped += len(rows)
+            raise
+        finally:
+            with self._lock:
+                self._writing.remove(rows)
+                self.flushes += 1
+        return len(rows)
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.flush()
+            except Exception:
+                # Counted in ``dropped``; the next flush may well succeed
+                pass
+
+
+# Shared by every session's script thread
+recorder = Recorder()
+
+
+class _Measurement:
+    __slots__ = ('bytes_in', 'bytes_out')
+
+    def __init__(self, bytes_in):
+        self.bytes_in = bytes_in
+        self.bytes_out = 0
+
+
+@contextlib.contextmanager
+def timer(stage, bytes_in=0):
+    """Time the block as ``stage``; set ``bytes_out`` on the yielded object to record the result size"""
+    measurement = _Measurement(bytes_in)
+    start = time.perf_counter()
+    try:
+        yield measurement
+    except Exception:
+        recorder.record(stage, time.perf_counter() - start, False, measurement.bytes_in, measurement.bytes_out)
+        raise
+    recorder.record(stage, time.perf_counter() - start, True, measurement.bytes_in, measurement.bytes_out)
+
+
+def timed(stage, ok=None):
+    """Record every call of the decorated function as ``stage``
+
+    A call that raises is a failure. Functions that report failure through
+    their return value instead pass ``ok(result) -> bool``.
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bytes_in = payload_size(args) + payload_size(kwargs)
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                recorder.record(stage, time.perf_counter() - start, False, bytes_in)
+                raise
+            succeeded = True if ok is None else bool(ok(result))
+            recorder.record(stage, time.perf_counter() - start, succeeded, bytes_in, payload_size(result))
+            return result
+        return wrapper
+    return decorate
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def stage_summary(rows) -> list:
+    """One dict per stage, slowest p95 first, from ``(stage, seconds, ok, bytes_in, bytes_out)`` rows"""
+    stages = {}
+    for stage, seconds, ok, bytes_in, bytes_out in rows:
+        stages.setdefault(stage, []).append((seconds, ok, bytes_in, bytes_out))
+
+    summary = []
+    for stage, calls in stages.items():
+        seconds = sorted(call[0] for call in calls)
+        summary.append({
+            'stage': stage,
+            'calls': len(calls),
+            'failures': sum(1 for call in calls if not call[1]),
+            'p50_ms': percentile(seconds, 0.50) * 1000,
+            'p95_ms': percentile(seconds, 0.95) * 1000,
+            'p99_ms': percentile(seconds, 0.99) * 1000,
+            'max_ms': seconds[-1] * 1000,
+            'total_s': sum(seconds),
+            'mean_in_kb': sum(call[2] for call in calls) / len(calls) / 1024,
+            'mean_out_kb': sum(call[3] for call in calls) / len(calls) / 1024,
+        })
+    summary.sort(key=lambda row: row['p95_ms'], reverse=True)
+    return summary
@@ -0,0 +1,125 @@
+"""cProfile and tracemalloc around a single script run.
+
+Admins can turn on "Profile reruns" in the sidebar. Each of their runs is
+then wrapped in a ``RunProfiler``, which keeps the slowest functions by
+cumulative time and the largest allocations for the sidebar panel. It also
+writes the full profile to ``PROFILE_DIR`` as a ``.prof`` file for
+snakeviz, gprof2dot or ``python -m pstats``. Runs of everyone else are not
+touched, so the toggle costs nothing while it is off.
+
+cProfile only sees the thread that enabled it, that is the session's own
+script thread. tracemalloc, however, is process-wide, so allocations by other
+sessions running at the same time are included, and only one run per
+process is profiled at a time.
+"""
+import cProfile
+import os
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+
+PROFILE_DIR = os.environ.get('VINTERVU_PROFILE_DIR', 'profiles')
+TOP_N = 15
+
+_lock = threading.Lock()
+
+# Allocations made by the profiler itself
+_IGNORED = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, cProfile.__file__),
+    tracemalloc.Filter(False, pstats.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+]
+
+
+def _where(filename, lineno):
+    """``package/module.py:12``, short enough for the sidebar"""
+    parts = filename.replace('\\', '/').split('/')
+    return f"{'/'.join(parts[-2:])}:{lineno}"
+
+
+def top_functions(profile, count=TOP_N) -> list:
+    """The ``count`` functions with the most cumulative time, as dicts"""
+    stats = pstats.Stats(profile).sort_stats(pstats.SortKey.CUMULATIVE)
+    rows = []
+    for func in stats.fcn_list[:count]:
+        _, calls, total, cumulative, _ = stats.stats[func]
+        filename, lineno, name = func
+        rows.append({
+            'function': name if filename == '~' else f"{name} ({_where(filename, lineno)})",
+            'calls': calls,
+            'own_ms': total * 1000,
+            'cumulative_ms': cumulative * 1000,
+        })
+    return rows
+
+
+def top_allocations(snapshot, count=TOP_N) -> list:
+    """The ``count`` source lines holding the most traced memory, as dicts"""
+    statistics = snapshot.filter_traces(_IGNORED).statistics('lineno')
+    return [{'line': _where(stat.traceback[0].filename, stat.traceback[0].lineno),
+             'size_kb': stat.size / 1024, 'blocks': stat.count}
+            for stat in statistics[:count]]
+
+
+class RunProfiler:
+    """``with RunProfiler(label) as profiler: ...``, then ``profiler.result``
+
+    ``result`` stays None if another run in this process was being profiled.
+    """
+
+    def __init__(self, label, directory=PROFILE_DIR, top=TOP_N):
+        self.label = label
+        self.directory = directory
+        self.top = top
+        self.result = None
+        self._profile = None
+
+    def __enter__(self):
+        if not _lock.acquire(blocking=False):
+            return self
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._profile = cProfile.Profile()
+        self._start = time.perf_counter()
+        self._profile.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._profile is None:
+            return False
+        try:
+            self._profile.disable()
+            seconds = time.perf_counter() - self._start
+            snapshot = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+            if self._started_tracing:
+                tracemalloc.stop()
+        finally:
+            _lock.release()
+        self.result = {
+            'label': self.label,
+            'finished_at': time.time(),
+            'seconds': seconds,
+            'peak_kb': peak / 1024,
+            'functions': top_functions(self._profile, self.top),
+            'allocations': top_allocations(snapshot, self.top),
+            'path': self.dump(),
+        }
+        return False
+
+    def dump(self):
+        """Write the full profile to ``directory``; the path, or None if it could not be written"""
+        slug = re.sub(r'[^A-Za-z0-9_-]+', '-', self.label).strip('-') or 'run'
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{time.time_ns() // 1000 % 10**6:06d}-{slug}-{os.getpid()}.prof"
+        path = os.path.join(self.directory, name)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            self._profile.dump_stats(path)
+        except OSError:
+            return None
+        return path
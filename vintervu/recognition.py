@@ -0,0 +1,177 @@
+"""Run several speech recognition engines on the same audio at once.
+
+Instead of waiting for Google to fail before trying Sphinx, the orchestrator
+submits the configured engines together and returns the first acceptable
+transcript. Engines that are still queued are cancelled; ones already running
+finish in the background and only feed the statistics.
+
+One orchestrator is shared by every session on a server, so its pool is sized
+for ``concurrency`` recognitions at once. Each engine gets ``timeout`` seconds
+from the moment it starts running, not from when it was queued, and network
+engines are bounded by the same limit through ``operation_timeout``, so a
+hung request cannot hold a worker forever. A recognition that waits longer
+than ``queue_timeout`` for a free worker gives up.
+"""
+import os
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import speech_recognition as sr
+
+RACE = 'race'
+OFFLINE_FIRST = 'offline_first'
+POLICIES = (RACE, OFFLINE_FIRST)
+
+DEFAULT_ENGINES = os.environ.get('VINTERVU_SPEECH_ENGINES', 'google,sphinx').split(',')
+DEFAULT_POLICY = os.environ.get('VINTERVU_SPEECH_POLICY', RACE)
+DEFAULT_TIMEOUT = 20
+# Recognitions the shared pool runs at once, with every engine in parallel
+DEFAULT_CONCURRENCY = int(os.environ.get('VINTERVU_SPEECH_CONCURRENCY', 8))
+
+# name -> (recognize function, needs network)
+ENGINES = {
+    'google': (lambda recognizer, audio: recognizer.recognize_google(audio), True),
+    'sphinx': (lambda recognizer, audio: recognizer.recognize_sphinx(audio), False),
+    'whisper': (lambda recognizer, audio: recognizer.recognize_whisper(audio), False),
+    'vosk': (lambda recognizer, audio: recognizer.recognize_vosk(audio), False),
+}
+
+
+def acceptable(text):
+    """Default acceptance test: any non-blank transcript"""
+    return bool(text and text.strip())
+
+
+class EngineStats:
+    """Call counts and recent latencies for one engine"""
+
+    def __init__(self, window=200):
+        self.calls = 0
+        self.successes = 0
+        self.failures = 0
+        self.wins = 0
+        self.last_error = ""
+        self.latencies = deque(maxlen=window)
+
+    def as_row(self, name):
+        latencies = list(self.latencies)
+        return {
+            'engine': name,
+            'calls': self.calls,
+            'success_rate': round(self.successes / self.calls, 2) if self.calls else None,
+            'wins': self.wins,
+            'p50_ms': round(statistics.median(latencies) * 1000) if latencies else None,
+            'max_ms': round(max(latencies) * 1000) if latencies else None,
+            'last_error': self.last_error,
+        }
+
+
+class RecognitionOrchestrator:
+    """First-good-result-wins speech recognition across engines
+
+    ``policy`` is ``RACE`` (all engines at once) or ``OFFLINE_FIRST`` (local
+    engines race first; online engines only run if none of them produced an
+    acceptable transcript).
+    """
+
+    def __init__(self, engines=None, policy=None, timeout=DEFAULT_TIMEOUT, accept=acceptable,
+                 concurrency=DEFAULT_CONCURRENCY, queue_timeout=None):
+        engines = [name.strip() for name in (engines or DEFAULT_ENGINES) if name.strip()]
+        unknown = [name for name in engines if name not in ENGINES]
+        if unknown:
+            raise ValueError(f"Unknown speech engines: {', '.join(unknown)}")
+        policy = policy or DEFAULT_POLICY
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown recognition policy: {policy}")
+
+        self.engines = engines
+        self.policy = policy
+        self.timeout = timeout
+        self.queue_timeout = timeout if queue_timeout is None else queue_timeout
+        self.accept = accept
+        self._stats = {name: EngineStats() for name in engines}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max(2, len(engines) * concurrency),
+                                            thread_name_prefix="speech-engine")
+
+    def _run_engine(self, name, audio, started):
+        """Recognise ``audio`` with one engine; records in ``started`` when it got a worker"""
+        started[name] = time.monotonic()
+        recognize, _ = ENGINES[name]
+        recognizer = sr.Recognizer()
+        recognizer.operation_timeout = self.timeout
+        start = time.perf_counter()
+        try:
+            text, error = recognize(recognizer, audio), ""
+        except sr.UnknownValueError:
+            text, error = "", "could not understand audio"
+        except Exception as e:
+            text, error = "", str(e) or type(e).__name__
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            stats = self._stats[name]
+            stats.calls += 1
+            stats.latencies.append(elapsed)
+            if self.accept(text):
+                stats.successes += 1
+            else:
+                stats.failures += 1
+                stats.last_error = error or "empty transcript"
+        return name, text
+
+    def _race(self, names, audio):
+        started = {}
+        futures = {self._executor.submit(self._run_engine, name, audio, started): name for name in names}
+        pending = set(futures)
+        queued_until = time.monotonic() + self.queue_timeout
+        try:
+            while pending:
+                # Running engines have until ``timeout`` after they started, queued ones until queued_until
+                deadlines = {future: started[futures[future]] + self.timeout if futures[future] in started
+                             else queued_until for future in pending}
+                now = time.monotonic()
+                expired = {future for future in pending if deadlines[future] <= now}
+                for future in expired:
+                    future.cancel()
+                pending -= expired
+                if not pending:
+                    return "", None
+                done, pending = wait(pending, timeout=min(deadlines[future] for future in pending) - now,
+                                     return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, text = future.result()
+                    if self.accept(text):
+                        return text, name
+            return "", None
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def recognize(self, audio):
+        """Return ``(transcript, engine)``; ``("", None)`` when no engine succeeded in time"""
+        if self.policy == OFFLINE_FIRST:
+            stages = [
+                [name for name in self.engines if not ENGINES[name][1]],
+                [name for name in self.engines if ENGINES[name][1]],
+            ]
+        else:
+            stages = [self.engines]
+
+        for names in stages:
+            if not names:
+                continue
+            text, engine = self._race(names, audio)
+            if engine:
+                with self._lock:
+                    self._stats[engine].wins += 1
+                return text, engine
+        return "", None
+
+    def stats(self):
+        """One row per engine, for display"""
+        with self._lock:
+            return [self._stats[name].as_row(name) for name in self.engines]
@@ -0,0 +1,135 @@
+"""Re-drive a recorded interview against the stub model.
+
+Usage:
+    python -m vintervu.replay [--db vintervu.db] --list [--email EMAIL]
+    python -m vintervu.replay [--db vintervu.db] (INTERVIEW_ID | --email EMAIL) [--llm-latency-ms 0] [--output FILE]
+
+The interview's checkpoint events are applied one by one to a fresh
+``InterviewSession``. Before each event, the ``llm`` calls the interview page
+made for it are made again, with ``stubs.StubModel`` in place of Gemini: the
+question generation, the evaluation of each answer and its follow-up. For
+every event it prints the gap since the previous one and the recorded model
+time next to the replayed one, and the recorded score next to the
+replayed one. Slow stages and odd scores can then be chased offline. The
+stub answers each prompt the same way every time, so replays of an interview
+agree with each other. Usage and timings of the replay go to a scratch
+database, not to --db.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from . import db, llm
+from .interview import ANSWER, START, InterviewSession
+from .stubs import stub_model_factory
+
+API_KEY = 'stub-key'
+
+
+def replay(events, latency=0.0):
+    """One dict per event: what was recorded and what the replay took and scored"""
+    llm.set_model_factory(stub_model_factory(latency))
+    session = InterviewSession()
+    previous = None
+    for kind, data in events:
+        row = {'event': kind, 'index': data.get('index'), 'recorded_ms': data.get('ms', {}), 'replayed_ms': {}}
+        if previous is not None and 't' in data:
+            row['gap_s'] = round(data['t'] - previous, 3)
+        previous = data.get('t', previous)
+
+        def timed(name, func, *args):
+            start = time.perf_counter()
+            result = func(*args)
+            row['replayed_ms'][name] = round((time.perf_counter() - start) * 1000, 1)
+            return result
+
+        if kind == START:
+            questions = timed('questions', lambda: (
+                llm.generate_technical_questions_enhanced(data['skills'], data['projects'], data['branch'], API_KEY)
+                + llm.generate_project_based_questions(data['projects'], data['skills'], API_KEY)))
+            row['questions'] = len(data['questions'])
+            row['replayed_questions'] = len(questions)
+        elif kind == ANSWER:
+            question = session.current_question
+            response = data['item'].get('response', session.pending_response)
+            evaluation = timed('evaluate', llm.evaluate_response_enhanced, question, response, API_KEY)
+            row['score'] = data['item'].get('score')
+            row['replayed_score'] = evaluation['score']
+            if data.get('followup'):
+                timed('followup', llm.generate_dynamic_followup, response, session.skills, session.projects, API_KEY)
+        # The session follows the recording, so later events see the questions the candidate was asked
+        session.apply(kind, data)
+        yield row
+
+
+def format_ms(timings) -> str:
+    return " ".join(f"{name}={ms:.0f}" for name, ms in timings.items()) or "-"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m vintervu.replay',
+                                     description="Replay a recorded interview against the stub model")
+    parser.add_argument('interview_id', nargs='?', help="Interview to replay (default: the latest of --email)")
+    parser.add_argument('--db', default=db.DB_PATH, help="Interview database (default: $VINTERVU_DB_PATH or vintervu.db)")
+    parser.add_argument('--email', help="Replay this user's latest interview, or only list theirs")
+    parser.add_argument('--list', action='store_true', help="List recent interviews instead")
+    parser.add_argument('--llm-latency-ms', type=float, default=0, help="Simulated network time per model call")
+    parser.add_argument('-o', '--output', help="Also write one JSON line per event here")
+    args = parser.parse_args(argv)
+
+    db.DB_PATH = args.db
+    if args.list:
+        for interview_id, email, events, started, last_event in db.recent_interviews(email=args.email):
+            print(f"{interview_id}  {email:<30} {events:>3} events  {started} .. {last_event}")
+        return
+    if args.interview_id:
+        found = db.interview_events(args.interview_id)
+        if found is None:
+            parser.error(f"no events for interview {args.interview_id}")
+        email, events = found
+        interview_id = args.interview_id
+    elif args.email:
+        found = db.latest_checkpoints(args.email)
+        if found is None:
+            parser.error(f"no interviews for {args.email}")
+        email = args.email
+        interview_id, events = found
+    else:
+        parser.error("give an interview id, --email or --list")
+
+    # Nothing the replay records should end up next to the real interviews
+    db.DB_PATH = os.path.join(tempfile.mkdtemp(prefix='vintervu-replay-'), 'replay.db')
+    db.init_database()
+    print(f"Replaying {interview_id} ({email}, {len(events)} events)", file=sys.stderr)
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else None
+    recorded_total = replayed_total = 0.0
+    changed_scores = 0
+    try:
+        for n, row in enumerate(replay(events, args.llm_latency_ms / 1000), 1):
+            recorded_total += sum(row['recorded_ms'].values())
+            replayed_total += sum(row['replayed_ms'].values())
+            question = '' if row['index'] is None else f"q{row['index'] + 1}"
+            gap = f"+{row['gap_s']:.1f}s" if 'gap_s' in row else ''
+            line = (f"{n:>3} {row['event']:<9} {question:<4} {gap:>8}  "
+                    f"recorded {format_ms(row['recorded_ms'])}  replayed {format_ms(row['replayed_ms'])}")
+            if 'score' in row:
+                changed_scores += row['score'] != row['replayed_score']
+                line += f"  score {row['score']} -> {row['replayed_score']}"
+            if 'questions' in row:
+                line += f"  questions {row['questions']} -> {row['replayed_questions']}"
+            print(line)
+            if out:
+                out.write(json.dumps(dict(row, interview_id=interview_id)) + '\n')
+    finally:
+        if out:
+            out.close()
+    print(f"Model time: {recorded_total:.0f} ms recorded, {replayed_total:.0f} ms replayed; "
+          f"{changed_scores} score(s) differ", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
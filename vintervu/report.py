@@ -0,0 +1,67 @@
+"""HTML for the per-question interview feedback report.
+
+Each answered question is turned into one escaped HTML block (question,
+answer and every feedback section) instead of a markdown element per
+section. Blocks are cached by a hash of the feedback item, so re-rendering
+the same report, on the completion screen or the dashboard, only costs the
+hash.
+"""
+import hashlib
+import html
+import json
+import threading
+from collections import OrderedDict
+
+# (feedback key, heading, CSS class) in display order
+SECTIONS = [
+    ('technical_strengths', "🎯 Technical Strengths & Accuracy", 'feedback-positive'),
+    ('communication_quality', "🗣️ Communication & Clarity Assessment", 'feedback-positive'),
+    ('knowledge_gaps', "📚 Knowledge Gaps & Missing Elements", 'feedback-improvement'),
+    ('implementation_insights', "⚙️ Implementation & Practical Insights", 'feedback-neutral'),
+    ('detailed_suggestions', "💡 Detailed Improvement Recommendations", 'feedback-improvement'),
+    ('industry_relevance', "🏭 Industry Standards & Relevance", 'feedback-neutral'),
+    ('next_learning_steps', "📈 Next Learning Steps & Action Plan", 'feedback-positive'),
+]
+
+CACHE_SIZE = 1024
+
+# Shared by every session's script thread
+_cache = OrderedDict()
+_lock = threading.Lock()
+
+
+def feedback_hash(item: dict) -> str:
+    return hashlib.sha256(json.dumps(item, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def _text(value) -> str:
+    return html.escape(str(value)).replace('\n', '<br>')
+
+
+def build_question_html(item: dict) -> str:
+    parts = [
+        f"<p><strong>❓ Interview Question:</strong> {_text(item.get('question', 'N/A'))}</p>",
+        f"<p><strong>💬 Your Response:</strong> {_text(item.get('response', 'N/A'))}</p>",
+        "<hr>",
+    ]
+    for key, heading, css_class in SECTIONS:
+        if key in item:
+            parts.append(f'<div class="feedback-section {css_class}"><h4>{heading}</h4>'
+                         f'<p>{_text(item[key])}</p></div>')
+    return "\n".join(parts)
+
+
+def question_html(item: dict) -> str:
+    """The HTML block for one feedback item, from cache when the item was seen before"""
+    key = feedback_hash(item)
+    with _lock:
+        block = _cache.get(key)
+        if block is not None:
+            _cache.move_to_end(key)
+            return block
+    block = build_question_html(item)
+    with _lock:
+        _cache[key] = block
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return block
@@ -0,0 +1,157 @@
+"""Re-transcribe archived answer audio with a local speech engine.
+
+Usage:
+    python -m vintervu.retranscribe [--db vintervu.db] [--engine sphinx] [--output diffs.jsonl]
+
+Every interview answer saved with an ``audio_ref`` is recognised again in a
+pool of processes, and the new transcript is compared word by word with the
+one captured during the interview, so a better engine can be evaluated on
+real answers before it is switched on.
+"""
+import argparse
+import difflib
+import json
+import re
+import sqlite3
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import speech_recognition as sr
+
+from .audio_archive import DEFAULT_ROOT, AudioArchive
+from .db import DB_PATH
+from .recognition import ENGINES
+
+LOCAL_ENGINES = [name for name, (_, online) in ENGINES.items() if not online]
+
+
+def iter_archived_answers(db_path: str):
+    """Feedback items that have a recording, oldest interview first"""
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute("SELECT id, email, feedback_data FROM feedback ORDER BY id").fetchall()
+    finally:
+        conn.close()
+
+    for feedback_id, email, feedback_data in rows:
+        try:
+            items = json.loads(feedback_data or '{}').get('feedback', [])
+        except ValueError:
+            continue
+        for index, item in enumerate(items):
+            if item.get('audio_ref'):
+                yield {
+                    'feedback_id': feedback_id,
+                    'email': email,
+                    'question_index': index,
+                    'question': item.get('question', ''),
+                    'audio_ref': item['audio_ref'],
+                    'transcript': item.get('transcript', item.get('response', '')),
+                }
+
+
+def transcribe(archive_root: str, ref: str, engine: str):
+    """Recognise one archived recording; runs in a pool process"""
+    audio = AudioArchive(archive_root).load(ref)
+    recognize, _ = ENGINES[engine]
+    start = time.perf_counter()
+    try:
+        text = recognize(sr.Recognizer(), audio)
+    except sr.UnknownValueError:
+        text = ""
+    return text, time.perf_counter() - start
+
+
+def _words(text: str) -> list:
+    return re.findall(r"[\w']+", text.lower())
+
+
+def word_diff(old: str, new: str):
+    """``(changes, word_error_rate)`` of ``new`` measured against ``old``
+
+    Each change is ``{'op': 'replace'|'delete'|'insert', 'old': ..., 'new': ...}``.
+    """
+    old_words, new_words = _words(old), _words(new)
+    matcher = difflib.SequenceMatcher(None, old_words, new_words, autojunk=False)
+    changes = []
+    errors = 0
+    for op, i1, i2, j1, j2 in matcher.get_opcodes():
+        if op == 'equal':
+            continue
+        changes.append({'op': op, 'old': " ".join(old_words[i1:i2]), 'new': " ".join(new_words[j1:j2])})
+        errors += max(i2 - i1, j2 - j1)
+    if not old_words:
+        return changes, (1.0 if new_words else 0.0)
+    return changes, errors / len(old_words)
+
+
+def format_changes(changes: list) -> str:
+    parts = []
+    for change in changes:
+        if change['old']:
+            parts.append(f"-[{change['old']}]")
+        if change['new']:
+            parts.append(f"+[{change['new']}]")
+    return " ".join(parts)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m vintervu.retranscribe',
+                                     description="Re-transcribe archived interview answers")
+    parser.add_argument('--db', default=DB_PATH, help="Interview database (default: $VINTERVU_DB_PATH or vintervu.db)")
+    parser.add_argument('--audio-dir', default=DEFAULT_ROOT, help="Audio archive directory")
+    parser.add_argument('--engine', default='sphinx', choices=LOCAL_ENGINES)
+    parser.add_argument('--workers', type=int, default=None, help="Recognition processes (default: CPU count)")
+    parser.add_argument('-o', '--output', help="Also write one JSON line per answer here")
+    args = parser.parse_args(argv)
+
+    archive = AudioArchive(args.audio_dir)
+    answers = [answer for answer in iter_archived_answers(args.db) if answer['audio_ref'] in archive]
+    refs = sorted({answer['audio_ref'] for answer in answers})
+    print(f"Re-transcribing {len(refs)} recordings ({len(answers)} answers) with {args.engine}", file=sys.stderr)
+
+    results = {}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {ref: pool.submit(transcribe, args.audio_dir, ref, args.engine) for ref in refs}
+        for ref, future in futures.items():
+            try:
+                results[ref] = future.result()
+            except Exception as e:
+                results[ref] = e
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else None
+    rates = []
+    failures = 0
+    try:
+        for answer in answers:
+            result = results[answer['audio_ref']]
+            row = dict(answer, engine=args.engine)
+            label = f"feedback {answer['feedback_id']} q{answer['question_index'] + 1}"
+            if isinstance(result, Exception):
+                failures += 1
+                row['error'] = f"{type(result).__name__}: {result}"
+                print(f"{label}: error: {row['error']}")
+            else:
+                text, seconds = result
+                changes, rate = word_diff(answer['transcript'], text)
+                rates.append(rate)
+                row.update(new_transcript=text, changes=changes, word_error_rate=round(rate, 3),
+                           seconds=round(seconds, 3))
+                print(f"{label}: WER {rate:.2f}  {format_changes(changes) or '(identical)'}")
+            if out:
+                out.write(json.dumps(row) + '\n')
+    finally:
+        if out:
+            out.close()
+
+    print(f"\n{len(answers)} answers in {time.perf_counter() - start:.1f}s, {failures} failed"
+          + (f", mean WER vs. captured transcripts {statistics.mean(rates):.3f}" if rates else ""),
+          file=sys.stderr)
+    return 0 if not failures else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""Session state kept outside the Streamlit process.
+
+Streamlit holds ``st.session_state`` in the memory of the process that owns
+the browser's websocket, so behind a load balancer a reconnect that lands on
+another replica used to start from scratch. The app stores the part of the
+session that matters (login and interview progress) as size-capped JSON
+under a random session id, which the browser carries in the ``sid`` query
+parameter, so any replica can pick the session up on its next run. The
+stored session is bound to the browser that stored it (``ui._browser_binding``),
+and the Gemini API key is never part of it.
+
+Set ``VINTERVU_SESSION_STORE`` to a ``redis://`` URL to share sessions through
+Redis (or any server speaking its protocol), or to the path of a SQLite
+file; by default they are kept in the app's SQLite database, which suits
+replicas on one host.
+"""
+import json
+import os
+import sqlite3
+import time
+
+from .db import DB_PATH
+from .metrics import timed
+
+MAX_SESSION_BYTES = int(os.environ.get('VINTERVU_SESSION_MAX_KB', 256)) * 1024
+SESSION_TTL = int(os.environ.get('VINTERVU_SESSION_TTL_HOURS', 24)) * 3600
+
+
+class SessionTooLarge(ValueError):
+    pass
+
+
+def encode(state: dict, max_bytes=MAX_SESSION_BYTES) -> bytes:
+    data = json.dumps(state, separators=(',', ':')).encode('utf-8')
+    if len(data) > max_bytes:
+        raise SessionTooLarge(f"Session is {len(data) // 1024}KB, over the {max_bytes // 1024}KB limit")
+    return data
+
+
+def decode(data: bytes) -> dict:
+    return json.loads(data)
+
+
+class SqliteSessionStore:
+    """Sessions in a table of the app database; expired rows are ignored and purged"""
+
+    def __init__(self, path=DB_PATH, ttl=SESSION_TTL):
+        self.path = path
+        self.ttl = ttl
+        conn = self._connect()
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS sessions (
+                    sid TEXT PRIMARY KEY,
+                    data BLOB NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _connect(self):
+        # Several replicas write here at once; wait for their locks instead of failing
+        return sqlite3.connect(self.path, timeout=10)
+
+    @timed('session.load')
+    def load(self, sid):
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT data FROM sessions WHERE sid = ? AND updated_at > ?",
+                               (sid, time.time() - self.ttl)).fetchone()
+        finally:
+            conn.close()
+        return row[0] if row else None
+
+    @timed('session.save')
+    def save(self, sid, data: bytes):
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT INTO sessions (sid, data, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(sid) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at",
+                (sid, data, time.time())
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def delete(self, sid):
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM sessions WHERE sid = ?", (sid,))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def purge(self) -> int:
+        """Delete expired sessions and return how many there were"""
+        conn = self._connect()
+        try:
+            deleted = conn.execute("DELETE FROM sessions WHERE updated_at <= ?", (time.time() - self.ttl,)).rowcount
+            conn.commit()
+        finally:
+            conn.close()
+        return deleted
+
+
+class RedisSessionStore:
+    """Sessions as Redis keys that expire on their own"""
+
+    def __init__(self, url, ttl=SESSION_TTL, prefix='vintervu:session:'):
+        import redis
+        self.client = redis.Redis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+
+    @timed('session.load')
+    def load(self, sid):
+        return self.client.get(self.prefix + sid)
+
+    @timed('session.save')
+    def save(self, sid, data: bytes):
+        self.client.set(self.prefix + sid, data, ex=self.ttl)
+
+    def delete(self, sid):
+        self.client.delete(self.prefix + sid)
+
+    def purge(self) -> int:
+        return 0
+
+
+def open_session_store(url=None):
+    """The store named by ``url`` or VINTERVU_SESSION_STORE: a redis:// URL, or SQLite by default"""
+    url = url or os.environ.get('VINTERVU_SESSION_STORE', '')
+    if url.startswith(('redis://', 'rediss://', 'unix://')):
+        return RedisSessionStore(url)
+    return SqliteSessionStore(url or DB_PATH)
@@ -0,0 +1,421 @@
+"""Microphone capture and speech recognition off the Streamlit script thread.
+
+The Streamlit script thread must not sit inside ``Recognizer.listen`` for up to
+a minute, so ``VoiceCaptureWorker`` runs the capture and recognition on its
+own thread and reports progress through a queue that the page polls.
+"""
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import speech_recognition as sr
+
+from .metrics import timed
+from .recognition import RecognitionOrchestrator
+
+AMBIENT_NOISE_SECONDS = 2
+LISTEN_TIMEOUT = 15
+PHRASE_TIME_LIMIT = 45
+
+# A calibrated energy threshold is reused for this long, unless the level
+# the recognizer adapts to during a capture moves this far away from it.
+CALIBRATION_TTL = 15 * 60
+CALIBRATION_DRIFT = 0.5
+
+# Streaming mode: a pause this long closes a chunk, one this long ends the answer
+CHUNK_PAUSE_SECONDS = 0.6
+CHUNK_MAX_SECONDS = 10
+END_OF_ANSWER_SILENCE = 3
+CHUNK_WORKERS = 3
+
+IDLE = 'idle'
+CALIBRATING = 'calibrating'
+LISTENING = 'listening'
+TRANSCRIBING = 'transcribing'
+DONE = 'done'
+FAILED = 'failed'
+STOPPED = 'stopped'
+PARTIAL = 'partial'
+
+
+def _ignore(status, message):
+    pass
+
+
+def _ignore_audio(audio):
+    pass
+
+
+class CalibrationCache:
+    """Calibrated ``energy_threshold`` per input device, shared by all sessions
+
+    Entries expire after ``ttl`` seconds. ``observe`` is fed the threshold the
+    recognizer drifted to while listening and drops the entry when the room
+    level has clearly changed, so the next capture recalibrates.
+    """
+
+    def __init__(self, ttl=CALIBRATION_TTL, drift=CALIBRATION_DRIFT):
+        self.ttl = ttl
+        self.drift = drift
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, device):
+        with self._lock:
+            entry = self._entries.get(device)
+            if entry is None:
+                return None
+            threshold, calibrated_at = entry
+            if time.monotonic() - calibrated_at > self.ttl:
+                del self._entries[device]
+                return None
+            return threshold
+
+    def age(self, device):
+        """Seconds since ``device`` was calibrated, or None"""
+        with self._lock:
+            entry = self._entries.get(device)
+        return None if entry is None else time.monotonic() - entry[1]
+
+    def store(self, device, threshold):
+        with self._lock:
+            self._entries[device] = (threshold, time.monotonic())
+
+    def observe(self, device, threshold):
+        with self._lock:
+            entry = self._entries.get(device)
+            if entry is None:
+                return
+            calibrated, calibrated_at = entry
+            if abs(threshold - calibrated) > self.drift * calibrated:
+                del self._entries[device]
+            else:
+                # Track slow changes without extending the entry's lifetime
+                self._entries[device] = (threshold, calibrated_at)
+
+    def invalidate(self, device=None):
+        with self._lock:
+            if device is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(device, None)
+
+
+def calibrate(recognizer, source, calibration=None, device=None, report=_ignore):
+    """Reuse a cached energy threshold for ``device`` or measure a new one"""
+    threshold = calibration.get(device) if calibration is not None else None
+    if threshold is not None:
+        recognizer.energy_threshold = threshold
+        return
+    report(CALIBRATING, "🔧 Adjusting for background noise...")
+    recognizer.adjust_for_ambient_noise(source, duration=AMBIENT_NOISE_SECONDS)
+    if calibration is not None:
+        calibration.store(device, recognizer.energy_threshold)
+
+
+class _StoppableStream:
+    """``source.stream`` that reads as ended once ``stop_event`` is set"""
+
+    def __init__(self, stream, stop_event):
+        self.stream = stream
+        self.stop_event = stop_event
+        self.stopped = False
+
+    def read(self, size):
+        if self.stop_event.is_set():
+            self.stopped = True
+            return b""
+        return self.stream.read(size)
+
+
+def listen_phrase(recognizer, source, stop_event, timeout, phrase_time_limit):
+    """One phrase as AudioData, cut short when ``stop_event`` is set; None if nothing was heard
+
+    ``listen`` yields nothing until speech starts, so the stop is noticed in
+    ``source.stream.read``: once it is set the stream ends, which also ends
+    the wait for speech. ``timeout`` counts seconds of audio, as in ``listen``.
+    """
+    stream = _StoppableStream(source.stream, stop_event)
+    source.stream = stream
+    try:
+        chunks = []
+        for chunk in recognizer.listen(source, timeout=timeout, phrase_time_limit=phrase_time_limit, stream=True):
+            if not chunks and stream.stopped:
+                # Stopped before any speech
+                return None
+            chunks.append(chunk.frame_data)
+    finally:
+        source.stream = stream.stream
+    frame_data = b"".join(chunks)
+    if not frame_data:
+        # The end of a recorded stream
+        return None
+    return sr.AudioData(frame_data, source.SAMPLE_RATE, source.SAMPLE_WIDTH)
+
+
+def record_answer(recognizer, source, stop_event, report=_ignore, calibration=None, device=None):
+    """Record one phrase, returning early with what was heard if ``stop_event`` is set"""
+    calibrate(recognizer, source, calibration, device, report)
+    if stop_event.is_set():
+        return None
+
+    report(LISTENING, "🎤 **Listening... Speak clearly now!**")
+    audio = listen_phrase(recognizer, source, stop_event, LISTEN_TIMEOUT, PHRASE_TIME_LIMIT)
+    if calibration is not None:
+        calibration.observe(device, recognizer.energy_threshold)
+    return audio
+
+
+class ChunkedTranscriber:
+    """Transcribes audio chunks on a small pool as they arrive, keeping them in order"""
+
+    def __init__(self, orchestrator, on_partial=_ignore, workers=CHUNK_WORKERS):
+        self.orchestrator = orchestrator
+        self.on_partial = on_partial
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="speech-chunk")
+        self._futures = []
+        self._audio = []
+
+    def submit(self, audio):
+        self._audio.append(audio)
+        future = self._executor.submit(self.orchestrator.recognize, audio)
+        self._futures.append(future)
+        future.add_done_callback(lambda _: self.on_partial(self.partial_text()))
+
+    @property
+    def pending(self):
+        return sum(not future.done() for future in self._futures)
+
+    def partial_text(self):
+        """Transcript of the chunks finished so far, with a marker for ones still in flight"""
+        parts = []
+        for future in self._futures:
+            if not future.done():
+                parts.append("…")
+                break
+            parts.append(future.result()[0])
+        return " ".join(part for part in parts if part)
+
+    def final_text(self):
+        return " ".join(text for text, _ in (future.result() for future in self._futures) if text)
+
+    def audio(self):
+        """All chunks joined back into one recording, or None"""
+        if not self._audio:
+            return None
+        first = self._audio[0]
+        return sr.AudioData(b"".join(chunk.frame_data for chunk in self._audio), first.sample_rate,
+                            first.sample_width)
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def record_answer_in_chunks(recognizer, source, stop_event, transcriber, report=_ignore,
+                            calibration=None, device=None):
+    """Split speech on short pauses and hand each chunk to ``transcriber`` while still listening
+
+    Ends on ``stop_event``, after ``END_OF_ANSWER_SILENCE`` seconds without
+    speech, or once ``PHRASE_TIME_LIMIT`` seconds have been recorded.
+    Returns the number of chunks captured.
+    """
+    calibrate(recognizer, source, calibration, device, report)
+    recognizer.pause_threshold = CHUNK_PAUSE_SECONDS
+    recognizer.non_speaking_duration = min(recognizer.non_speaking_duration, CHUNK_PAUSE_SECONDS)
+    report(LISTENING, "🎤 **Listening... Speak clearly now!**")
+
+    started = time.monotonic()
+    chunks = 0
+    while not stop_event.is_set():
+        remaining = PHRASE_TIME_LIMIT - (time.monotonic() - started)
+        if remaining <= 0:
+            break
+        try:
+            audio = listen_phrase(recognizer, source, stop_event,
+                                  LISTEN_TIMEOUT if chunks == 0 else END_OF_ANSWER_SILENCE,
+                                  min(CHUNK_MAX_SECONDS, remaining))
+        except sr.WaitTimeoutError:
+            if chunks == 0:
+                raise
+            break
+        if audio is None:
+            break
+        transcriber.submit(audio)
+        chunks += 1
+
+    if calibration is not None:
+        calibration.observe(device, recognizer.energy_threshold)
+    return chunks
+
+
+@timed('speech.transcribe', ok=bool)
+def speech_to_text_enhanced(stop_event=None, report=_ignore, calibration=None, device_index=None,
+                            orchestrator=None, source=None, on_audio=_ignore_audio):
+    """Capture one answer from a microphone (or ``source``) and return its transcript
+
+    Progress and problems are passed to ``report(status, message)``; failures
+    return "" after reporting ``FAILED``. The recorded ``AudioData`` is passed
+    to ``on_audio`` before it is recognised. Callers check that a microphone
+    exists first, since enumerating devices re-initialises PortAudio.
+    """
+    stop_event = stop_event or threading.Event()
+    orchestrator = orchestrator or RecognitionOrchestrator()
+    try:
+        recognizer = sr.Recognizer()
+        with source or sr.Microphone(device_index=device_index) as source:
+            try:
+                audio = record_answer(recognizer, source, stop_event, report, calibration, device_index)
+            except sr.WaitTimeoutError:
+                report(FAILED, f"⏰ No speech detected within {LISTEN_TIMEOUT} seconds. Please try again.")
+                return ""
+
+        if audio is None:
+            report(STOPPED, "⏹️ Voice input stopped.")
+            return ""
+
+        on_audio(audio)
+        report(TRANSCRIBING, f"🔄 Converting speech to text ({', '.join(orchestrator.engines)})...")
+        text, engine = orchestrator.recognize(audio)
+        if not text:
+            report(FAILED, "❌ Could not convert speech to text. Please try typing your response.")
+            return ""
+        report(DONE, f"✅ Speech converted successfully! ({engine})")
+        return text
+
+    except Exception as e:
+        report(FAILED, f"❌ Speech recognition error: {str(e)}")
+        return ""
+
+
+@timed('speech.transcribe_streaming', ok=bool)
+def speech_to_text_streaming(stop_event=None, report=_ignore, calibration=None, device_index=None,
+                             orchestrator=None, on_partial=_ignore, source=None, on_audio=_ignore_audio):
+    """Like ``speech_to_text_enhanced`` but transcribes while the candidate is still talking
+
+    ``on_partial(text)`` receives the growing transcript as chunks come back,
+    so only the last chunk is left to recognise once the candidate stops.
+    """
+    stop_event = stop_event or threading.Event()
+    transcriber = ChunkedTranscriber(orchestrator or RecognitionOrchestrator(), on_partial)
+    try:
+        recognizer = sr.Recognizer()
+        with source or sr.Microphone(device_index=device_index) as source:
+            try:
+                chunks = record_answer_in_chunks(recognizer, source, stop_event, transcriber, report,
+                                                 calibration, device_index)
+            except sr.WaitTimeoutError:
+                report(FAILED, f"⏰ No speech detected within {LISTEN_TIMEOUT} seconds. Please try again.")
+                return ""
+
+        if chunks == 0:
+            report(STOPPED, "⏹️ Voice input stopped.")
+            return ""
+
+        on_audio(transcriber.audio())
+        if transcriber.pending:
+            report(TRANSCRIBING, "🔄 Finishing the last part of your answer...")
+        text = transcriber.final_text()
+        if not text:
+            report(FAILED, "❌ Could not convert speech to text. Please try typing your response.")
+            return ""
+        report(DONE, "✅ Speech converted successfully!")
+        return text
+
+    except Exception as e:
+        report(FAILED, f"❌ Speech recognition error: {str(e)}")
+        return ""
+    finally:
+        transcriber.close()
+
+
+class VoiceCaptureWorker:
+    """Runs ``speech_to_text_enhanced`` (or the streaming variant) on a background thread
+
+    The page calls ``start()`` from a button, ``stop()`` to end the recording
+    early (what was heard so far is still transcribed) and ``poll()`` on each
+    rerun to pick up status changes. In streaming mode ``partial_text`` grows
+    while the candidate speaks; ``text`` is set once ``finished``. ``source``
+    replaces the server microphone, e.g. with a ``BrowserAudioSource``. With
+    an ``archive`` the recording is stored while it is being recognised and
+    ``audio_ref`` points at it once finished.
+    """
+
+    def __init__(self, calibration=None, device_index=None, orchestrator=None, streaming=False, source=None,
+                 archive=None):
+        self.calibration = calibration
+        self.device_index = device_index
+        self.orchestrator = orchestrator
+        self.streaming = streaming
+        self.source = source
+        self.archive = archive
+        self.status = IDLE
+        self.message = ""
+        self.partial_text = ""
+        self.text = ""
+        self.audio_ref = None
+        self.finished = False
+        self._updates = queue.Queue()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._archiver = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="voice-capture", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self.source is not None:
+            # Unblock a read waiting for audio that will not come
+            self.source.close()
+
+    def _report(self, status, message):
+        self._updates.put((status, message))
+
+    def _partial(self, text):
+        self._updates.put((PARTIAL, text))
+
+    def _on_audio(self, audio):
+        if self.archive is not None and audio is not None:
+            self._archiver = threading.Thread(target=self._store_audio, args=(audio,), name="voice-archive",
+                                              daemon=True)
+            self._archiver.start()
+
+    def _store_audio(self, audio):
+        try:
+            self.audio_ref = self.archive.store(audio)
+        except Exception:
+            # Losing the archived copy must not lose the answer
+            self.audio_ref = None
+
+    def _run(self):
+        if self.streaming:
+            text = speech_to_text_streaming(self._stop_event, self._report, self.calibration, self.device_index,
+                                            self.orchestrator, self._partial, self.source, self._on_audio)
+        else:
+            text = speech_to_text_enhanced(self._stop_event, self._report, self.calibration, self.device_index,
+                                           self.orchestrator, self.source, self._on_audio)
+        if self._archiver is not None:
+            self._archiver.join()
+        self._updates.put((None, text))
+
+    def poll(self):
+        """Apply queued updates and return ``(status, message)``"""
+        while True:
+            try:
+                status, payload = self._updates.get_nowait()
+            except queue.Empty:
+                break
+            if status is None:
+                self.text = payload
+                self.finished = True
+            elif status == PARTIAL:
+                self.partial_text = payload
+            else:
+                self.status, self.message = status, payload
+        return self.status, self.message
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
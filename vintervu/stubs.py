@@ -0,0 +1,109 @@
+"""Offline stand-ins for Gemini and the speech engines.
+
+Benchmarks and load tests drive the real interview flow with these, so they
+measure this app's own work rather than the network. ``StubModel`` answers
+each of the prompts in ``llm`` with a reply of the shape Gemini gives,
+derived from the prompt so runs are repeatable; ``StubOrchestrator``
+"recognises" audio into a transcript sized by the recording. Both can sleep
+for a set time per call to stand in for network latency.
+"""
+import json
+import random
+import re
+import time
+
+from .report import SECTIONS
+
+STUB_SKILLS = [
+    'Python', 'Java', 'SQL', 'Docker', 'Kubernetes', 'React', 'TensorFlow', 'AWS', 'Linux',
+    'Pandas', 'Flask', 'Django', 'PostgreSQL', 'Terraform', 'JavaScript', 'C++', 'Git',
+]
+
+_WORDS = "the service cache index query thread memory design trade-off latency scale request queue".split()
+
+
+class StubUsage:
+    """``usage_metadata`` of a reply, at about four characters a token"""
+    __slots__ = ('prompt_token_count', 'candidates_token_count')
+
+    def __init__(self, prompt, text):
+        self.prompt_token_count = len(prompt) // 4
+        self.candidates_token_count = len(text) // 4
+
+
+class StubResponse:
+    __slots__ = ('text', 'usage_metadata')
+
+    def __init__(self, text, usage_metadata=None):
+        self.text = text
+        self.usage_metadata = usage_metadata
+
+
+class StubModel:
+    """Drop-in for ``genai.GenerativeModel``: ``StubModel(api_key).generate_content(prompt).text``"""
+
+    model_name = 'stub'
+
+    def __init__(self, api_key='', latency=0.0):
+        self.latency = latency
+
+    def generate_content(self, prompt):
+        if self.latency:
+            time.sleep(self.latency)
+        rng = random.Random(prompt)
+        if "Analyze this resume text" in prompt:
+            text = prompt.split("Resume Text:", 1)[-1]
+            skills = [skill for skill in STUB_SKILLS if skill in text] or ['Python']
+            projects = [{'title': title.strip(), 'technologies': rng.sample(skills, min(2, len(skills)))}
+                        for title in re.findall(r'(Project \d+):', text)[:5]]
+            reply = json.dumps({'skills': skills, 'projects': projects, 'domains': ['Software Engineering']})
+        elif "Return only the numeric score" in prompt:
+            reply = str(rng.randint(3, 9))
+        elif "Provide comprehensive feedback" in prompt:
+            feedback = {key: _sentences(rng, 3) for key, _, _ in SECTIONS}
+            if '"score"' in prompt:
+                feedback['score'] = rng.randint(3, 9)
+            reply = json.dumps(feedback)
+        elif "Generate ONE specific follow-up" in prompt:
+            reply = f"How would you handle {rng.choice(_WORDS)} failures at {rng.randint(2, 100)}x the load?"
+        elif "project-based interview questions" in prompt:
+            reply = "\n".join(_question(rng) for _ in range(3))
+        else:
+            reply = "\n".join(f"{n}. {_question(rng)}" for n in range(1, 8))
+        return StubResponse(reply, StubUsage(prompt, reply))
+
+
+def stub_model_factory(latency=0.0):
+    """A factory for ``llm.set_model_factory`` whose models wait ``latency`` seconds per call"""
+    return lambda api_key: StubModel(api_key, latency)
+
+
+class StubOrchestrator:
+    """Drop-in for ``RecognitionOrchestrator``: about three words per second of audio
+
+    Each call waits ``latency`` seconds plus ``per_audio_second`` for every
+    second of audio, like a speech service would.
+    """
+
+    engines = ['stub']
+
+    def __init__(self, latency=0.0, per_audio_second=0.0):
+        self.latency = latency
+        self.per_audio_second = per_audio_second
+
+    def recognize(self, audio):
+        seconds = len(audio.frame_data) / (audio.sample_rate * audio.sample_width)
+        delay = self.latency + seconds * self.per_audio_second
+        if delay:
+            time.sleep(delay)
+        rng = random.Random(len(audio.frame_data))
+        return " ".join(rng.choice(_WORDS) for _ in range(max(1, int(seconds * 3)))), 'stub'
+
+
+def _question(rng):
+    return (f"How would you design the {rng.choice(_WORDS)} layer of a {rng.choice(STUB_SKILLS)} "
+            f"system to keep {rng.choice(_WORDS)} under control?")
+
+
+def _sentences(rng, count):
+    return " ".join(" ".join(rng.choice(_WORDS) for _ in range(12)).capitalize() + "." for _ in range(count))
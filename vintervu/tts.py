@@ -0,0 +1,165 @@
+"""Interview questions synthesised to audio on the server, ahead of time.
+
+Reading questions through the browser's ``speechSynthesis`` sounds different
+on every machine and sometimes not at all. ``SpeechCache`` renders questions
+to WAV with pyttsx3 on one background thread as soon as they are generated,
+so "Read Question Aloud" can play them immediately with ``st.audio``. Audio is
+keyed by a hash of the text and the least recently played entries are
+evicted once the cache grows past its byte budget.
+"""
+import hashlib
+import itertools
+import os
+import queue
+import tempfile
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_BYTES = int(os.environ.get('VINTERVU_TTS_CACHE_MB', 64)) * 1024 * 1024
+SPEECH_RATE = 160  # words per minute
+
+# Questions the candidate is waiting for go ahead of background prefetches
+_NOW = 0
+_PREFETCH = 1
+
+
+def text_key(text: str) -> str:
+    return hashlib.sha256(" ".join(text.split()).encode('utf-8')).hexdigest()
+
+
+class Pyttsx3Synthesizer:
+    """Renders text to WAV bytes; only ever called from the cache's worker thread"""
+
+    def __init__(self, rate=SPEECH_RATE):
+        self.rate = rate
+        self._engine = None
+
+    def __call__(self, text: str) -> bytes:
+        if self._engine is None:
+            import pyttsx3
+            self._engine = pyttsx3.init()
+            self._engine.setProperty('rate', self.rate)
+        fd, path = tempfile.mkstemp(suffix='.wav')
+        os.close(fd)
+        try:
+            self._engine.save_to_file(text, path)
+            self._engine.runAndWait()
+            with open(path, 'rb') as f:
+                return f.read()
+        finally:
+            os.unlink(path)
+
+
+class SpeechCache:
+    """LRU cache of synthesised question audio, filled by one background thread"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, synthesize=None):
+        self.max_bytes = max_bytes
+        self.synthesize = synthesize or Pyttsx3Synthesizer()
+        self.error = ""
+        self.stats = {'hits': 0, 'misses': 0, 'synthesized': 0, 'evictions': 0, 'errors': 0}
+        self._entries = OrderedDict()
+        self._size = 0
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._queue = queue.PriorityQueue()
+        self._order = itertools.count()
+        self._thread = None
+
+    @property
+    def available(self):
+        """False once the synthesiser could not be started (e.g. pyttsx3 or espeak missing)"""
+        return not self.error
+
+    @property
+    def size(self):
+        return self._size
+
+    def get(self, text):
+        """Cached audio for ``text``, or None"""
+        key = text_key(text)
+        with self._lock:
+            audio = self._entries.get(key)
+            if audio is None:
+                self.stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return audio
+
+    def prefetch(self, texts):
+        """Queue every text that is neither cached nor already queued"""
+        for text in texts:
+            self._request(text, _PREFETCH)
+
+    def audio(self, text, timeout=5.0):
+        """Audio for ``text``, synthesising it ahead of any prefetches; None if not ready in time"""
+        audio = self.get(text)
+        if audio is not None or not self.available:
+            return audio
+        ready = self._request(text, _NOW)
+        if ready is not None:
+            ready.wait(timeout)
+        return self.get(text)
+
+    def _request(self, text, priority):
+        if not text or not self.available:
+            return None
+        key = text_key(text)
+        with self._lock:
+            if key in self._entries:
+                return None
+            ready = self._pending.get(key)
+            # Re-queue a waiting prefetch at the higher priority; the worker skips the duplicate
+            if ready is not None and priority == _PREFETCH:
+                return ready
+            if ready is None:
+                ready = self._pending[key] = threading.Event()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="tts-cache", daemon=True)
+                self._thread.start()
+        self._queue.put((priority, next(self._order), key, text))
+        return ready
+
+    def _run(self):
+        while True:
+            _, _, key, text = self._queue.get()
+            with self._lock:
+                ready = self._pending.get(key)
+            if ready is None:
+                # Already synthesised through a higher-priority request
+                continue
+            try:
+                audio = self.synthesize(text)
+            except (ImportError, OSError, RuntimeError) as e:
+                # No usable TTS engine on this server; callers fall back to the browser voice
+                self.error = f"{type(e).__name__}: {e}"
+                self._fail_pending()
+                return
+            except Exception:
+                with self._lock:
+                    self.stats['errors'] += 1
+                    self._pending.pop(key, None)
+                ready.set()
+                continue
+            self._store(key, audio)
+            ready.set()
+
+    def _store(self, key, audio):
+        with self._lock:
+            self._pending.pop(key, None)
+            self.stats['synthesized'] += 1
+            if len(audio) > self.max_bytes:
+                return
+            self._entries[key] = audio
+            self._size += len(audio)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self.stats['evictions'] += 1
+
+    def _fail_pending(self):
+        with self._lock:
+            pending, self._pending = list(self._pending.values()), {}
+        for ready in pending:
+            ready.set()
@@ -0,0 +1,619 @@
+"""Streamlit helpers shared by the VIntervu pages.
+
+Page scripts re-run on every interaction, but this module is imported once
+per server process, so the cached resources, fragments and widgets below are
+only defined once.
+"""
+import contextlib
+import functools
+import hashlib
+import hmac
+import os
+import secrets
+import time
+
+import streamlit as st
+
+from . import db
+from .extraction import read_pdf, read_docx_text
+from .interview import InterviewSession, unfinished
+from .metrics import timed
+from .profiling import RunProfiler
+from .report import question_html
+from .session_store import SessionTooLarge, decode, encode, open_session_store
+from .tts import SpeechCache
+from .workers import ExtractionError, ExtractionPool
+# PyPDF2 and the speech modules are imported by the helpers that use them, so
+# pages that never record or read a resume do not pay for them.
+
+# Accounts that see the Admin page, e.g. "a@example.com,b@example.com"
+ADMIN_EMAILS = {email.strip().lower() for email in os.environ.get('VINTERVU_ADMIN_EMAILS', '').split(',') if email.strip()}
+
+
+def init_session_state():
+    if 'logged_in' not in st.session_state:
+        st.session_state.logged_in = False
+    if 'user_email' not in st.session_state:
+        st.session_state.user_email = ""
+    if 'interview' not in st.session_state:
+        st.session_state.interview = new_interview()
+
+
+def is_admin():
+    return st.session_state.logged_in and st.session_state.user_email.lower() in ADMIN_EMAILS
+
+
+@st.cache_resource
+def get_session_store():
+    """Where sessions are kept so any replica can serve them"""
+    store = open_session_store()
+    store.purge()
+    return store
+
+
+def _xsrf_token(cookie):
+    """Token bytes of Streamlit's XSRF cookie; version 2 cookies re-mask the same token on every write"""
+    parts = cookie.strip('"\'').split('|')
+    try:
+        if parts[0] == '2' and len(parts) == 4:
+            mask, masked = bytes.fromhex(parts[1]), bytes.fromhex(parts[2])
+            return bytes(a ^ b for a, b in zip(mask, masked))
+    except ValueError:
+        pass
+    return cookie.encode('utf-8')
+
+
+def _browser_binding():
+    """Digest of what only this browser sends: its XSRF cookie and User-Agent
+
+    Stored with the session, so the ``sid`` of a shared URL does not carry a
+    login into another browser.
+    """
+    cookie = st.context.cookies.get('_streamlit_xsrf')
+    # Not a string without a real browser connection, e.g. under AppTest
+    token = _xsrf_token(cookie if isinstance(cookie, str) else '')
+    user_agent = (st.context.headers.get('User-Agent') or '').encode('utf-8')
+    return hashlib.sha256(token + b'\0' + user_agent).hexdigest()
+
+
+def _session_snapshot():
+    return {
+        'browser': _browser_binding(),
+        'logged_in': st.session_state.logged_in,
+        'user_email': st.session_state.user_email,
+        'interview': st.session_state.interview.to_dict(),
+    }
+
+
+def _set_sid(sid):
+    st.session_state.sid = sid
+    st.session_state.stored_session_hash = None
+
+
+def restore_session():
+    """Pick up the stored session named by the ``sid`` query parameter, once per browser connection
+
+    Runs before init_session_state, so a session another replica served
+    resumes where it left off instead of starting logged out. The ``sid``
+    alone is not enough: the session is only picked up in the browser it was
+    stored from (see ``_browser_binding``).
+    """
+    if 'sid' not in st.session_state:
+        sid = st.query_params.get('sid')
+        data = None
+        if sid:
+            try:
+                data = get_session_store().load(sid)
+            except Exception as e:
+                st.warning(f"⚠️ Could not load your session: {str(e)}")
+        state = decode(data) if data is not None else None
+        if state is not None and not hmac.compare_digest(state.get('browser', ''), _browser_binding()):
+            # A copied or shared link, opened in a browser the session did not start in
+            state = None
+        if state is None:
+            _set_sid(secrets.token_urlsafe(16))
+        else:
+            st.session_state.logged_in = state['logged_in']
+            st.session_state.user_email = state['user_email']
+            st.session_state.interview = InterviewSession.from_dict(state['interview'])
+            if state['logged_in']:
+                st.session_state.interview.journal = functools.partial(_checkpoint, state['user_email'])
+            _set_sid(sid)
+            st.session_state.stored_session_hash = hashlib.sha1(data).hexdigest()
+    # Page switches drop query parameters, so put it back on every run
+    if st.query_params.get('sid') != st.session_state.sid:
+        st.query_params['sid'] = st.session_state.sid
+
+
+def rotate_session():
+    """A fresh session id at login and logout, so a shared link cannot carry a login over"""
+    try:
+        get_session_store().delete(st.session_state.sid)
+    except Exception:
+        pass
+    _set_sid(secrets.token_urlsafe(16))
+    st.query_params['sid'] = st.session_state.sid
+
+
+def persist_session():
+    """Store the session if this run changed it"""
+    try:
+        data = encode(_session_snapshot())
+    except SessionTooLarge as e:
+        st.warning(f"⚠️ {str(e)}; progress is only kept by this server")
+        return
+    digest = hashlib.sha1(data).hexdigest()
+    if digest == st.session_state.get('stored_session_hash'):
+        return
+    try:
+        get_session_store().save(st.session_state.sid, data)
+    except Exception as e:
+        st.warning(f"⚠️ Could not save your session: {str(e)}")
+        return
+    st.session_state.stored_session_hash = digest
+
+
+def _checkpoint(email, interview_id, kind, data):
+    try:
+        db.append_checkpoint(email, interview_id, kind, data)
+    except Exception as e:
+        st.warning(f"⚠️ Interview progress could not be saved: {str(e)}")
+
+
+def new_interview():
+    """An empty interview; a logged-in user's progress is checkpointed as it goes"""
+    if not st.session_state.get('logged_in'):
+        return InterviewSession()
+    return InterviewSession(journal=functools.partial(_checkpoint, st.session_state.user_email))
+
+
+def find_unfinished_interview(email):
+    """The user's last interview, restored from its checkpoints, if it was left unfinished"""
+    try:
+        latest = db.latest_checkpoints(email)
+    except Exception as e:
+        st.error(f"Error loading interview checkpoints: {str(e)}")
+        return None
+    if latest is None or not unfinished(latest[1]):
+        return None
+    interview_id, events = latest
+    return InterviewSession.restore(interview_id, events, journal=functools.partial(_checkpoint, email))
+
+
+def resume_offer():
+    """Offer the unfinished interview found at login, until it is resumed or discarded"""
+    interview = st.session_state.get('resume_offer')
+    if interview is None:
+        return
+    
+    with st.container(border=True):
+        st.markdown(f"⏸️ **You have an unfinished interview** – {len(interview.feedback)} answered, "
+                    f"{len(interview.questions) - interview.index} questions left.")
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("▶️ Resume Interview", type="primary"):
+                del st.session_state.resume_offer
+                st.session_state.interview = interview
+                st.switch_page("app_pages/interview.py")
+        with col2:
+            if st.button("🗑️ Discard"):
+                del st.session_state.resume_offer
+                interview.discard()
+                st.rerun()
+
+
+def flash(message, icon=None):
+    """Toast ``message`` on the next run, so it survives the st.rerun()/st.switch_page() that follows"""
+    st.session_state.setdefault('flash_messages', []).append((message, icon))
+
+
+def show_flash_messages():
+    for message, icon in st.session_state.pop('flash_messages', []):
+        st.toast(message, icon=icon)
+
+
+def profiler_toggle():
+    """Sidebar switch for admins; turns on ``profile_run`` for their session"""
+    if is_admin():
+        st.sidebar.toggle("🔬 Profile reruns", key='profile_reruns',
+                          help="Profile each run of this session with cProfile and tracemalloc")
+
+
+@contextlib.contextmanager
+def profile_run(label):
+    """Profile the enclosed code if this session turned the profiler on; does nothing otherwise"""
+    if not (st.session_state.get('profile_reruns') and is_admin()):
+        yield
+        return
+    profiler = RunProfiler(label)
+    try:
+        with profiler:
+            yield
+    finally:
+        # Also kept when the page ends the run with st.rerun/st.switch_page/st.stop
+        if profiler.result:
+            st.session_state.last_profile = profiler.result
+        else:
+            flash("Another run on this server is being profiled; this one was not.", icon="🔬")
+
+
+def profile_panel():
+    """The last profiled run of this session, in the sidebar"""
+    result = st.session_state.get('last_profile')
+    if not (result and st.session_state.get('profile_reruns') and is_admin()):
+        return
+    with st.sidebar.expander(f"🔬 {result['label']}: {result['seconds'] * 1000:.0f} ms", expanded=True):
+        st.caption(f"Peak traced memory {result['peak_kb']:,.0f} KB, "
+                   f"{time.strftime('%H:%M:%S', time.localtime(result['finished_at']))}")
+        st.markdown("**Cumulative time**")
+        st.dataframe(
+            result['functions'],
+            column_config={
+                'function': "Function",
+                'calls': "Calls",
+                'own_ms': st.column_config.NumberColumn("Own (ms)", format="%.1f"),
+                'cumulative_ms': st.column_config.NumberColumn("Total (ms)", format="%.1f"),
+            },
+            hide_index=True,
+        )
+        st.markdown("**Memory held at the end of the run**")
+        st.dataframe(
+            result['allocations'],
+            column_config={
+                'line': "Line",
+                'size_kb': st.column_config.NumberColumn("KB", format="%.1f"),
+                'blocks': "Blocks",
+            },
+            hide_index=True,
+        )
+        if result['path']:
+            st.caption(f"Full profile: `{result['path']}` (open with snakeviz or `python -m pstats`)")
+        else:
+            st.caption("The full profile could not be written.")
+
+
+@st.cache_resource
+def get_extraction_pool():
+    """Extraction processes shared by every session of this server"""
+    return ExtractionPool()
+
+
+@timed('extract.pdf', ok=bool)
+def extract_text_from_pdf(file_content):
+    try:
+        result = get_extraction_pool().run(read_pdf, file_content)
+    except ExtractionError as e:
+        st.error(f"Error reading PDF: {str(e)}")
+        return ""
+    
+    note = " (stopped early, enough text for analysis)" if result.truncated else ""
+    st.caption(f"📄 Read {result.pages_read} of {result.page_count} pages in {result.seconds:.2f}s{note}")
+    return result.text
+
+
+@timed('extract.docx', ok=bool)
+def extract_text_from_docx(file_content):
+    try:
+        return get_extraction_pool().run(read_docx_text, file_content)
+    except ExtractionError as e:
+        st.error(f"Error reading DOCX: {str(e)}")
+        return ""
+
+
+def extract_resume_text(uploaded_file):
+    """Read an uploaded PDF/DOCX resume and return its text"""
+    file_content = uploaded_file.read()
+    
+    if uploaded_file.type == "application/pdf":
+        return extract_text_from_pdf(file_content)
+    elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
+        return extract_text_from_docx(file_content)
+    
+    st.error("Unsupported file format!")
+    return ""
+
+
+@st.cache_resource(ttl=600, show_spinner=False)
+def list_microphones():
+    """Input device names; enumerating re-initialises PortAudio, so it is cached"""
+    import speech_recognition as sr
+    return sr.Microphone.list_microphone_names()
+
+
+@st.cache_resource
+def get_calibration_cache():
+    """Ambient-noise calibration shared by every session of this server"""
+    from vintervu.speech import CalibrationCache
+    return CalibrationCache()
+
+
+@st.cache_resource
+def get_recognition_orchestrator():
+    """Speech engines shared by every session, so their stats cover the whole server"""
+    from vintervu.recognition import RecognitionOrchestrator
+    return RecognitionOrchestrator()
+
+
+@st.cache_resource
+def get_speech_cache():
+    """Synthesised question audio shared by every session"""
+    return SpeechCache()
+
+
+@st.cache_resource
+def get_audio_archive():
+    """Where answer recordings are kept for later re-transcription"""
+    from vintervu.audio_archive import AudioArchive
+    return AudioArchive()
+
+
+def test_microphone():
+    """Test if microphone is working"""
+    try:
+        mic_list = list_microphones()
+        st.info(f"Available microphones: {len(mic_list)}")
+        for i, mic_name in enumerate(mic_list):
+            st.write(f"{i}: {mic_name}")
+        return True
+    except Exception as e:
+        st.error(f"Microphone test failed: {e}")
+        return False
+
+
+def start_voice_capture(result_key, streaming=False, keep_audio=False):
+    """Start recording on a background thread; the transcript lands in st.session_state[result_key]"""
+    from vintervu.speech import VoiceCaptureWorker
+    
+    try:
+        microphones = list_microphones()
+    except Exception as e:
+        st.error(f"❌ Speech recognition error: {str(e)}")
+        return False
+    if not microphones:
+        st.error("❌ No microphones found! Please check your audio devices.")
+        return False
+    
+    worker = VoiceCaptureWorker(calibration=get_calibration_cache(), orchestrator=get_recognition_orchestrator(),
+                                streaming=streaming, archive=get_audio_archive() if keep_audio else None)
+    worker.start()
+    st.session_state[f"{result_key}_worker"] = worker
+    return True
+
+
+@st.fragment
+def browser_voice_input(result_key, streaming=False):
+    """Record in the candidate's browser; each uploaded chunk reruns only this fragment"""
+    from vintervu.browser_audio import BrowserAudioSource, parse_upload
+    from vintervu.components import browser_recorder
+    from vintervu.speech import VoiceCaptureWorker
+    
+    component_key = f"{result_key}_recorder"
+    source = st.session_state.get(f"{result_key}_browser")
+    upload = st.session_state.get(component_key)
+    if upload:
+        try:
+            upload = parse_upload(upload)
+        except ValueError as e:
+            st.error(f"❌ Voice upload error: {str(e)}")
+            upload = None
+    
+    new_capture = upload is not None and (source is None or source.capture_id != upload['capture'])
+    if new_capture:
+        source = BrowserAudioSource(upload['capture'])
+        worker = VoiceCaptureWorker(orchestrator=get_recognition_orchestrator(), streaming=streaming, source=source,
+                                    archive=get_audio_archive())
+        worker.start()
+        st.session_state[f"{result_key}_browser"] = source
+        st.session_state[f"{result_key}_worker"] = worker
+    
+    if upload:
+        try:
+            source.receive(upload['chunks'], upload.get('last_seq'))
+        except ValueError as e:
+            st.error(f"❌ Voice upload error: {str(e)}")
+            source.close()
+        else:
+            if new_capture:
+                # Full rerun so the page shows the capture status
+                st.rerun()
+    
+    worker = st.session_state.get(f"{result_key}_worker")
+    browser_recorder(
+        key=component_key,
+        ack={'capture': source.capture_id, 'seq': source.ack} if source else None,
+        active=source is not None and not source.closed,
+        disabled=worker is not None and not worker.finished
+    )
+
+
+@st.fragment(run_every=1)
+def voice_capture_status(result_key):
+    """Poll the background capture once a second without rerunning the whole page"""
+    from vintervu import speech
+    
+    worker = st.session_state.get(f"{result_key}_worker")
+    if worker is None:
+        return
+    
+    status, message = worker.poll()
+    if worker.finished:
+        del st.session_state[f"{result_key}_worker"]
+        if worker.text:
+            st.session_state[result_key] = worker.text
+        if worker.audio_ref:
+            st.session_state[f"{result_key}_audio"] = {'audio_ref': worker.audio_ref, 'transcript': worker.text}
+        st.session_state[f"{result_key}_notice"] = (status, message)
+        # Full rerun so the answer box picks up the transcript
+        st.rerun()
+    
+    if status == speech.LISTENING:
+        st.info(message)
+        st.write("📋 **Tips:**")
+        st.write("• Speak clearly and at moderate pace")
+        st.write("• Ensure you're in a quiet environment") 
+        st.write("• Keep microphone close to your mouth")
+        if st.button("⏹️ Stop Recording", key=f"{result_key}_stop"):
+            worker.stop()
+    elif message:
+        st.info(message)
+    else:
+        st.info("🎤 Starting microphone...")
+    
+    if worker.partial_text:
+        with st.container(border=True):
+            st.markdown(f"📝 **Live transcript:** {worker.partial_text}")
+
+
+def voice_capture_notice(result_key):
+    """Show how the last capture ended, once"""
+    from vintervu import speech
+    
+    notice = st.session_state.pop(f"{result_key}_notice", None)
+    if notice is None:
+        return False
+    status, message = notice
+    if status == speech.DONE:
+        st.success(message)
+        return True
+    if status == speech.STOPPED:
+        st.warning(message)
+    else:
+        st.error(message)
+        if "error" in message:
+            st.info("💡 **Troubleshooting:**")
+            st.write("1. Check microphone permissions in browser settings")
+            st.write("2. Ensure microphone is not being used by other apps")
+            st.write("3. Try refreshing the page and allowing microphone access")
+    return False
+
+
+def test_voice_input():
+    """Test voice input functionality without API key"""
+    st.subheader("🎤 Voice Input Test")
+    st.write("This is a simple test to check if your microphone and speech recognition is working.")
+    
+    capturing = "voice_test_worker" in st.session_state
+    if st.button("🎤 Test Voice Input", key="test_voice", disabled=capturing):
+        capturing = start_voice_capture("voice_test")
+    
+    if capturing:
+        voice_capture_status("voice_test")
+    elif voice_capture_notice("voice_test"):
+        st.success(f"✅ **Voice Input Successful!**")
+        st.write(f"**You said:** *{st.session_state.pop('voice_test')}*")
+        st.balloons()
+    
+
+
+def text_to_speech_js(text):
+    """Generate JavaScript code for text-to-speech"""
+    # Clean text for JavaScript
+    clean_text = text.replace('"', '\\"').replace('\n', ' ')
+    
+    js_code = f"""
+    <script>
+    function speakText() {{
+        if ('speechSynthesis' in window) {{
+            const utterance = new SpeechSynthesisUtterance("{clean_text}");
+            utterance.rate = 0.8;
+            utterance.pitch = 1;
+            utterance.volume = 0.8;
+            
+            // Get available voices
+            const voices = speechSynthesis.getVoices();
+            
+            // Try to use a good English voice
+            const englishVoice = voices.find(voice => 
+                voice.lang.includes('en') && voice.name.includes('Female')
+            ) || voices.find(voice => voice.lang.includes('en'));
+            
+            if (englishVoice) {{
+                utterance.voice = englishVoice;
+            }}
+            
+            speechSynthesis.speak(utterance);
+        }} else {{
+            alert('Speech synthesis not supported in your browser');
+        }}
+    }}
+    
+    // Auto-call the function
+    speakText();
+    </script>
+    """
+    return js_code
+
+
+def speak_question(question_text):
+    """Add text-to-speech for questions"""
+    if st.button("🔊 Read Question Aloud", key=f"speak_{hash(question_text)}"):
+        audio = get_speech_cache().audio(question_text)
+        if audio:
+            st.audio(audio, format="audio/wav", autoplay=True)
+            return
+        # No server-side voice available (yet); let the browser read it
+        st.components.v1.html(
+            text_to_speech_js(question_text),
+            height=0,
+        )
+        st.success("🔊 Question is being read aloud...")
+
+
+@st.fragment
+def feedback_report(items, key):
+    """One collapsed expander per answered question; its HTML is only sent once it is opened
+
+    Opening or closing a question reruns just this fragment.
+    """
+    for i, item in enumerate(items):
+        with st.expander(f"Question {i+1} - Score: {item.get('score', 'N/A')}/10 ⭐", key=f"{key}_{i}",
+                         on_change="rerun") as expander:
+            if expander.open:
+                st.markdown(question_html(item), unsafe_allow_html=True)
+
+
+def markdown_table(rows):
+    """Render a short list of dicts as a table without loading pandas for st.dataframe"""
+    if not rows:
+        return ""
+    columns = list(rows[0])
+    
+    def cell(value):
+        return "" if value is None else str(value).replace("|", "\\|").replace("\n", " ")
+    
+    lines = ["| " + " | ".join(columns) + " |", "|" + " --- |" * len(columns)]
+    lines += ["| " + " | ".join(cell(row.get(column)) for column in columns) + " |" for row in rows]
+    return "\n".join(lines)
+
+
+def render_role_analysis(analysis):
+    """Show match metrics, skills and suggestions for one role analysis"""
+    st.subheader(f"Analysis Results for {analysis['role'].title()}")
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("📊 Match Score", f"{analysis['score']}%")
+    with col2:
+        st.metric("✅ Found Skills", len(analysis['found_keywords']))
+    with col3:
+        st.metric("❌ Missing Skills", len(analysis['missing_keywords']))
+    
+    if analysis['found_keywords']:
+        st.success(f"✅ Skills Found: {', '.join(analysis['found_keywords'])}")
+    
+    if analysis['missing_keywords']:
+        st.error(f"❌ Missing Skills: {', '.join(analysis['missing_keywords'])}")
+    
+    if analysis['suggestions']:
+        st.markdown("💡 **Improvement Suggestions:**")
+        for i, suggestion in enumerate(analysis['suggestions'], 1):
+            st.markdown(f"{i}. {suggestion}")
+
+
+def save_feedback(email: str, total_score: int, max_score: int, percentage: float, feedback_data: dict):
+    try:
+        db.insert_feedback(email, total_score, max_score, percentage, feedback_data)
+        return True
+    except Exception as e:
+        st.error(f"Error saving feedback: {str(e)}")
+        return False
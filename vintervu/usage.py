@@ -0,0 +1,164 @@
+"""Gemini token and cost accounting, and per-user daily budgets.
+
+Every model call made through ``llm`` is recorded with its prompt and output
+tokens (from the response's ``usage_metadata``), estimated cost and latency,
+tagged with the function that made it and the user and interview it was
+made for. The entrypoint sets those tags at the start of every run with
+``set_context``; the batch tools leave them empty. Like the stage timings,
+calls are buffered in memory (``calls``) and written out every few seconds
+by a background thread, so accounting adds no I/O to a model call.
+
+Each user's spending today is read from the database at most every
+``BUDGET_REFRESH_SECONDS``, plus the calls still waiting in ``calls``, and
+counted up locally in between, so checking the budget is usually a
+dictionary lookup and never writes. Failed calls cost nothing.
+
+Once a user has spent ``DAILY_TOKEN_BUDGET`` tokens in a day, ``llm`` switches
+to cheaper paths: repeated prompts are answered from ``ResponseCache``,
+question generation and profile extraction fall back to the local bank in
+``bank``, and an answer is evaluated in one request instead of two.
+"""
+import contextvars
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from . import db
+from .metrics import Recorder
+
+# Per user per UTC day; 0 turns budgets off
+DAILY_TOKEN_BUDGET = int(os.environ.get('VINTERVU_DAILY_TOKEN_BUDGET', 0))
+CACHE_SIZE = int(os.environ.get('VINTERVU_RESPONSE_CACHE_SIZE', 1024))
+# Other servers' spending is picked up this often
+BUDGET_REFRESH_SECONDS = 60
+
+# USD per million (prompt, output) tokens
+PRICES = {
+    'gemini-1.5-flash': (0.075, 0.30),
+    'stub': (0.0, 0.0),
+}
+
+# (email, interview_id) the calls of this script run are made for
+_context = contextvars.ContextVar('llm_usage_context', default=('', ''))
+
+
+def set_context(email, interview_id):
+    _context.set((email or '', interview_id or ''))
+
+
+def current_email():
+    return _context.get()[0]
+
+
+def cost(model, prompt_tokens, output_tokens) -> float:
+    prompt_price, output_price = PRICES.get(model, (0.0, 0.0))
+    return (prompt_tokens * prompt_price + output_tokens * output_price) / 1_000_000
+
+
+def token_counts(response, prompt, text):
+    """``(prompt_tokens, output_tokens)`` from ``usage_metadata``, or estimated at 4 characters a token"""
+    metadata = getattr(response, 'usage_metadata', None)
+    prompt_tokens = getattr(metadata, 'prompt_token_count', None)
+    output_tokens = getattr(metadata, 'candidates_token_count', None)
+    if prompt_tokens is None:
+        prompt_tokens = len(prompt) // 4
+    if output_tokens is None:
+        output_tokens = len(text) // 4
+    return prompt_tokens, output_tokens
+
+
+def _write(rows):
+    db.insert_llm_usage(rows)
+
+
+# Shared by every session's script thread
+calls = Recorder(sink=_write, name='llm-usage-flush')
+
+# email -> [UTC day, tokens spent, time.monotonic() it was read from the database]
+_spent = {}
+_spent_lock = threading.Lock()
+
+
+def record(function, model, prompt_tokens, output_tokens, seconds, ok=True, cached=False):
+    """Buffer one call for the current user and interview"""
+    email, interview_id = _context.get()
+    now = time.gmtime()
+    calls.append((email, interview_id, function, model, prompt_tokens, output_tokens,
+                  cost(model, prompt_tokens, output_tokens), seconds, ok, cached,
+                  time.strftime('%Y-%m-%d %H:%M:%S', now)))
+    with _spent_lock:
+        entry = _spent.get(email)
+        if entry is not None and entry[0] == time.strftime('%Y-%m-%d', now):
+            entry[1] += prompt_tokens + output_tokens
+
+
+def _unwritten_tokens(rows, email, day) -> int:
+    return sum(row[4] + row[5] for row in rows if row[0] == email and row[10].startswith(day))
+
+
+def spent_today(email) -> int:
+    """Tokens ``email`` has used today, read again from the database at most every BUDGET_REFRESH_SECONDS"""
+    day = time.strftime('%Y-%m-%d', time.gmtime())
+    with _spent_lock:
+        entry = _spent.get(email)
+        if entry is not None and entry[0] == day and time.monotonic() - entry[2] < BUDGET_REFRESH_SECONDS:
+            return entry[1]
+    try:
+        # This server's calls the background flush has not written yet are added from memory. A flush
+        # finishing during the read could have them counted twice or not at all, so read again then.
+        for _ in range(3):
+            flushes = calls.unwritten()[1]
+            tokens = db.tokens_used_today(email)
+            rows, flushed = calls.unwritten()
+            if flushed == flushes:
+                break
+        tokens += _unwritten_tokens(rows, email, day)
+    except sqlite3.Error:
+        tokens = entry[1] if entry is not None and entry[0] == day else 0
+    with _spent_lock:
+        _spent[email] = [day, tokens, time.monotonic()]
+    return tokens
+
+
+def over_budget(email=None) -> bool:
+    """The user (by default the current one) has used up today's token budget"""
+    email = current_email() if email is None else email
+    if not DAILY_TOKEN_BUDGET or not email:
+        return False
+    return spent_today(email) >= DAILY_TOKEN_BUDGET
+
+
+class ResponseCache:
+    """Model replies by prompt hash, least recently used dropped first"""
+
+    def __init__(self, size=CACHE_SIZE):
+        self.size = size
+        self._replies = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(model, prompt):
+        return hashlib.sha256(f"{model}\0{prompt}".encode('utf-8')).hexdigest()
+
+    def get(self, model, prompt):
+        key = self.key(model, prompt)
+        with self._lock:
+            text = self._replies.get(key)
+            if text is not None:
+                self._replies.move_to_end(key)
+            return text
+
+    def put(self, model, prompt, text):
+        key = self.key(model, prompt)
+        with self._lock:
+            self._replies[key] = text
+            self._replies.move_to_end(key)
+            if len(self._replies) > self.size:
+                self._replies.popitem(last=False)
+
+
+# Shared by every session's script thread
+responses = ResponseCache()
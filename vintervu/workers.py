@@ -0,0 +1,191 @@
+"""Isolated worker processes for resume text extraction.
+
+A malformed PDF can keep PyPDF2 busy indefinitely or balloon its memory, so
+extraction runs in separate processes: each job gets a wall-clock timeout,
+the worker's resident memory is watched while it runs, and workers are
+recycled after a number of jobs or once their peak memory grows too large.
+Anything that goes wrong surfaces as an ``ExtractionError``.
+"""
+import atexit
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+
+DEFAULT_TIMEOUT = float(os.environ.get('VINTERVU_EXTRACT_TIMEOUT', 15))
+DEFAULT_RSS_LIMIT_MB = int(os.environ.get('VINTERVU_EXTRACT_RSS_MB', 512))
+DEFAULT_MAX_JOBS_PER_WORKER = 50
+
+_POLL_INTERVAL = 0.05
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+class ExtractionError(Exception):
+    """Extraction failed, or its worker had to be killed"""
+
+
+class ExtractionTimeout(ExtractionError):
+    """Extraction ran past its wall-clock timeout"""
+
+
+def _peak_rss_bytes():
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _worker_loop(conn):
+    """Entry point of a worker process: run jobs until told to stop"""
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        func, args = job
+        try:
+            conn.send(('ok', func(*args), _peak_rss_bytes()))
+        except MemoryError:
+            conn.send(('error', "ran out of memory", _peak_rss_bytes()))
+            return
+        except Exception as e:
+            conn.send(('error', f"{type(e).__name__}: {e}", _peak_rss_bytes()))
+
+
+def _current_rss_bytes(pid):
+    """Resident set size of ``pid`` from /proc, or None where unavailable"""
+    try:
+        with open(f'/proc/{pid}/statm') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class _Worker:
+    def __init__(self, context):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_loop, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.jobs = 0
+
+    def kill(self):
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(1)
+        self.conn.close()
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+            self.process.join(1)
+        except (OSError, ValueError):
+            pass
+        self.kill()
+
+
+class ExtractionPool:
+    """A fixed number of reusable extraction processes shared by all sessions"""
+
+    def __init__(self, size=2, timeout=DEFAULT_TIMEOUT, rss_limit_mb=DEFAULT_RSS_LIMIT_MB,
+                 max_jobs_per_worker=DEFAULT_MAX_JOBS_PER_WORKER):
+        self.timeout = timeout
+        self.rss_limit = rss_limit_mb * 1024 * 1024
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self._context = multiprocessing.get_context('spawn')
+        # Idle slots; None means "start a process when this slot is next used"
+        self._idle = queue.LifoQueue()
+        for _ in range(size):
+            self._idle.put(None)
+        self._workers = set()
+        self._lock = threading.Lock()
+        self._closed = False
+        self.stats = {'jobs': 0, 'errors': 0, 'timeouts': 0, 'killed': 0, 'recycled': 0}
+        atexit.register(self.close)
+
+    def run(self, func, *args, timeout=None):
+        """Run ``func(*args)`` in a worker; ``func`` must be importable at module level"""
+        timeout = self.timeout if timeout is None else timeout
+        if self._closed:
+            raise ExtractionError("extraction pool is shut down")
+        try:
+            worker = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise ExtractionTimeout(f"no extraction worker became free within {timeout:.0f}s")
+
+        try:
+            if worker is None:
+                worker = _Worker(self._context)
+                with self._lock:
+                    self._workers.add(worker)
+            status, value, peak_rss = self._wait(worker, func, args, timeout)
+        except (OSError, EOFError) as e:
+            self._discard(worker)
+            self._idle.put(None)
+            raise ExtractionError(f"extraction worker failed: {e}") from e
+        except BaseException:
+            self._discard(worker)
+            self._idle.put(None)
+            raise
+
+        worker.jobs += 1
+        if worker.jobs >= self.max_jobs_per_worker or peak_rss > self.rss_limit or not worker.process.is_alive():
+            self._count('recycled')
+            self._discard(worker)
+            worker = None
+        self._idle.put(worker)
+
+        self._count('jobs')
+        if status != 'ok':
+            self._count('errors')
+            raise ExtractionError(value)
+        return value
+
+    def _wait(self, worker, func, args, timeout):
+        deadline = time.monotonic() + timeout
+        worker.conn.send((func, args))
+        while not worker.conn.poll(_POLL_INTERVAL):
+            if not worker.process.is_alive():
+                self._count('killed')
+                raise ExtractionError(f"extraction worker exited unexpectedly (code {worker.process.exitcode})")
+            if time.monotonic() > deadline:
+                self._count('timeouts')
+                raise ExtractionTimeout(f"extraction took longer than {timeout:.0f}s and was stopped")
+            rss = _current_rss_bytes(worker.process.pid)
+            if rss is not None and rss > self.rss_limit:
+                self._count('killed')
+                raise ExtractionError(
+                    f"extraction used more than {self.rss_limit // (1024 * 1024)}MB of memory and was stopped"
+                )
+        return worker.conn.recv()
+
+    def _discard(self, worker):
+        if worker is None:
+            return
+        with self._lock:
+            self._workers.discard(worker)
+        worker.kill()
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._closed = True
+        with self._lock:
+            workers, self._workers = list(self._workers), set()
+        for worker in workers:
+            worker.stop()